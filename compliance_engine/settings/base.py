@@ -2,6 +2,7 @@
 Django settings for compliance_engine project.
 """
 import os
+import tempfile
 
 from dotenv import load_dotenv
 
@@ -42,6 +43,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # MIDDLEWARE CONFIGURATION
 # ------------------------------------------------------------------------------
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -104,6 +106,22 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# CACHE CONFIGURATION
+# ------------------------------------------------------------------------------
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared cache
+# such as django.core.cache.backends.redis.RedisCache in production.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# Cache alias and lifetime (in seconds) of cached API read responses.
+RESPONSE_CACHE_ALIAS = 'default'
+
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', 300))
+
 # DJANGO REST FRAMEWORK CONFIGURATION
 # ------------------------------------------------------------------------------
 REST_FRAMEWORK = {
@@ -115,6 +133,125 @@ REST_FRAMEWORK = {
     ),
 }
 
+# CONTENT STORAGE CONFIGURATION
+# ------------------------------------------------------------------------------
+# Store uploads once under their SHA-256 digest and share them between contents.
+CONTENT_ADDRESSED_STORAGE = os.getenv('CONTENT_ADDRESSED_STORAGE', 'False') == 'True'
+
+if CONTENT_ADDRESSED_STORAGE:
+    FILE_UPLOAD_HANDLERS = [
+        'core.uploadhandler.HashingMemoryFileUploadHandler',
+        'core.uploadhandler.HashingTemporaryFileUploadHandler',
+    ]
+
+# Directory holding the partial files of resumable chunked uploads.
+CHUNKED_UPLOAD_DIR = os.getenv(
+    'CHUNKED_UPLOAD_DIR', os.path.join(tempfile.gettempdir(), 'compliance_engine_uploads')
+)
+
+# Size of the blocks read from the request body when appending an upload chunk.
+CHUNKED_UPLOAD_READ_SIZE = int(os.getenv('CHUNKED_UPLOAD_READ_SIZE', 64 * 1024))
+
+# Size of the blocks streamed by the async download view.
+DOWNLOAD_CHUNK_SIZE = int(os.getenv('DOWNLOAD_CHUNK_SIZE', 64 * 1024))
+
+# Largest revision (in bytes) that is compacted into a delta against its successor.
+VERSION_DELTA_MAX_SIZE = int(os.getenv('VERSION_DELTA_MAX_SIZE', 16 * 1024 * 1024))
+
+# A revision is only stored as a delta when the delta is at most this fraction
+# of the full file.
+VERSION_DELTA_MAX_RATIO = float(os.getenv('VERSION_DELTA_MAX_RATIO', 0.5))
+
+# REVIEW CONFIGURATION
+# ------------------------------------------------------------------------------
+# Number of ReviewItems inserted per statement when a Content is fanned out.
+REVIEW_FANOUT_BATCH_SIZE = int(os.getenv('REVIEW_FANOUT_BATCH_SIZE', 500))
+
+# Active guideline count above which the fan-out is queued as a background
+# task instead of running inside the upload request. 0, the default, never
+# queues it: uploads then return with their review items in place and need no
+# run_worker process.
+REVIEW_FANOUT_DEFER_THRESHOLD = int(os.getenv('REVIEW_FANOUT_DEFER_THRESHOLD', 0))
+
+# Number of existing contents given a review item per step when a guideline is
+# added or reactivated, and seconds waited between two steps.
+GUIDELINE_BACKFILL_CHUNK_SIZE = int(os.getenv('GUIDELINE_BACKFILL_CHUNK_SIZE', 5000))
+GUIDELINE_BACKFILL_DELAY = float(os.getenv('GUIDELINE_BACKFILL_DELAY', 1))
+
+# Maximum number of review items accepted by one bulk review submission.
+BULK_REVIEW_MAX_ITEMS = int(os.getenv('BULK_REVIEW_MAX_ITEMS', 1000))
+
+# Seconds a reviewer holds review items claimed from the review queue.
+REVIEW_CLAIM_TIMEOUT = int(os.getenv('REVIEW_CLAIM_TIMEOUT', 900))
+
+# Maximum number of review items a reviewer can hold from the review queue.
+REVIEW_CLAIM_MAX_ITEMS = int(os.getenv('REVIEW_CLAIM_MAX_ITEMS', 50))
+
+# Seconds a process may serve guideline data cached in memory before reloading it.
+GUIDELINE_CACHE_TIMEOUT = int(os.getenv('GUIDELINE_CACHE_TIMEOUT', 60))
+
+# Number of contents fetched per database round-trip by the streaming export.
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', 2000))
+
+# Serve the statistics endpoint from the summary table rebuilt by the
+# refresh_review_stats command instead of aggregating the live tables.
+REVIEW_STATS_FROM_SUMMARY = os.getenv('REVIEW_STATS_FROM_SUMMARY', 'False') == 'True'
+
+# TEXT EXTRACTION CONFIGURATION
+# ------------------------------------------------------------------------------
+# Bytes of a file read, or characters of text parsed, per extraction step.
+TEXT_EXTRACTION_CHUNK_SIZE = int(os.getenv('TEXT_EXTRACTION_CHUNK_SIZE', 1024 * 1024))
+
+# Extracted text is truncated to this many characters.
+TEXT_EXTRACTION_MAX_CHARS = int(os.getenv('TEXT_EXTRACTION_MAX_CHARS', 10_000_000))
+
+# SEARCH CONFIGURATION
+# ------------------------------------------------------------------------------
+# PostgreSQL text search configuration used to build and query search vectors.
+SEARCH_CONFIG = os.getenv('SEARCH_CONFIG', 'english')
+
+# Upper bound of the `limit` query parameter of the search endpoint.
+SEARCH_MAX_RESULTS = int(os.getenv('SEARCH_MAX_RESULTS', 100))
+
+# TASK QUEUE CONFIGURATION
+# ------------------------------------------------------------------------------
+# Run queued tasks right after the enqueuing transaction commits instead of on
+# a run_worker process.
+TASK_QUEUE_EAGER = os.getenv('TASK_QUEUE_EAGER', 'False') == 'True'
+
+# Seconds after which a running task whose worker went away is claimed again.
+TASK_LEASE_TIMEOUT = int(os.getenv('TASK_LEASE_TIMEOUT', 600))
+
+# Base delay in seconds before a failed task is retried, doubled per attempt.
+TASK_RETRY_DELAY = int(os.getenv('TASK_RETRY_DELAY', 10))
+
+# Days done and failed tasks are kept before purge_tasks deletes them.
+TASK_RETENTION_DAYS = int(os.getenv('TASK_RETENTION_DAYS', 7))
+
+# METRICS CONFIGURATION
+# ------------------------------------------------------------------------------
+# Record per-view latency, database queries and body sizes of every request.
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+
+# Bearer token granting access to the metrics endpoint. Empty disables it.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# Client addresses allowed to read the metrics endpoint without the token.
+# Empty by default. The address is REMOTE_ADDR, so behind a reverse proxy on
+# the same host every request comes from the proxy's address: do not list it
+# there, use METRICS_TOKEN instead.
+METRICS_ALLOWED_IPS = [
+    address for address in os.getenv('METRICS_ALLOWED_IPS', '').split(',') if address
+]
+
+# Directory shared by the worker processes of a server (e.g. gunicorn) to
+# aggregate their metrics. Empty serves the metrics of the answering process
+# only. Clear it when the server starts.
+METRICS_MULTIPROCESS_DIR = os.getenv('METRICS_MULTIPROCESS_DIR', '')
+
+# Seconds between two writes of a worker's metrics to the multiprocess directory.
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', 5))
+
 # GENERAL CONFIGURATION
 # ------------------------------------------------------------------------------
 TIME_ZONE = 'UTC'
@@ -1,27 +1,51 @@
 from django.contrib import admin
 
-from core.models import Content, Guideline, ReviewItem
+from core.cache import invalidate_content_responses
+from core.models import Content, Guideline, ReviewItem, StoredBlob, Task
+from core.search import full_text_search_enabled, search_query
+
+
+class FullTextSearchMixin:
+    """
+    Answers the admin search box from the GIN indexed search vector instead of
+    icontains scans where full-text search is available.
+    """
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and full_text_search_enabled():
+            return queryset.filter(search_vector=search_query(search_term)), False
+        return super().get_search_results(request, queryset, search_term)
 
 
 @admin.register(Guideline)
-class GuidelineAdmin(admin.ModelAdmin):
+class GuidelineAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """
     Admin configuration for the Guideline model.
     """
-    list_display = ('id', 'title', 'description', 'created_at')
+    list_display = (
+        'id', 'title', 'description', 'is_active', 'active_from', 'active_until', 'created_at',
+    )
+    list_filter = ('is_active', 'author_groups')
     search_fields = ('title', 'description')
+    filter_horizontal = ('author_groups',)
     readonly_fields = ('created_at',)
 
 
 @admin.register(Content)
-class ContentAdmin(admin.ModelAdmin):
+class ContentAdmin(FullTextSearchMixin, admin.ModelAdmin):
     """
     Admin configuration for the Content model.
     """
     list_display = ('id', 'title', 'file', 'version', 'created_at', 'author')
     list_filter = ('author',)
     search_fields = ('title', 'file')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = (
+        'created_at',
+        'updated_at',
+        'total_reviews',
+        'passed_reviews',
+        'failed_reviews',
+        'pending_reviews',
+    )
 
 
 @admin.register(ReviewItem)
@@ -33,3 +57,52 @@ class ReviewItemAdmin(admin.ModelAdmin):
     list_filter = ('guideline', 'status', 'reviewer')
     search_fields = ('guideline__title', 'guideline__description', 'content__title')
     readonly_fields = ('reviewed_at',)
+
+    def save_model(self, request, obj, form, change):
+        """
+        Save the ReviewItem and keep the review counters of its content in sync.
+        """
+        if change:
+            obj.revision += 1
+        super().save_model(request, obj, form, change)
+        Content.objects.filter(pk=obj.content_id).refresh_review_counts()
+        invalidate_content_responses(obj.content_id)
+
+    def delete_model(self, request, obj):
+        """
+        Delete the ReviewItem and keep the review counters of its content in sync.
+        """
+        super().delete_model(request, obj)
+        Content.objects.filter(pk=obj.content_id).refresh_review_counts()
+        invalidate_content_responses(obj.content_id)
+
+    def delete_queryset(self, request, queryset):
+        """
+        Delete the selected ReviewItems and keep the review counters in sync.
+        """
+        content_ids = list(queryset.values_list('content_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        Content.objects.filter(pk__in=content_ids).refresh_review_counts()
+        invalidate_content_responses(*content_ids)
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the StoredBlob model.
+    """
+    list_display = ('id', 'name', 'size', 'ref_count', 'created_at')
+    search_fields = ('name', 'digest')
+    readonly_fields = ('name', 'digest', 'size', 'ref_count', 'created_at')
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the Task model.
+    """
+    list_display = (
+        'id', 'name', 'status', 'attempts', 'run_after', 'duration_ms', 'finished_at'
+    )
+    list_filter = ('name', 'status')
+    readonly_fields = ('created_at', 'started_at', 'finished_at', 'duration_ms')
@@ -0,0 +1,111 @@
+import os
+
+from django.contrib.auth.models import User
+from django.db.models import Exists, OuterRef, Q
+
+from core.cache import GuidelineCache
+from core.constants import ALLOWED_EXTENSIONS
+from core.models import Guideline
+
+
+def file_extension(name):
+    """
+    Returns the lowercased extension of a file name, dot included.
+    """
+    return os.path.splitext(name)[1].lower()
+
+
+class ApplicabilityIndex:
+    """
+    The active guidelines indexed by the file types they apply to, with the
+    author groups and date ranges of the scoped ones, so the guidelines
+    applicable to a content are resolved without querying them.
+    """
+    def __init__(self, guidelines):
+        self.by_extension = {extension: [] for extension in ALLOWED_EXTENSIONS}
+        self.author_groups = {}
+        self.date_ranges = {}
+        self.guideline_count = 0
+
+        for guideline in guidelines:
+            self.guideline_count += 1
+            for extension in guideline.file_types or ALLOWED_EXTENSIONS:
+                self.by_extension[extension].append(guideline.pk)
+            group_ids = frozenset(group.pk for group in guideline.author_groups.all())
+            if group_ids:
+                self.author_groups[guideline.pk] = group_ids
+            if guideline.active_from or guideline.active_until:
+                self.date_ranges[guideline.pk] = (guideline.active_from, guideline.active_until)
+
+    def guideline_ids(self, extension, created_at, group_ids=()):
+        """
+        Returns the ids of the guidelines applicable to a content, in order.
+        Args:
+            extension: The extension of the content's file, dot included.
+            created_at: The time the content was uploaded at.
+            group_ids: The ids of the groups of the content's author.
+        """
+        candidates = self.by_extension.get(extension, [])
+        if not self.author_groups and not self.date_ranges:
+            return list(candidates)
+        return [
+            guideline_id for guideline_id in candidates
+            if self._applies(guideline_id, created_at, group_ids)
+        ]
+
+    def for_content(self, content):
+        """
+        Returns the ids of the guidelines applicable to a saved Content. The
+        author's groups are only queried when some guideline is scoped to them.
+        """
+        group_ids = author_group_ids(content.author_id) if self.author_groups else ()
+        return self.guideline_ids(file_extension(content.file.name), content.created_at, group_ids)
+
+    def _applies(self, guideline_id, created_at, group_ids):
+        required_groups = self.author_groups.get(guideline_id)
+        if required_groups and required_groups.isdisjoint(group_ids):
+            return False
+        active_from, active_until = self.date_ranges.get(guideline_id, (None, None))
+        if active_from and created_at < active_from:
+            return False
+        return not (active_until and created_at >= active_until)
+
+
+applicability_index = GuidelineCache(
+    lambda: ApplicabilityIndex(
+        Guideline.objects.filter(is_active=True).order_by('pk').prefetch_related('author_groups')
+    )
+)
+
+
+def author_group_ids(author_id):
+    """
+    Returns the ids of the groups a user belongs to.
+    """
+    return set(
+        User.groups.through.objects.filter(user_id=author_id).values_list('group_id', flat=True)
+    )
+
+
+def filter_applicable_contents(contents, guideline):
+    """
+    Narrows a Content queryset to the contents a guideline applies to, for
+    set-based operations such as the guideline back-propagation.
+    """
+    if guideline.file_types:
+        extensions = Q()
+        for extension in guideline.file_types:
+            extensions |= Q(file__iendswith=extension)
+        contents = contents.filter(extensions)
+    group_ids = list(guideline.author_groups.values_list('pk', flat=True))
+    if group_ids:
+        contents = contents.filter(
+            Exists(User.groups.through.objects.filter(
+                user_id=OuterRef('author_id'), group_id__in=group_ids
+            ))
+        )
+    if guideline.active_from:
+        contents = contents.filter(created_at__gte=guideline.active_from)
+    if guideline.active_until:
+        contents = contents.filter(created_at__lt=guideline.active_until)
+    return contents
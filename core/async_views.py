@@ -0,0 +1,195 @@
+import os
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.http import (HttpResponse, HttpResponseNotModified, JsonResponse,
+                         StreamingHttpResponse)
+from django.utils.http import parse_etags
+from django.views import View
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from core.cache import guideline_map
+from core.models import Content, ContentVersion, Guideline, ReviewItem
+from core.pagination import (CreatedAtCursorPagination, decode_cursor,
+                             encode_cursor, older_than)
+from core.serializers import ContentSerializer, ReviewItemSerializer
+from core.versioning import read_version
+
+NOT_FOUND = {'detail': 'Not found.'}
+
+
+async def authenticate(request):
+    """
+    Returns the user of a request authenticated with a JWT bearer token or a
+    session, or None. Tokens are validated in the event loop; only the user
+    lookup touches the database.
+    """
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    if header is not None:
+        raw_token = authentication.get_raw_token(header)
+        if raw_token is None:
+            return None
+        try:
+            token = authentication.get_validated_token(raw_token)
+        except (InvalidToken, TokenError):
+            return None
+        return await User.objects.filter(
+            is_active=True,
+            **{jwt_settings.USER_ID_FIELD: token.get(jwt_settings.USER_ID_CLAIM)},
+        ).afirst()
+
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+class AsyncAPIView(View):
+    """
+    Base class of the native async views. Authenticates requests like the DRF
+    views do, without hopping to a worker thread for the whole request.
+    """
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await authenticate(request)
+        if request.user is None:
+            response = JsonResponse(
+                {'detail': 'Authentication credentials were not provided.'}, status=401
+            )
+            response['WWW-Authenticate'] = 'Bearer realm="api"'
+            return response
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncContentListView(AsyncAPIView):
+    """
+    Async variant of ContentListView, paginated over (created_at, id) with an
+    opaque cursor, newest first.
+    """
+    async def get(self, request):
+        pagination = CreatedAtCursorPagination
+        try:
+            page_size = int(request.GET.get(pagination.page_size_query_param, pagination.page_size))
+        except ValueError:
+            page_size = pagination.page_size
+        page_size = min(max(page_size, 1), pagination.max_page_size)
+
+        contents = Content.objects.order_by('-created_at', '-id')
+        cursor = request.GET.get('cursor')
+        if cursor:
+            decoded = decode_cursor(cursor)
+            # The async list only pages forward.
+            if decoded is None or decoded[2]:
+                return JsonResponse({'detail': 'Invalid cursor'}, status=404)
+            contents = contents.filter(older_than(decoded[:2]))
+
+        page = [content async for content in contents[:page_size + 1]]
+        next_url = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            params = request.GET.copy()
+            params['cursor'] = encode_cursor(page[-1])
+            next_url = f'{request.build_absolute_uri(request.path)}?{params.urlencode()}'
+
+        serializer = ContentSerializer(page, many=True, context={'request': request})
+        return JsonResponse({'next': next_url, 'results': serializer.data})
+
+
+class AsyncContentDetailView(AsyncAPIView):
+    """
+    Async variant of the read side of ContentDetailView.
+    """
+    async def get(self, request, pk):
+        content = await Content.objects.filter(pk=pk).afirst()
+        if content is None:
+            return JsonResponse(NOT_FOUND, status=404)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            etags = parse_etags(if_none_match)
+            if '*' in etags or content.etag in etags:
+                response = HttpResponseNotModified()
+                response['ETag'] = content.etag
+                return response
+
+        response = JsonResponse(ContentSerializer(content, context={'request': request}).data)
+        response['ETag'] = content.etag
+        return response
+
+
+class AsyncContentReviewStatusView(AsyncAPIView):
+    """
+    Async variant of ContentReviewStatusView.
+    """
+    async def get(self, request, content_id):
+        if not await Content.objects.filter(pk=content_id).aexists():
+            return HttpResponse(status=404)
+
+        reviews = ReviewItem.objects.filter(content_id=content_id).select_related(
+            'reviewer'
+        ).order_by('pk')
+        reviews = [review async for review in reviews]
+        cached_guidelines = await guideline_map.aget()
+        # Guidelines created by another process since the map was built would
+        # otherwise be loaded lazily, which the event loop does not allow.
+        missing_ids = {review.guideline_id for review in reviews} - cached_guidelines.keys()
+        if missing_ids:
+            guidelines = Guideline.objects.filter(pk__in=missing_ids).prefetch_related(
+                'author_groups'
+            )
+            guidelines = {guideline.pk: guideline async for guideline in guidelines}
+            for review in reviews:
+                if review.guideline_id in guidelines:
+                    review.guideline = guidelines[review.guideline_id]
+
+        review_items = ReviewItemSerializer(
+            reviews, many=True, context={'guideline_map': cached_guidelines}
+        ).data
+        return JsonResponse(review_items, safe=False)
+
+
+class AsyncContentVersionDownloadView(AsyncAPIView):
+    """
+    Async variant of ContentVersionDownloadView. Revisions stored in full are
+    streamed in chunks; revisions stored as deltas are rebuilt in a thread.
+    """
+    async def get(self, request, content_id, version):
+        content_version = await (
+            ContentVersion.objects.select_related('content')
+            .filter(content_id=content_id, version=version)
+            .afirst()
+        )
+        if content_version is None:
+            return JsonResponse(
+                {'error': 'No Content version matches the given query.'}, status=404
+            )
+
+        if content_version.file:
+            response = StreamingHttpResponse(
+                _iter_file(content_version.file), content_type='application/octet-stream'
+            )
+            if content_version.size is not None:
+                response['Content-Length'] = content_version.size
+        else:
+            data = await sync_to_async(read_version)(content_version)
+            response = HttpResponse(data, content_type='application/octet-stream')
+
+        _, extension = os.path.splitext(content_version.content.file.name)
+        filename = f'{content_version.content.title}-v{version}{extension}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+async def _iter_file(field_file):
+    """
+    Yields a stored file in chunks. Blocking reads run in worker threads that
+    are not shared with the database work of other requests.
+    """
+    read_async = sync_to_async(thread_sensitive=False)
+    stored_file = await read_async(field_file.storage.open)(field_file.name, 'rb')
+    try:
+        while chunk := await read_async(stored_file.read)(settings.DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await read_async(stored_file.close)()
@@ -0,0 +1,10 @@
+"""
+Reproducible benchmarks of the core API: data generators, request scenarios
+and a runner reporting latency, throughput and queries per request. Driven by
+the run_benchmarks management command.
+"""
+from core.benchmarks.data import Dataset, delete_benchmark_data, generate_dataset
+from core.benchmarks.runner import (TRANSPORTS, compare_to_baseline,
+                                    load_baseline, percentile, run_scenario,
+                                    save_baseline)
+from core.benchmarks.scenarios import SCENARIOS
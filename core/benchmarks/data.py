@@ -0,0 +1,147 @@
+import random
+from itertools import islice
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.cache import invalidate_guideline_caches
+from core.models import Content, Guideline, ReviewItem
+from core.search import (update_content_search_vectors,
+                         update_guideline_search_vectors)
+from core.storage import ContentAddressedStorage
+
+# Prefix of the usernames and guideline titles owned by the benchmarks.
+BENCHMARK_PREFIX = 'benchmark-'
+
+_WORDS = (
+    'policy', 'privacy', 'consent', 'retention', 'disclosure', 'audit', 'data',
+    'customer', 'record', 'report', 'risk', 'control', 'access', 'review',
+)
+
+
+class Dataset:
+    """
+    The users, guidelines, contents and review items generated for a run.
+    """
+    def __init__(self, users, guideline_ids, content_ids, review_items):
+        self.users = users
+        self.guideline_ids = guideline_ids
+        self.content_ids = content_ids
+        # (content_id, review_item_id) pairs.
+        self.review_items = review_items
+        self.tokens = {user.pk: str(AccessToken.for_user(user)) for user in users}
+
+    def authorization(self, user):
+        """
+        Returns the Authorization header value of a generated user.
+        """
+        return f'Bearer {self.tokens[user.pk]}'
+
+
+def generate_dataset(users=10, guidelines=50, contents=1000, seed=0, batch_size=1000):
+    """
+    Creates a reproducible dataset: every content gets a review item per
+    guideline, a third of them already decided. Rows are written with bulk
+    inserts and left-over benchmark rows are deleted first.
+    Args:
+        users: The number of users, authoring the contents in turn.
+        guidelines: The number of guidelines.
+        contents: The number of contents.
+        seed: The seed of the generated text and review statuses.
+        batch_size: The number of rows per INSERT statement.
+    Returns:
+        The generated Dataset.
+    """
+    rng = random.Random(seed)
+    delete_benchmark_data()
+
+    with transaction.atomic():
+        User.objects.bulk_create(
+            User(username=f'{BENCHMARK_PREFIX}user-{index}') for index in range(users)
+        )
+        created_users = list(
+            User.objects.filter(username__startswith=BENCHMARK_PREFIX).order_by('pk')
+        )
+        Guideline.objects.bulk_create(
+            (
+                Guideline(
+                    title=f'{BENCHMARK_PREFIX}guideline-{index}',
+                    description=_sentence(rng, 30),
+                )
+                for index in range(guidelines)
+            ),
+            batch_size=batch_size,
+        )
+        guideline_ids = list(
+            Guideline.objects.filter(title__startswith=BENCHMARK_PREFIX)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+        )
+
+        new_contents = (
+            Content(
+                title=f'Benchmark content {index}',
+                file=f'benchmark/content-{index}.txt',
+                author=created_users[index % len(created_users)],
+            )
+            for index in range(contents)
+        )
+        while batch := list(islice(new_contents, batch_size)):
+            Content.objects.bulk_create(batch)
+        benchmark_contents = Content.objects.filter(author__in=created_users)
+        content_ids = list(benchmark_contents.order_by('pk').values_list('pk', flat=True))
+
+        statuses = (
+            [ReviewItem.StatusChoices.PENDING] * 4
+            + [ReviewItem.StatusChoices.PASSED, ReviewItem.StatusChoices.FAILED]
+        )
+        review_items = (
+            ReviewItem(
+                content_id=content_id, guideline_id=guideline_id, status=rng.choice(statuses)
+            )
+            for content_id in content_ids
+            for guideline_id in guideline_ids
+        )
+        while batch := list(islice(review_items, batch_size)):
+            ReviewItem.objects.bulk_create(batch)
+        benchmark_contents.refresh_review_counts()
+
+    # Bulk inserts bypass the signals keeping the caches and search index current.
+    invalidate_guideline_caches()
+    update_guideline_search_vectors(Guideline.objects.filter(pk__in=guideline_ids))
+    update_content_search_vectors(benchmark_contents)
+
+    return Dataset(
+        created_users,
+        guideline_ids,
+        content_ids,
+        list(
+            ReviewItem.objects.filter(content__author__in=created_users)
+            .order_by('pk')
+            .values_list('content_id', 'pk')
+        ),
+    )
+
+
+def delete_benchmark_data():
+    """
+    Deletes every row generated by the benchmarks, along with the files
+    uploaded by them.
+    """
+    users = User.objects.filter(username__startswith=BENCHMARK_PREFIX)
+    storage = Content._meta.get_field('file').storage
+    stored_files = set(
+        Content.objects.filter(author__in=users).values_list('file', flat=True)
+    )
+    users.delete()
+    Guideline.objects.filter(title__startswith=BENCHMARK_PREFIX).delete()
+    invalidate_guideline_caches()
+    # Content-addressed files were released by the deletes above.
+    if not isinstance(storage, ContentAddressedStorage):
+        for name in stored_files:
+            storage.delete(name)
+
+
+def _sentence(rng, length):
+    return ' '.join(rng.choice(_WORDS) for _ in range(length)).capitalize() + '.'
@@ -0,0 +1,224 @@
+import json
+import random
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from django.test import Client
+
+# Latency metrics compared against a baseline.
+LATENCY_METRICS = ('p50_ms', 'p95_ms')
+# Mean queries per request may grow by this much before it counts as a
+# regression; one extra query on every request always does.
+QUERY_TOLERANCE = 0.5
+
+
+class QueryCounter:
+    """
+    Database execute wrapper counting the queries run by the current thread.
+    """
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ClientTransport:
+    """
+    Sends requests through Django's test client, in the calling thread.
+    """
+    def __init__(self):
+        self.client = Client()
+
+    def send(self, method, path, headers, body, content_type):
+        """
+        Sends a request and returns its status code and query count.
+        """
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.client.generic(
+                method, path, body, content_type=content_type, headers=headers
+            )
+            if response.streaming:
+                b''.join(response.streaming_content)
+        return response.status_code, counter.count
+
+    def close(self):
+        pass
+
+
+class WSGIServerTransport:
+    """
+    Serves the project's WSGI application from a wsgiref server running in a
+    background thread and sends requests to it over HTTP.
+    """
+    def __init__(self):
+        self.application = get_wsgi_application()
+        self.server = make_server(
+            '127.0.0.1', 0, self._serve_request, handler_class=_QuietHandler
+        )
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        self.queries = 0
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def send(self, method, path, headers, body, content_type):
+        """
+        Sends a request and returns its status code and query count.
+        """
+        headers = dict(headers)
+        if content_type:
+            headers['Content-Type'] = content_type
+        request = urllib.request.Request(
+            self.url + path, data=body or None, headers=headers, method=method
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                status_code = response.status
+        except urllib.error.HTTPError as error:
+            error.read()
+            status_code = error.code
+        return status_code, self.queries
+
+    def close(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+
+    def _serve(self):
+        try:
+            self.server.serve_forever()
+        finally:
+            connections.close_all()
+
+    def _serve_request(self, environ, start_response):
+        # Requests are served one at a time, so the count of the last request
+        # is read by send() once its response has arrived.
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            result = self.application(environ, start_response)
+            try:
+                body = b''.join(result)
+            finally:
+                result.close()
+        self.queries = counter.count
+        return [body]
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+TRANSPORTS = {
+    'client': ClientTransport,
+    'wsgi': WSGIServerTransport,
+}
+
+
+def run_scenario(transport, scenario, dataset, requests, warmup=0, seed=0):
+    """
+    Sends the requests of a scenario one after the other and measures them.
+    Args:
+        transport: The transport sending the requests.
+        scenario: The scenario building each request.
+        dataset: The Dataset the requests are built from.
+        requests: The number of measured requests.
+        warmup: The number of requests sent before measuring.
+        seed: The seed of the scenario's random choices.
+    Returns:
+        A dict with the latency percentiles in milliseconds, the throughput in
+        requests per second, the mean number of queries per request and the
+        number of failed requests.
+    """
+    rng = random.Random(seed)
+    timings = []
+    query_counts = []
+    errors = 0
+    for index in range(warmup + requests):
+        method, path, user, body, content_type = scenario(dataset, rng, index)
+        headers = {'Authorization': dataset.authorization(user)}
+        started = time.perf_counter()
+        status_code, query_count = transport.send(method, path, headers, body, content_type)
+        elapsed = (time.perf_counter() - started) * 1000
+        if index < warmup:
+            continue
+        timings.append(elapsed)
+        query_counts.append(query_count)
+        errors += status_code >= 400
+
+    return {
+        'requests': requests,
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p90_ms': round(percentile(timings, 90), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'throughput': round(requests / (sum(timings) / 1000), 1),
+        'queries_per_request': round(statistics.mean(query_counts), 2),
+        'errors': errors,
+    }
+
+
+def percentile(values, percent):
+    """
+    Returns the nearest-rank percentile of the given values.
+    """
+    ordered = sorted(values)
+    index = max(0, round(percent / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def save_baseline(report, path):
+    """
+    Writes a benchmark report to a JSON baseline file.
+    """
+    with open(path, 'w') as baseline_file:
+        json.dump(report, baseline_file, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """
+    Reads a baseline file written by save_baseline().
+    """
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    """
+    Lists the metrics of a report that regressed against a baseline.
+    Args:
+        report: The report of the current run.
+        baseline: The report of the baseline run.
+        tolerance: The fraction by which latency may grow, e.g. 0.25.
+    Returns:
+        A list of messages, one per regressed metric.
+    """
+    regressions = []
+    for name, metrics in report['scenarios'].items():
+        expected = baseline['scenarios'].get(name)
+        if expected is None:
+            continue
+        if metrics['queries_per_request'] > expected['queries_per_request'] + QUERY_TOLERANCE:
+            regressions.append(
+                f"{name}: {metrics['queries_per_request']} queries per request, "
+                f"baseline {expected['queries_per_request']}"
+            )
+        for metric in LATENCY_METRICS:
+            if metrics[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f'{name}: {metric} {metrics[metric]}, baseline {expected[metric]}'
+                )
+        if metrics['errors'] > expected['errors']:
+            regressions.append(
+                f"{name}: {metrics['errors']} errors, baseline {expected['errors']}"
+            )
+    return regressions
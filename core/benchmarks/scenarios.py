@@ -0,0 +1,71 @@
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.urls import reverse
+
+from core.models import ReviewItem
+
+# Each scenario builds the request it sends from the dataset, a seeded random
+# generator and the index of the request in the run. A request is a
+# (method, path, user, body, content type) tuple.
+
+
+def upload(dataset, rng, index):
+    """
+    Uploads a new content as a random user.
+    """
+    user = rng.choice(dataset.users)
+    body = encode_multipart(
+        BOUNDARY,
+        {
+            'title': f'Benchmark upload {index}',
+            'file': SimpleUploadedFile(f'benchmark-upload-{index}.txt', _text(rng)),
+        },
+    )
+    return 'POST', reverse('content-upload'), user, body, MULTIPART_CONTENT
+
+
+def list_contents(dataset, rng, index):
+    """
+    Fetches the first page of the content list.
+    """
+    return 'GET', reverse('content-list'), rng.choice(dataset.users), b'', None
+
+
+def review_status(dataset, rng, index):
+    """
+    Fetches the review items of a random content.
+    """
+    content_id = rng.choice(dataset.content_ids)
+    path = reverse('content-review-status', kwargs={'content_id': content_id})
+    return 'GET', path, rng.choice(dataset.users), b'', None
+
+
+def review_update(dataset, rng, index):
+    """
+    Decides a random review item as a random user.
+    """
+    content_id, review_item_id = rng.choice(dataset.review_items)
+    path = reverse(
+        'content-review-update',
+        kwargs={'content_id': content_id, 'review_item_id': review_item_id},
+    )
+    status = rng.choice([ReviewItem.StatusChoices.PASSED, ReviewItem.StatusChoices.FAILED])
+    body = json.dumps({'status': status}).encode()
+    return 'PUT', path, rng.choice(dataset.users), body, 'application/json'
+
+
+SCENARIOS = {
+    'upload': upload,
+    'list': list_contents,
+    'review-status': review_status,
+    'review-update': review_update,
+}
+
+
+def _text(rng):
+    return ''.join(
+        f'Section {number}: {rng.randrange(10 ** 6)} records retained.\n'
+        for number in range(50)
+    ).encode()
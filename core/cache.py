@@ -0,0 +1,178 @@
+import hashlib
+import json
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from core.models import Guideline
+
+_guideline_caches = []
+
+
+class GuidelineCache:
+    """
+    Process-local cache of a value derived from the full guideline set.
+    Entries are dropped whenever a Guideline is written in this process and
+    expire after GUIDELINE_CACHE_TIMEOUT seconds, which bounds how long other
+    processes can serve a stale value.
+    """
+    def __init__(self, builder):
+        self.builder = builder
+        self.value = None
+        self.expires_at = 0
+        _guideline_caches.append(self)
+
+    def get(self):
+        """
+        Returns the cached value, rebuilding it when missing or expired.
+        """
+        if self.value is None or time.monotonic() >= self.expires_at:
+            self.value = self.builder()
+            self.expires_at = time.monotonic() + settings.GUIDELINE_CACHE_TIMEOUT
+        return self.value
+
+    async def aget(self):
+        """
+        Async variant of get(), rebuilding the value in a worker thread.
+        """
+        if self.value is None or time.monotonic() >= self.expires_at:
+            self.value = await sync_to_async(self.builder)()
+            self.expires_at = time.monotonic() + settings.GUIDELINE_CACHE_TIMEOUT
+        return self.value
+
+    def invalidate(self):
+        """
+        Drops the cached value so the next access rebuilds it.
+        """
+        self.value = None
+
+
+def invalidate_guideline_caches():
+    """
+    Drops every process-local cache derived from guidelines.
+    """
+    for cache in _guideline_caches:
+        cache.invalidate()
+
+
+def _build_guideline_map():
+    """
+    Returns the serialized representation of every Guideline keyed by id.
+    """
+    from core.serializers import GuidelineSerializer
+
+    return {
+        guideline.pk: GuidelineSerializer(guideline).data
+        for guideline in Guideline.objects.prefetch_related('author_groups')
+    }
+
+
+guideline_map = GuidelineCache(_build_guideline_map)
+
+
+def _response_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _namespace_key(namespace):
+    return f'response-cache:namespace:{namespace}'
+
+
+def invalidate_responses(*namespaces):
+    """
+    Invalidates every cached response that depends on the given namespaces by
+    moving them to a new version; stale entries simply expire. Inside a
+    transaction the versions move once it commits, so a concurrent read
+    cannot cache the pre-commit data under the new version.
+    """
+    transaction.on_commit(lambda: _bump_namespaces(namespaces))
+
+
+def _bump_namespaces(namespaces):
+    cache = _response_cache()
+    for namespace in namespaces:
+        try:
+            cache.incr(_namespace_key(namespace))
+        except ValueError:
+            cache.set(_namespace_key(namespace), time.time_ns(), None)
+
+
+def invalidate_content_responses(*content_ids):
+    """
+    Invalidates the cached responses of the given contents.
+    """
+    invalidate_responses(*(f'content:{content_id}' for content_id in content_ids))
+
+
+def _namespace_versions(namespaces):
+    """
+    Returns the current version of each namespace, initialising missing ones.
+    """
+    cache = _response_cache()
+    keys = [_namespace_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = time.time_ns()
+            cache.add(key, versions[key], None)
+    return [versions[key] for key in keys]
+
+
+def cache_response(namespaces):
+    """
+    Caches the successful responses of a DRF view method, keyed by the full
+    request path and the versions of the namespaces it depends on, and
+    answers conditional requests with 304 Not Modified. An ETag set by the
+    view is kept; otherwise one is derived from the response body.
+    Args:
+        namespaces: A callable receiving the view and the view method arguments
+            and returning the namespaces the response depends on.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            cache = _response_cache()
+            versions = _namespace_versions(namespaces(view, *args, **kwargs))
+            cache_key = 'response-cache:entry:' + hashlib.sha256(
+                f'{request.get_full_path()}|{versions}'.encode()
+            ).hexdigest()
+
+            entry = cache.get(cache_key)
+            if entry is None:
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                body = JSONRenderer().render(response.data)
+                entry = {
+                    'data': json.loads(body),
+                    'etag': response.headers.get('ETag')
+                    or quote_etag(hashlib.sha256(body).hexdigest()[:32]),
+                }
+                cache.set(cache_key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+
+            # No Last-Modified: the time an entry was cached says nothing about
+            # when the resource changed, so clients validate with the ETag.
+            headers = {'ETag': entry['etag']}
+            if _not_modified(request, entry):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            return Response(entry['data'], headers=headers)
+
+        return wrapper
+
+    return decorator
+
+
+def _not_modified(request, entry):
+    """
+    Checks the If-None-Match header against a cached entry.
+    """
+    etags = parse_etags(request.headers.get('If-None-Match', ''))
+    return '*' in etags or entry['etag'] in etags
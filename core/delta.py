@@ -0,0 +1,115 @@
+import struct
+
+BLOCK_SIZE = 32
+MAX_CANDIDATES = 8
+
+_MAGIC = b'CED1'
+_COPY = b'C'
+_INSERT = b'I'
+_COPY_HEADER = struct.Struct('>QI')
+_INSERT_HEADER = struct.Struct('>I')
+
+
+def make_delta(source, target):
+    """
+    Encodes target as a sequence of copies from source and literal inserts.
+    Args:
+        source: The bytes the delta is applied to.
+        target: The bytes the delta reproduces.
+    Returns:
+        The binary delta.
+    """
+    index = {}
+    for offset in range(0, len(source) - BLOCK_SIZE + 1, BLOCK_SIZE):
+        candidates = index.setdefault(source[offset:offset + BLOCK_SIZE], [])
+        if len(candidates) < MAX_CANDIDATES:
+            candidates.append(offset)
+
+    delta = [_MAGIC]
+    literal = bytearray()
+    position = 0
+    last_block = len(target) - BLOCK_SIZE
+    while position <= last_block:
+        candidates = index.get(target[position:position + BLOCK_SIZE])
+        if candidates is None:
+            literal.append(target[position])
+            position += 1
+            continue
+
+        # Repeated blocks are common in text, so keep the candidate whose
+        # match runs the longest.
+        source_offset, length = max(
+            (
+                (candidate, _match_length(source, candidate, target, position))
+                for candidate in candidates
+            ),
+            key=lambda match: match[1],
+        )
+
+        # Grow the match backwards into the pending literal.
+        while literal and source_offset and source[source_offset - 1] == literal[-1]:
+            literal.pop()
+            source_offset -= 1
+            position -= 1
+            length += 1
+
+        _append_insert(delta, literal)
+        delta.append(_COPY + _COPY_HEADER.pack(source_offset, length))
+        position += length
+
+    literal.extend(target[position:])
+    _append_insert(delta, literal)
+    return b''.join(delta)
+
+
+def apply_delta(source, delta):
+    """
+    Rebuilds the target bytes from source and a delta created by make_delta.
+    """
+    if delta[:len(_MAGIC)] != _MAGIC:
+        raise ValueError('Not a content delta.')
+
+    target = bytearray()
+    position = len(_MAGIC)
+    while position < len(delta):
+        operation = delta[position:position + 1]
+        position += 1
+        if operation == _COPY:
+            offset, length = _COPY_HEADER.unpack_from(delta, position)
+            position += _COPY_HEADER.size
+            target += source[offset:offset + length]
+        elif operation == _INSERT:
+            (length,) = _INSERT_HEADER.unpack_from(delta, position)
+            position += _INSERT_HEADER.size
+            target += delta[position:position + length]
+            position += length
+        else:
+            raise ValueError('Corrupt content delta.')
+    return bytes(target)
+
+
+def _match_length(source, source_offset, target, target_offset):
+    """
+    Returns how many bytes match from the given source and target offsets.
+    """
+    length = BLOCK_SIZE
+    limit = min(len(source) - source_offset, len(target) - target_offset)
+    step = 1024
+    while step:
+        # Compare whole slices while they agree, then narrow down the step.
+        while length + step <= limit and (
+            source[source_offset + length:source_offset + length + step]
+            == target[target_offset + length:target_offset + length + step]
+        ):
+            length += step
+        step //= 4
+    return length
+
+
+def _append_insert(delta, literal):
+    """
+    Flushes the pending literal bytes as an insert operation.
+    """
+    if literal:
+        delta.append(_INSERT + _INSERT_HEADER.pack(len(literal)) + bytes(literal))
+        literal.clear()
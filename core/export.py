@@ -0,0 +1,158 @@
+import csv
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from core.models import Content, ReviewItem
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+CSV_HEADER = (
+    'content_id',
+    'title',
+    'file',
+    'version',
+    'author',
+    'created_at',
+    'updated_at',
+    'review_status',
+    'review_item_id',
+    'guideline_id',
+    'guideline_title',
+    'status',
+    'reviewer',
+    'reviewed_at',
+)
+
+
+class Echo:
+    """
+    File-like object whose write returns the value instead of buffering it, so
+    csv.writer can be driven row by row.
+    """
+    def write(self, value):
+        return value
+
+
+def iter_contents(chunk_size=None):
+    """
+    Yields every Content with its review items and guideline titles, fetched
+    with a server-side cursor chunk by chunk.
+    Args:
+        chunk_size: The number of contents fetched per round-trip.
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    review_items = (
+        ReviewItem.objects.select_related('guideline', 'reviewer')
+        .only(
+            'content_id',
+            'status',
+            'reviewed_at',
+            'guideline__title',
+            'reviewer__username',
+        )
+        .order_by('pk')
+    )
+    contents = (
+        Content.objects.select_related('author')
+        .only(
+            'title',
+            'file',
+            'version',
+            'created_at',
+            'updated_at',
+            'total_reviews',
+            'passed_reviews',
+            'author__username',
+        )
+        .prefetch_related(Prefetch('review_items', queryset=review_items))
+        .order_by('pk')
+    )
+    return contents.iterator(chunk_size=chunk_size)
+
+
+def content_record(content):
+    """
+    Returns the export representation of a Content and its review items.
+    """
+    return {
+        'id': content.pk,
+        'title': content.title,
+        'file': content.file.name,
+        'version': content.version,
+        'author': content.author.username,
+        'created_at': content.created_at,
+        'updated_at': content.updated_at,
+        'review_status': content.review_status,
+        'review_items': [
+            {
+                'id': review_item.pk,
+                'guideline_id': review_item.guideline_id,
+                'guideline_title': review_item.guideline.title,
+                'status': review_item.status,
+                'reviewer': review_item.reviewer.username if review_item.reviewer else None,
+                'reviewed_at': review_item.reviewed_at,
+            }
+            for review_item in content.review_items.all()
+        ],
+    }
+
+
+def iter_ndjson(chunk_size=None):
+    """
+    Yields one JSON document per Content, newline terminated.
+    """
+    for content in iter_contents(chunk_size):
+        yield json.dumps(content_record(content), cls=DjangoJSONEncoder) + '\n'
+
+
+def iter_csv(chunk_size=None):
+    """
+    Yields a CSV header followed by one row per review item. Contents without
+    review items produce a single row with empty review columns.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+
+    for content in iter_contents(chunk_size):
+        record = content_record(content)
+        content_columns = [
+            record['id'],
+            record['title'],
+            record['file'],
+            record['version'],
+            record['author'],
+            record['created_at'].isoformat(),
+            record['updated_at'].isoformat(),
+            record['review_status'],
+        ]
+        if not record['review_items']:
+            yield writer.writerow(content_columns + [''] * 6)
+        for review_item in record['review_items']:
+            yield writer.writerow(
+                content_columns
+                + [
+                    review_item['id'],
+                    review_item['guideline_id'],
+                    review_item['guideline_title'],
+                    review_item['status'],
+                    review_item['reviewer'] or '',
+                    review_item['reviewed_at'].isoformat()
+                    if review_item['reviewed_at']
+                    else '',
+                ]
+            )
+
+
+def iter_export(export_format, chunk_size=None):
+    """
+    Returns the row generator for the given export format.
+    """
+    if export_format == 'csv':
+        return iter_csv(chunk_size)
+    return iter_ndjson(chunk_size)
@@ -0,0 +1,234 @@
+import codecs
+import mmap
+import os
+import re
+import unicodedata
+import zipfile
+from xml.etree import ElementTree
+
+import pypdf
+from django.conf import settings
+
+from core.models import Content, ContentText
+from core.search import update_content_search_vectors
+from core.taskqueue import enqueue
+
+# Yielded by the extractors between two pages of a document.
+PAGE_BREAK = object()
+
+_WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+# Parts of a .docx that hold document text, in reading order.
+_DOCX_PARTS = ('word/document.xml', 'word/footnotes.xml', 'word/endnotes.xml')
+
+_TOKEN_RE = re.compile(r'\s+|\S+')
+
+
+class TextNormalizer:
+    """
+    Normalizes text fed to it in chunks: NFKC normalization, runs of blanks
+    collapsed to a single space and at most one empty line between paragraphs.
+    Whitespace split across chunks is collapsed as if the text was contiguous.
+    """
+    def __init__(self, max_chars=None):
+        self.max_chars = max_chars
+        self.parts = []
+        self.length = 0
+        self.page_offsets = [0]
+        self.truncated = False
+        self._newlines = 0
+        self._space = False
+
+    def feed(self, chunk):
+        """
+        Appends a chunk of raw text.
+        """
+        if self.truncated:
+            return
+        chunk = unicodedata.normalize('NFKC', chunk)
+        for token in _TOKEN_RE.findall(chunk):
+            if token.isspace():
+                newlines = token.count('\n') + token.count('\r') - token.count('\r\n')
+                self._newlines += newlines
+                self._space = self._space or not newlines
+                continue
+            if self.length:
+                if self._newlines:
+                    self._append('\n' * min(self._newlines, 2))
+                elif self._space:
+                    self._append(' ')
+            self._newlines = 0
+            self._space = False
+            self._append(token)
+            if self.truncated:
+                return
+
+    def break_page(self):
+        """
+        Starts a new page, separated from the previous one by an empty line.
+        """
+        if self.truncated:
+            return
+        self._newlines = 2
+        self.page_offsets.append(self.length + 2 if self.length else 0)
+
+    @property
+    def text(self):
+        return ''.join(self.parts)
+
+    def _append(self, value):
+        if self.max_chars is not None and self.length + len(value) > self.max_chars:
+            value = value[:self.max_chars - self.length]
+            self.truncated = True
+        self.parts.append(value)
+        self.length += len(value)
+
+
+def iter_txt_text(file, chunk_size):
+    """
+    Yields the decoded text of a plain text file in chunks, memory-mapping the
+    file where the storage exposes a real file descriptor.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # No descriptor (remote storage) or an empty file.
+        mapped = None
+
+    if mapped is None:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            yield decoder.decode(chunk)
+    else:
+        with mapped:
+            for start in range(0, len(mapped), chunk_size):
+                yield decoder.decode(mapped[start:start + chunk_size])
+    yield decoder.decode(b'', final=True)
+
+
+def iter_docx_text(file, chunk_size):
+    """
+    Yields the text of a .docx document part by part. Each XML part is parsed
+    incrementally and every element is detached from its parent once read, so
+    the parsed tree never holds more than the elements being read and memory
+    stays bounded by the largest paragraph. Explicit page breaks start a new
+    page.
+    """
+    with zipfile.ZipFile(file) as archive:
+        names = set(archive.namelist())
+        for part in _DOCX_PARTS:
+            if part not in names:
+                continue
+            with archive.open(part) as stream:
+                buffer = []
+                # The elements from the root down to the one being parsed.
+                open_elements = []
+                for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+                    if event == 'start':
+                        open_elements.append(element)
+                        continue
+                    open_elements.pop()
+                    if open_elements:
+                        open_elements[-1].remove(element)
+                    tag = element.tag
+                    if tag == f'{_WORD_NAMESPACE}t':
+                        buffer.append(element.text or '')
+                    elif tag == f'{_WORD_NAMESPACE}tab':
+                        buffer.append('\t')
+                    elif tag == f'{_WORD_NAMESPACE}br':
+                        if element.get(f'{_WORD_NAMESPACE}type') == 'page':
+                            yield ''.join(buffer)
+                            buffer = []
+                            yield PAGE_BREAK
+                        else:
+                            buffer.append('\n')
+                    elif tag == f'{_WORD_NAMESPACE}p':
+                        buffer.append('\n')
+                        if sum(map(len, buffer)) >= chunk_size:
+                            yield ''.join(buffer)
+                            buffer = []
+                yield ''.join(buffer)
+
+
+def iter_pdf_text(file, chunk_size):
+    """
+    Yields the text of a PDF document page by page.
+    """
+    reader = pypdf.PdfReader(file)
+    for number, page in enumerate(reader.pages):
+        if number:
+            yield PAGE_BREAK
+        yield page.extract_text() or ''
+
+
+EXTRACTORS = {
+    '.txt': iter_txt_text,
+    '.docx': iter_docx_text,
+    '.pdf': iter_pdf_text,
+}
+
+# Raised by the extractors on corrupt or mislabelled files.
+EXTRACTION_ERRORS = (
+    zipfile.BadZipFile, ElementTree.ParseError, KeyError, ValueError, pypdf.errors.PdfReadError
+)
+
+
+def can_extract_text(content):
+    """
+    Checks whether text can be extracted from the file type of a content.
+    """
+    _, extension = os.path.splitext(content.file.name)
+    return extension.lower() in EXTRACTORS
+
+
+def extract_content_text(content):
+    """
+    Returns the extracted text of the current version of a content, extracting
+    and storing it first when it has not been extracted yet.
+    Args:
+        content: The Content to extract.
+    Returns:
+        The ContentText, or None when the file type holds no extractable text.
+    """
+    if not can_extract_text(content):
+        return None
+    extracted = ContentText.objects.filter(content=content).first()
+    if extracted is not None and extracted.version == content.version:
+        return extracted
+
+    _, extension = os.path.splitext(content.file.name)
+    extractor = EXTRACTORS[extension.lower()]
+    normalizer = TextNormalizer(max_chars=settings.TEXT_EXTRACTION_MAX_CHARS)
+    try:
+        with content.file.open('rb') as content_file:
+            for chunk in extractor(content_file, settings.TEXT_EXTRACTION_CHUNK_SIZE):
+                if chunk is PAGE_BREAK:
+                    normalizer.break_page()
+                else:
+                    normalizer.feed(chunk)
+                if normalizer.truncated:
+                    break
+    except EXTRACTION_ERRORS:
+        # Unreadable files are stored without text so they are not parsed again.
+        normalizer = TextNormalizer()
+    except OSError:
+        return None
+
+    extracted, _ = ContentText.objects.update_or_create(
+        content=content,
+        defaults={
+            'version': content.version,
+            'text': normalizer.text,
+            'page_offsets': normalizer.page_offsets,
+            'truncated': normalizer.truncated,
+        },
+    )
+    update_content_search_vectors(Content.objects.filter(pk=content.pk))
+    return extracted
+
+
+def schedule_extraction(content):
+    """
+    Queues the text extraction of a content's current file.
+    """
+    if can_extract_text(content):
+        enqueue('core.extract_content_text', content_id=content.pk)
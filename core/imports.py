@@ -0,0 +1,191 @@
+import csv
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.conf import settings
+from django.core.files import File
+from django.db import connections, transaction
+from django.utils import timezone
+
+from core.applicability import (applicability_index, author_group_ids,
+                                file_extension)
+from core.extraction import can_extract_text
+from core.models import Content, ContentVersion, ReviewItem
+from core.prescreen import rule_set
+from core.search import update_content_search_vectors
+from core.storage import discard_unsaved_file, retain_file
+from core.taskqueue import enqueue_many
+from core.utils import has_allowed_extension
+
+# Size of the blocks read from a source file while hashing it.
+_READ_SIZE = 1024 * 1024
+
+
+def iter_import_entries(source):
+    """
+    Yields the (path, title) of every file to import, in a stable order.
+    Args:
+        source: A directory, walked recursively and titled by file name, or a
+            CSV manifest with a `path` column (relative to the manifest) and an
+            optional `title` column.
+    """
+    if os.path.isdir(source):
+        for directory, subdirectories, filenames in os.walk(source):
+            subdirectories.sort()
+            for filename in sorted(filenames):
+                yield os.path.join(directory, filename), os.path.splitext(filename)[0]
+        return
+
+    base_directory = os.path.dirname(os.path.abspath(source))
+    with open(source, newline='') as manifest:
+        for row in csv.DictReader(manifest):
+            path = os.path.join(base_directory, row['path'])
+            title = row.get('title') or os.path.splitext(os.path.basename(path))[0]
+            yield path, title
+
+
+def validate_import_entries(entries, author):
+    """
+    Splits entries into those that can be imported and those that are skipped:
+    files with a disallowed extension, missing files, overlong titles and
+    titles the author already uses.
+    Returns:
+        A (valid entries, [(entry, reason), ...]) tuple.
+    """
+    title_length = Content._meta.get_field('title').max_length
+    taken = set(
+        Content.objects.filter(author=author, title__in=[title for _, title in entries])
+        .values_list('title', flat=True)
+    )
+    valid, skipped = [], []
+    for entry in entries:
+        path, title = entry
+        if not has_allowed_extension(path):
+            skipped.append((entry, 'unsupported file type'))
+        elif not os.path.isfile(path):
+            skipped.append((entry, 'file not found'))
+        elif len(title) > title_length:
+            skipped.append((entry, 'title too long'))
+        elif title in taken:
+            skipped.append((entry, 'duplicate title'))
+        else:
+            taken.add(title)
+            valid.append(entry)
+    return valid, skipped
+
+
+def copy_files(paths, workers):
+    """
+    Copies source files into content storage from a pool of threads.
+    Args:
+        paths: The paths of the source files.
+        workers: The number of files copied at once.
+    Returns:
+        A (storage name, size, SHA-256 digest) tuple per path, in order, or
+        None for files that could not be read.
+    """
+    field = Content._meta.get_field('file')
+    slices = [paths[index::workers] for index in range(workers)]
+
+    def copy_slice(slice_paths):
+        try:
+            return [_copy_file(field, path) for path in slice_paths]
+        finally:
+            # Content-addressed storage records blobs from the pool threads.
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        copied_slices = list(executor.map(copy_slice, slices))
+
+    copied = [None] * len(paths)
+    for index, copied_slice in enumerate(copied_slices):
+        copied[index::workers] = copied_slice
+    return copied
+
+
+def create_imported_contents(author, entries, copied_files):
+    """
+    Creates the contents of copied files with their first version and the
+    review items of their applicable guidelines in a few bulk INSERTs, and
+    queues their text extraction and pre-screening. Stored files are
+    discarded when the transaction fails.
+    Args:
+        author: The User the contents are attributed to.
+        entries: The (path, title) of each file.
+        copied_files: The (storage name, size, digest) of each file.
+    Returns:
+        The created Content instances.
+    """
+    storage = Content._meta.get_field('file').storage
+    index = applicability_index.get()
+    group_ids = author_group_ids(author.pk) if index.author_groups else ()
+    now = timezone.now()
+    guideline_ids = [
+        index.guideline_ids(file_extension(name), now, group_ids) for name, _, _ in copied_files
+    ]
+    batch_size = settings.REVIEW_FANOUT_BATCH_SIZE
+    try:
+        with transaction.atomic():
+            contents = Content.objects.bulk_create(
+                Content(
+                    title=title,
+                    file=name,
+                    author=author,
+                    total_reviews=len(content_guideline_ids),
+                    pending_reviews=len(content_guideline_ids),
+                )
+                for (_, title), (name, _, _), content_guideline_ids
+                in zip(entries, copied_files, guideline_ids)
+            )
+            ContentVersion.objects.bulk_create(
+                ContentVersion(content=content, version=1, file=name, size=size, digest=digest)
+                for content, (name, size, digest) in zip(contents, copied_files)
+            )
+            for name, _, _ in copied_files:
+                retain_file(storage, name)
+
+            review_items = (
+                ReviewItem(content_id=content.pk, guideline_id=guideline_id)
+                for content, content_guideline_ids in zip(contents, guideline_ids)
+                for guideline_id in content_guideline_ids
+            )
+            while batch := list(islice(review_items, batch_size)):
+                ReviewItem.objects.bulk_create(batch, batch_size=batch_size)
+
+            enqueue_many(
+                'core.extract_content_text',
+                [{'content_id': content.pk} for content in contents if can_extract_text(content)],
+            )
+            if rule_set.get().guideline_ids:
+                enqueue_many(
+                    'core.prescreen_content',
+                    [{'content_id': content.pk} for content in contents],
+                )
+            update_content_search_vectors(
+                Content.objects.filter(pk__in=[content.pk for content in contents])
+            )
+    except Exception:
+        for name, _, _ in copied_files:
+            discard_unsaved_file(storage, name)
+        raise
+    return contents
+
+
+def _copy_file(field, path):
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, 'rb') as source:
+            for chunk in iter(lambda: source.read(_READ_SIZE), b''):
+                digest.update(chunk)
+                size += len(chunk)
+            source.seek(0)
+            stored = File(source, name=os.path.basename(path))
+            # Spares content-addressed storage a second pass to hash the file.
+            stored.sha256 = digest.hexdigest()
+            name = field.storage.save(field.generate_filename(None, stored.name), stored)
+    except OSError:
+        return None
+    return name, size, digest.hexdigest()
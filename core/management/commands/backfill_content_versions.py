@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Content
+from core.versioning import record_version
+
+
+class Command(BaseCommand):
+    """
+    Records the current file of every Content created before version history
+    was kept as its first ContentVersion.
+    """
+    help = 'Create the initial ContentVersion of contents without version history.'
+
+    def handle(self, *args, **options):
+        recorded = 0
+        contents = Content.objects.filter(versions__isnull=True).order_by('pk')
+        for content in contents.iterator():
+            record_version(content)
+            recorded += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Recorded {recorded} content versions.'))
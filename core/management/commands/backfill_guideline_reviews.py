@@ -0,0 +1,69 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.models import Guideline
+from core.reviews import backfill_guideline_reviews
+
+
+class Command(BaseCommand):
+    """
+    Creates the missing review items of active guidelines for every existing
+    content, chunk by chunk, in this process. Chunks skip contents that
+    already have the review item, so the command can be rerun or resumed with
+    --after at any time.
+    """
+    help = 'Back-propagate active guidelines to the existing contents.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'guideline_ids',
+            nargs='*',
+            type=int,
+            help='Guidelines to back-propagate (defaults to every active guideline).',
+        )
+        parser.add_argument(
+            '--after',
+            type=int,
+            default=0,
+            help='Resume after the content with this id.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Number of contents per chunk.',
+        )
+        parser.add_argument(
+            '--delay',
+            type=float,
+            default=None,
+            help='Seconds to wait between two chunks.',
+        )
+
+    def handle(self, *args, **options):
+        delay = options['delay']
+        if delay is None:
+            delay = settings.GUIDELINE_BACKFILL_DELAY
+        guidelines = Guideline.objects.filter(is_active=True).order_by('pk')
+        if options['guideline_ids']:
+            guidelines = guidelines.filter(pk__in=options['guideline_ids'])
+
+        for guideline in guidelines:
+            after_id = options['after']
+            created_reviews = 0
+            while True:
+                created, after_id = backfill_guideline_reviews(
+                    guideline, after_id, options['chunk_size']
+                )
+                created_reviews += created
+                if after_id is None:
+                    break
+                self.stdout.write(
+                    f'Guideline {guideline.pk}: {created_reviews} review items created '
+                    f'up to content {after_id}.'
+                )
+                time.sleep(delay)
+            summary = f'Guideline {guideline.pk}: created {created_reviews} review items.'
+            self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,104 @@
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.benchmarks import percentile
+from core.models import Content, Guideline
+
+
+class Rollback(Exception):
+    """
+    Raised to discard the rows created by a benchmark run.
+    """
+
+
+class Command(BaseCommand):
+    """
+    Measures upload latency through ContentUploadView as the number of
+    guidelines (and therefore review items per upload) grows.
+    """
+    help = 'Benchmark content upload latency versus guideline count.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--guidelines',
+            default='10,100,300,1000',
+            help='Comma separated guideline counts to benchmark.',
+        )
+        parser.add_argument(
+            '--uploads',
+            type=int,
+            default=10,
+            help='Number of uploads timed per guideline count.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Override REVIEW_FANOUT_BATCH_SIZE for the run.',
+        )
+
+    def handle(self, *args, **options):
+        guideline_counts = [int(count) for count in options['guidelines'].split(',')]
+        overrides = {'ALLOWED_HOSTS': ['testserver'], 'REVIEW_FANOUT_DEFER_THRESHOLD': 0}
+        if options['batch_size']:
+            overrides['REVIEW_FANOUT_BATCH_SIZE'] = options['batch_size']
+
+        self.stdout.write(f"{'guidelines':>10} {'median ms':>10} {'p95 ms':>10} {'max ms':>10}")
+        with override_settings(**overrides):
+            for guideline_count in guideline_counts:
+                timings = self._run(guideline_count, options['uploads'])
+                self.stdout.write(
+                    f'{guideline_count:>10} '
+                    f'{statistics.median(timings):>10.1f} '
+                    f'{percentile(timings, 95):>10.1f} '
+                    f'{max(timings):>10.1f}'
+                )
+
+    def _run(self, guideline_count, uploads):
+        """
+        Times the uploads for one guideline count and rolls back every row written.
+        """
+        timings = []
+        stored_files = []
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(username='benchmark-fanout')
+                Guideline.objects.bulk_create(
+                    Guideline(title=f'Guideline {index}', description='Benchmark')
+                    for index in range(guideline_count)
+                )
+                client = APIClient()
+                client.force_authenticate(user=user)
+
+                for index in range(uploads):
+                    upload = SimpleUploadedFile(f'benchmark-{index}.txt', b'Benchmark content')
+                    started = time.perf_counter()
+                    response = client.post(
+                        reverse('content-upload'),
+                        {'title': f'Benchmark {index}', 'file': upload},
+                        format='multipart',
+                    )
+                    timings.append((time.perf_counter() - started) * 1000)
+                    if response.status_code != 201:
+                        raise RuntimeError(f'Upload failed: {response.data}')
+
+                stored_files = list(
+                    Content.objects.filter(author=user).values_list('file', flat=True)
+                )
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            storage = Content._meta.get_field('file').storage
+            for name in stored_files:
+                storage.delete(name)
+
+        return timings
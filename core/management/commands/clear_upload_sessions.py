@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import UploadSession
+
+
+class Command(BaseCommand):
+    """
+    Deletes resumable uploads that have not received a chunk for a while.
+    """
+    help = 'Delete abandoned chunked upload sessions and their temporary files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=24,
+            help='Delete sessions idle for longer than this many hours.',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['hours'])
+        deleted = 0
+        for upload_session in UploadSession.objects.filter(updated_at__lt=cutoff).iterator():
+            upload_session.discard()
+            deleted += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} upload sessions.'))
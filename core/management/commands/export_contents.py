@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from core.export import EXPORT_FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    """
+    Streams every Content with its review items to a file or stdout.
+    """
+    help = 'Export all contents and their review items as NDJSON or CSV.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            dest='export_format',
+            choices=sorted(EXPORT_FORMATS),
+            default='ndjson',
+            help='Output format.',
+        )
+        parser.add_argument(
+            '--output',
+            help='Path of the file to write (defaults to stdout).',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Number of contents fetched per database round-trip.',
+        )
+
+    def handle(self, *args, **options):
+        rows = iter_export(options['export_format'], options['chunk_size'])
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as output:
+                output.writelines(rows)
+        else:
+            for row in rows:
+                self.stdout.write(row, ending='')
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from core.extraction import can_extract_text, extract_content_text
+from core.models import Content
+
+
+class Command(BaseCommand):
+    """
+    Extracts the text of contents whose current version has not been
+    extracted yet, such as contents uploaded before text extraction existed.
+    """
+    help = 'Extract the text of contents without up-to-date extracted text.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('content_ids', nargs='*', type=int)
+
+    def handle(self, *args, **options):
+        contents = Content.objects.select_related('extracted_text').order_by('pk')
+        if options['content_ids']:
+            contents = contents.filter(pk__in=options['content_ids'])
+
+        extracted = 0
+        for content in contents.iterator(chunk_size=100):
+            current = getattr(content, 'extracted_text', None)
+            if current is not None and current.version == content.version:
+                continue
+            if can_extract_text(content) and extract_content_text(content) is not None:
+                extracted += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Extracted the text of {extracted} contents.'))
@@ -0,0 +1,111 @@
+import json
+import os
+import time
+from itertools import islice
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from core.imports import (copy_files, create_imported_contents,
+                          iter_import_entries, validate_import_entries)
+
+
+class Command(BaseCommand):
+    """
+    Imports a directory tree or a CSV manifest of files as contents of one
+    author. Files are copied into storage by a pool of threads, and contents,
+    versions and review items are created in bulk, one transaction per batch.
+    With --checkpoint, an interrupted import resumes after the last batch
+    committed.
+    """
+    help = 'Bulk import files from a directory or CSV manifest as contents.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'source',
+            help='Directory to walk, or CSV manifest with `path` and optional `title` columns.',
+        )
+        parser.add_argument('--author', required=True, help='Username of the contents author.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of files committed per transaction.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Number of files copied into storage at once.',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='File recording the progress of the import, resumed from when present.',
+        )
+
+    def handle(self, *args, **options):
+        source = os.path.abspath(options['source'])
+        if not os.path.exists(source):
+            raise CommandError(f"'{options['source']}' does not exist.")
+        author = User.objects.filter(username=options['author']).first()
+        if author is None:
+            raise CommandError(f"No user named '{options['author']}'.")
+        batch_size = max(options['batch_size'], 1)
+        workers = max(options['workers'], 1)
+
+        progress = {'source': source, 'position': 0, 'imported': 0, 'skipped': 0}
+        checkpoint = options['checkpoint']
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint) as checkpoint_file:
+                progress = json.load(checkpoint_file)
+            if progress['source'] != source:
+                raise CommandError(
+                    f"The checkpoint belongs to an import of '{progress['source']}'."
+                )
+            self.stdout.write(f"Resuming after {progress['position']} files.")
+
+        entries = islice(iter_import_entries(source), progress['position'], None)
+        started = time.perf_counter()
+        imported_bytes = 0
+        imported = 0
+        while batch := list(islice(entries, batch_size)):
+            valid, skipped = validate_import_entries(batch, author)
+            copied_files = copy_files([path for path, _ in valid], workers)
+            for entry, copied in zip(valid, copied_files):
+                if copied is None:
+                    skipped.append((entry, 'file not readable'))
+            valid = [entry for entry, copied in zip(valid, copied_files) if copied is not None]
+            copied_files = [copied for copied in copied_files if copied is not None]
+            if valid:
+                create_imported_contents(author, valid, copied_files)
+
+            for (path, _), reason in skipped:
+                self.stderr.write(f'Skipped {path}: {reason}.')
+            imported += len(valid)
+            imported_bytes += sum(size for _, size, _ in copied_files)
+            progress['position'] += len(batch)
+            progress['imported'] += len(valid)
+            progress['skipped'] += len(skipped)
+            if checkpoint:
+                _write_checkpoint(checkpoint, progress)
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"Processed {progress['position']} files: {progress['imported']} imported, "
+                f"{progress['skipped']} skipped ({imported / elapsed:.1f} files/s, "
+                f'{imported_bytes / elapsed / 2 ** 20:.1f} MiB/s).'
+            )
+
+        summary = f"Imported {progress['imported']} contents, skipped {progress['skipped']} files."
+        self.stdout.write(self.style.SUCCESS(summary))
+
+
+def _write_checkpoint(path, progress):
+    """
+    Replaces the checkpoint file atomically, so an interrupted write never
+    leaves it unreadable.
+    """
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'w') as checkpoint_file:
+        json.dump(progress, checkpoint_file)
+    os.replace(temporary_path, path)
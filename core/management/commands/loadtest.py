@@ -0,0 +1,129 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.benchmarks import percentile
+
+
+class Command(BaseCommand):
+    """
+    Compares the throughput and latency of a sync view served through the WSGI
+    handler with its async variant served through the ASGI handler, both
+    in-process against the configured database.
+    """
+    help = 'Load test a WSGI view against its ASGI variant.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Number of requests sent to each side.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=10,
+            help='Number of requests in flight at once.',
+        )
+        parser.add_argument(
+            '--username',
+            required=True,
+            help='User the requests are authenticated as.',
+        )
+        parser.add_argument(
+            '--wsgi-path',
+            default='/api/v1/contents/',
+            help='Path of the sync view.',
+        )
+        parser.add_argument(
+            '--asgi-path',
+            default='/api/v1/async/contents/',
+            help='Path of the async view.',
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options['username'], is_active=True).first()
+        if user is None:
+            raise CommandError(f"No active user named '{options['username']}'.")
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+        requests = options['requests']
+        concurrency = max(options['concurrency'], 1)
+
+        self.stdout.write(
+            f"{'handler':>8} {'req/s':>10} {'mean ms':>10} {'p95 ms':>10} {'errors':>8}"
+        )
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            for handler, run in (('wsgi', _run_wsgi), ('asgi', _run_asgi)):
+                path = options[f'{handler}_path']
+                started = time.perf_counter()
+                results = run(path, headers, requests, concurrency)
+                elapsed = time.perf_counter() - started
+
+                timings = [timing for timing, _ in results]
+                errors = sum(1 for _, status_code in results if status_code >= 400)
+                self.stdout.write(
+                    f'{handler:>8} '
+                    f'{len(results) / elapsed:>10.1f} '
+                    f'{statistics.mean(timings):>10.1f} '
+                    f'{percentile(timings, 95):>10.1f} '
+                    f'{errors:>8}'
+                )
+
+
+def _run_wsgi(path, headers, requests, concurrency):
+    """
+    Sends the requests through the WSGI handler from a pool of threads, each
+    sending its share of the requests one after the other.
+    Returns a list of (milliseconds, status code) tuples.
+    """
+    def send(count):
+        client = Client()
+        results = []
+        for _ in range(count):
+            started = time.perf_counter()
+            response = client.get(path, headers=headers)
+            results.append(((time.perf_counter() - started) * 1000, response.status_code))
+        return results
+
+    def send_in_thread(count):
+        try:
+            return send(count)
+        finally:
+            # Pool threads open their own connections; close them once done.
+            connections.close_all()
+
+    if concurrency == 1:
+        return send(requests)
+    shares = [
+        requests // concurrency + (1 if index < requests % concurrency else 0)
+        for index in range(concurrency)
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return [result for results in executor.map(send_in_thread, shares) for result in results]
+
+
+@async_to_sync
+async def _run_asgi(path, headers, requests, concurrency):
+    """
+    Sends the requests through the ASGI handler from a single event loop.
+    Returns a list of (milliseconds, status code) tuples.
+    """
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            return (time.perf_counter() - started) * 1000, response.status_code
+
+    return await asyncio.gather(*(send() for _ in range(requests)))
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.taskqueue import purge_tasks
+
+
+class Command(BaseCommand):
+    """
+    Deletes done and failed tasks so the queue table does not grow with
+    every upload and backfill.
+    """
+    help = 'Delete finished background tasks older than the retention period.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.TASK_RETENTION_DAYS,
+            help='Delete tasks that finished more than this many days ago.',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted = purge_tasks(cutoff)
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} tasks.'))
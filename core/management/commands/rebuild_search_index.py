@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Content, Guideline
+from core.search import (full_text_search_enabled,
+                         update_content_search_vectors,
+                         update_guideline_search_vectors)
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the search vectors of every Content and Guideline in batches,
+    e.g. after bulk imports that bypass signals or a change of SEARCH_CONFIG.
+    """
+    help = 'Rebuild the full-text search vectors of contents and guidelines.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if not full_text_search_enabled():
+            self.stdout.write('Full-text search requires PostgreSQL; nothing to rebuild.')
+            return
+
+        batch_size = options['batch_size']
+        for model, update in (
+            (Content, update_content_search_vectors),
+            (Guideline, update_guideline_search_vectors),
+        ):
+            ids = model.objects.order_by('pk').values_list('pk', flat=True)
+            indexed = 0
+            batch = []
+            for pk in ids.iterator(chunk_size=batch_size):
+                batch.append(pk)
+                if len(batch) == batch_size:
+                    update(model.objects.filter(pk__in=batch))
+                    indexed += len(batch)
+                    batch = []
+            if batch:
+                update(model.objects.filter(pk__in=batch))
+                indexed += len(batch)
+            self.stdout.write(
+                self.style.SUCCESS(f'Indexed {indexed} {model._meta.verbose_name_plural}.')
+            )
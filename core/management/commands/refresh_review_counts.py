@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from core.cache import invalidate_content_responses
+from core.models import Content
+
+
+class Command(BaseCommand):
+    """
+    Backfills or repairs the denormalized review counters stored on Content.
+    """
+    help = 'Recompute the review counters of Content instances from their review items.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'content_ids',
+            nargs='*',
+            type=int,
+            help='Only refresh these Content ids (defaults to all contents).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of contents updated per UPDATE statement.',
+        )
+
+    def handle(self, *args, **options):
+        content_ids = options['content_ids']
+        batch_size = options['batch_size']
+
+        queryset = Content.objects.order_by('pk')
+        if content_ids:
+            queryset = queryset.filter(pk__in=content_ids)
+
+        refreshed = 0
+        last_pk = 0
+        while True:
+            batch = list(
+                queryset.filter(pk__gt=last_pk).values_list('pk', flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+            refreshed += Content.objects.filter(pk__in=batch).refresh_review_counts()
+            invalidate_content_responses(*batch)
+            last_pk = batch[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Refreshed review counters of {refreshed} contents.')
+        )
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.stats import refresh_review_stats_summary
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the review statistics summary table. Meant to run periodically,
+    e.g. from cron, when REVIEW_STATS_FROM_SUMMARY is enabled.
+    """
+    help = 'Rebuild the precomputed review statistics served by the stats endpoint.'
+
+    def handle(self, *args, **options):
+        rows = refresh_review_stats_summary()
+        self.stdout.write(self.style.SUCCESS(f'Wrote {rows} summary rows.'))
@@ -0,0 +1,119 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from core.benchmarks import (SCENARIOS, TRANSPORTS, compare_to_baseline,
+                             delete_benchmark_data, generate_dataset,
+                             load_baseline, run_scenario, save_baseline)
+
+# Options recorded with a report; baselines are only comparable when they match.
+CONFIG_OPTIONS = ('transport', 'users', 'guidelines', 'contents', 'requests', 'warmup', 'seed')
+
+
+class Command(BaseCommand):
+    """
+    Generates a benchmark dataset, replays the API scenarios against it and
+    reports latency, throughput and queries per request. Meant to run against
+    a dedicated database: the generated rows are deleted afterwards.
+    """
+    help = 'Benchmark the core API and compare the results with a saved baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenarios',
+            default=','.join(SCENARIOS),
+            help='Comma separated scenarios to run.',
+        )
+        parser.add_argument(
+            '--transport',
+            choices=sorted(TRANSPORTS),
+            default='client',
+            help='Send requests through the test client or an in-process WSGI server.',
+        )
+        parser.add_argument('--users', type=int, default=10, help='Number of users.')
+        parser.add_argument('--guidelines', type=int, default=50, help='Number of guidelines.')
+        parser.add_argument('--contents', type=int, default=1000, help='Number of contents.')
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Number of measured requests per scenario.',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=20,
+            help='Number of requests sent per scenario before measuring.',
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Seed of the generated data.')
+        parser.add_argument('--save-baseline', help='Write the report to this JSON file.')
+        parser.add_argument('--baseline', help='Compare the report with this JSON file.')
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Fraction by which latency may exceed the baseline.',
+        )
+        parser.add_argument(
+            '--keep-data',
+            action='store_true',
+            help='Keep the generated rows after the run.',
+        )
+
+    def handle(self, *args, **options):
+        scenarios = options['scenarios'].split(',')
+        unknown = [name for name in scenarios if name not in SCENARIOS]
+        if unknown:
+            raise CommandError(f"Unknown scenarios: {', '.join(unknown)}.")
+        baseline = load_baseline(options['baseline']) if options['baseline'] else None
+
+        config = {key: options[key] for key in CONFIG_OPTIONS}
+        report = {'config': config, 'scenarios': {}}
+
+        dataset = generate_dataset(
+            users=options['users'],
+            guidelines=options['guidelines'],
+            contents=options['contents'],
+            seed=options['seed'],
+        )
+        transport = None
+        try:
+            with override_settings(ALLOWED_HOSTS=['testserver', '127.0.0.1']):
+                transport = TRANSPORTS[options['transport']]()
+                self.stdout.write(
+                    f"{'scenario':>14} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+                    f"{'req/s':>9} {'queries':>8} {'errors':>7}"
+                )
+                for name in scenarios:
+                    metrics = run_scenario(
+                        transport,
+                        SCENARIOS[name],
+                        dataset,
+                        options['requests'],
+                        warmup=options['warmup'],
+                        seed=options['seed'],
+                    )
+                    report['scenarios'][name] = metrics
+                    self.stdout.write(
+                        f"{name:>14} {metrics['p50_ms']:>9.1f} {metrics['p95_ms']:>9.1f} "
+                        f"{metrics['p99_ms']:>9.1f} {metrics['throughput']:>9.1f} "
+                        f"{metrics['queries_per_request']:>8.2f} {metrics['errors']:>7}"
+                    )
+        finally:
+            if transport is not None:
+                transport.close()
+            if not options['keep_data']:
+                delete_benchmark_data()
+
+        if options['save_baseline']:
+            save_baseline(report, options['save_baseline'])
+            self.stdout.write(f"Saved baseline to {options['save_baseline']}.")
+
+        if baseline is not None:
+            if baseline['config'] != config:
+                self.stderr.write('The baseline was recorded with a different configuration.')
+            regressions = compare_to_baseline(report, baseline, options['tolerance'])
+            for regression in regressions:
+                self.stderr.write(regression)
+            if regressions:
+                raise CommandError('Performance regressed against the baseline.')
+            self.stdout.write(self.style.SUCCESS('No regression against the baseline.'))
@@ -0,0 +1,83 @@
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.taskqueue import claim_tasks, run_task
+
+
+class Command(BaseCommand):
+    """
+    Runs queued background tasks, claiming them with SELECT ... FOR UPDATE
+    SKIP LOCKED so any number of workers can share the queue table.
+    """
+    help = 'Run background tasks from the database queue.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Maximum number of tasks run at the same time by this worker.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait before polling an empty queue again.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once the queue is drained instead of polling forever.',
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        self.stdout.write(f'Worker {worker_id} started with concurrency {concurrency}.')
+        running = set()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while not self.stopping:
+                free_slots = concurrency - len(running)
+                claimed = claim_tasks(worker_id, free_slots) if free_slots else []
+                for claimed_task in claimed:
+                    running.add(executor.submit(self._run, claimed_task))
+
+                if running:
+                    _, running = wait(
+                        running, timeout=options['poll_interval'], return_when=FIRST_COMPLETED
+                    )
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll_interval'])
+
+            wait(running)
+
+        self.stdout.write(f'Worker {worker_id} stopped.')
+
+    def _run(self, claimed_task):
+        """
+        Runs one task on a pool thread with a fresh database connection.
+        """
+        close_old_connections()
+        try:
+            status = run_task(claimed_task)
+            self.stdout.write(f'Task {claimed_task.pk} ({claimed_task.name}): {status}')
+        finally:
+            close_old_connections()
+
+    def _stop(self, signum, frame):
+        """
+        Stops claiming new tasks and lets running ones finish.
+        """
+        self.stopping = True
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count, Max, Q
+
+from core.models import Task
+
+
+class Command(BaseCommand):
+    """
+    Reports per-task counts and timings from the background task queue.
+    """
+    help = 'Show queue depth, outcomes and durations per background task.'
+
+    def handle(self, *args, **options):
+        statistics = (
+            Task.objects.values('name')
+            .annotate(
+                queued=Count('pk', filter=Q(status=Task.StatusChoices.QUEUED)),
+                running=Count('pk', filter=Q(status=Task.StatusChoices.RUNNING)),
+                done=Count('pk', filter=Q(status=Task.StatusChoices.DONE)),
+                failed=Count('pk', filter=Q(status=Task.StatusChoices.FAILED)),
+                avg_ms=Avg('duration_ms', filter=Q(status=Task.StatusChoices.DONE)),
+                max_ms=Max('duration_ms', filter=Q(status=Task.StatusChoices.DONE)),
+            )
+            .order_by('name')
+        )
+
+        self.stdout.write(
+            f"{'task':<32} {'queued':>7} {'running':>7} {'done':>7} "
+            f"{'failed':>7} {'avg ms':>8} {'max ms':>8}"
+        )
+        for row in statistics:
+            self.stdout.write(
+                f"{row['name']:<32} {row['queued']:>7} {row['running']:>7} "
+                f"{row['done']:>7} {row['failed']:>7} "
+                f"{row['avg_ms'] or 0:>8.1f} {row['max_ms'] or 0:>8}"
+            )
@@ -0,0 +1,60 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher that finds every occurrence of a set of
+    keywords in one pass over the text, independent of the keyword count.
+    """
+    def __init__(self, keywords):
+        """
+        Builds the automaton.
+        Args:
+            keywords: An iterable of (keyword, value) pairs; value is reported
+                for every occurrence of keyword.
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for keyword, value in keywords:
+            state = 0
+            for character in keyword:
+                next_state = self._goto[state].get(character)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][character] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(keyword), value))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(character, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find_all(self, text):
+        """
+        Yields (start, end, value) for every keyword occurrence in text,
+        including overlapping ones.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, character in enumerate(text):
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            for length, value in output[state]:
+                yield index + 1 - length, index + 1, value
@@ -0,0 +1,311 @@
+import hmac
+import json
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+# Upper bounds of the latency histogram buckets, in seconds.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of the queries per request histogram buckets.
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+METRIC_PREFIX = 'compliance_engine'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Database activity of the request being served. Set by the middleware and
+# carried into the threads running the ORM of async views by sync_to_async.
+_request_queries = ContextVar('request_queries', default=None)
+
+
+class QueryStats:
+    """
+    The number of queries and seconds spent in the database by one request.
+    """
+    __slots__ = ('count', 'seconds')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper adding each query to the stats of the request
+    being served, if any.
+    """
+    stats = _request_queries.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+def track_queries():
+    """
+    Starts recording the queries of the current request. Returns the stats
+    and the token to pass to stop_tracking_queries().
+    """
+    stats = QueryStats()
+    return stats, _request_queries.set(stats)
+
+
+def stop_tracking_queries(token):
+    _request_queries.reset(token)
+
+
+class Series:
+    """
+    Aggregated requests of one (view, method, status) label set.
+    """
+    __slots__ = (
+        'count', 'duration_sum', 'duration_buckets', 'query_sum', 'query_buckets',
+        'query_seconds', 'response_bytes', 'request_bytes',
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.duration_sum = 0.0
+        self.duration_buckets = [0] * len(DURATION_BUCKETS)
+        self.query_sum = 0
+        self.query_buckets = [0] * len(QUERY_BUCKETS)
+        self.query_seconds = 0.0
+        self.response_bytes = 0
+        self.request_bytes = 0
+
+    def observe(self, duration, queries, query_seconds, response_bytes, request_bytes):
+        self.count += 1
+        self.duration_sum += duration
+        _add_to_bucket(self.duration_buckets, DURATION_BUCKETS, duration)
+        self.query_sum += queries
+        _add_to_bucket(self.query_buckets, QUERY_BUCKETS, queries)
+        self.query_seconds += query_seconds
+        self.response_bytes += response_bytes
+        self.request_bytes += request_bytes
+
+    def merge(self, other):
+        self.count += other.count
+        self.duration_sum += other.duration_sum
+        self.duration_buckets = [
+            mine + theirs for mine, theirs in zip(self.duration_buckets, other.duration_buckets)
+        ]
+        self.query_sum += other.query_sum
+        self.query_buckets = [
+            mine + theirs for mine, theirs in zip(self.query_buckets, other.query_buckets)
+        ]
+        self.query_seconds += other.query_seconds
+        self.response_bytes += other.response_bytes
+        self.request_bytes += other.request_bytes
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        series = cls()
+        for field in cls.__slots__:
+            setattr(series, field, data[field])
+        return series
+
+
+class MetricsRegistry:
+    """
+    Request metrics of this process. Every thread records into its own shard,
+    so observing a request takes no lock; shards are merged when exported.
+    With a multiprocess directory configured, each process also writes its
+    totals to a file there, and exports merge the files of all processes.
+    """
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._flush_lock = threading.Lock()
+        self._flushed_at = 0.0
+
+    def observe(self, labels, duration, queries, query_seconds, response_bytes, request_bytes):
+        """
+        Records a served request.
+        Args:
+            labels: The (view, method, status) of the request.
+            duration: The seconds taken to serve it.
+            queries: The number of database queries it ran.
+            query_seconds: The seconds spent running those queries.
+            response_bytes: The size of the response body.
+            request_bytes: The size of the request body.
+        """
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            series = shard[labels] = Series()
+        series.observe(duration, queries, query_seconds, response_bytes, request_bytes)
+
+        if settings.METRICS_MULTIPROCESS_DIR and (
+            time.monotonic() - self._flushed_at >= settings.METRICS_FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def collect(self):
+        """
+        Returns the merged series of this process, keyed by their labels.
+        """
+        merged = {}
+        for shard in list(self._shards):
+            # dict.copy() is atomic, so the owning thread may keep writing.
+            for labels, series in shard.copy().items():
+                merged.setdefault(labels, Series()).merge(series)
+        return merged
+
+    def collect_all(self):
+        """
+        Returns the merged series of every process sharing the multiprocess
+        directory, or of this process only when none is configured.
+        """
+        directory = settings.METRICS_MULTIPROCESS_DIR
+        if not directory:
+            return self.collect()
+
+        self.flush(wait=True)
+        merged = {}
+        for name in os.listdir(directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(directory, name)) as snapshot:
+                    rows = json.load(snapshot)
+            except (OSError, ValueError):
+                # Removed or replaced while listing.
+                continue
+            for row in rows:
+                labels = tuple(row['labels'])
+                merged.setdefault(labels, Series()).merge(Series.from_dict(row['series']))
+        return merged
+
+    def flush(self, wait=False):
+        """
+        Writes the totals of this process to its file in the multiprocess
+        directory. Skipped when another thread is already writing, unless
+        `wait` is set.
+        """
+        if not self._flush_lock.acquire(blocking=wait):
+            return
+        try:
+            directory = settings.METRICS_MULTIPROCESS_DIR
+            os.makedirs(directory, exist_ok=True)
+            rows = [
+                {'labels': list(labels), 'series': series.to_dict()}
+                for labels, series in self.collect().items()
+            ]
+            handle, temporary_name = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(handle, 'w') as snapshot:
+                json.dump(rows, snapshot)
+            # Readers see either the previous or the new snapshot, never half of one.
+            os.replace(temporary_name, os.path.join(directory, f'metrics-{os.getpid()}.json'))
+            self._flushed_at = time.monotonic()
+        finally:
+            self._flush_lock.release()
+
+    def reset(self):
+        """
+        Drops the metrics recorded by this process.
+        """
+        self._local = threading.local()
+        self._shards = []
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            self._shards.append(shard)
+        return shard
+
+
+registry = MetricsRegistry()
+
+
+def render_metrics(series_by_labels):
+    """
+    Renders merged series in the Prometheus text exposition format.
+    """
+    ordered = sorted(series_by_labels.items())
+    lines = []
+
+    def metric(name, kind, help_text):
+        lines.append(f'# HELP {METRIC_PREFIX}_{name} {help_text}')
+        lines.append(f'# TYPE {METRIC_PREFIX}_{name} {kind}')
+
+    def sample(name, labels, value, **extra):
+        names = ('view', 'method', 'status')
+        pairs = [*zip(names, labels), *extra.items()]
+        rendered = ','.join(f'{key}="{_escape(label)}"' for key, label in pairs)
+        lines.append(f'{METRIC_PREFIX}_{name}{{{rendered}}} {_number(value)}')
+
+    def histogram(name, help_text, buckets, bucket_counts, total):
+        metric(name, 'histogram', help_text)
+        for labels, series in ordered:
+            cumulative = 0
+            for bound, count in zip(buckets, getattr(series, bucket_counts)):
+                cumulative += count
+                sample(f'{name}_bucket', labels, cumulative, le=_number(bound))
+            sample(f'{name}_bucket', labels, series.count, le='+Inf')
+            sample(f'{name}_sum', labels, getattr(series, total))
+            sample(f'{name}_count', labels, series.count)
+
+    def counter(name, help_text, field):
+        metric(name, 'counter', help_text)
+        for labels, series in ordered:
+            sample(name, labels, getattr(series, field))
+
+    histogram(
+        'http_request_duration_seconds', 'Time taken to serve requests.',
+        DURATION_BUCKETS, 'duration_buckets', 'duration_sum',
+    )
+    histogram(
+        'db_queries_per_request', 'Database queries run per request.',
+        QUERY_BUCKETS, 'query_buckets', 'query_sum',
+    )
+    counter('db_query_seconds_total', 'Time spent in database queries.', 'query_seconds')
+    counter('http_response_bytes_total', 'Bytes of response bodies sent.', 'response_bytes')
+    counter('http_request_bytes_total', 'Bytes of request bodies received.', 'request_bytes')
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    """
+    Serves the request metrics of every worker in the Prometheus text format.
+    Only answers requests carrying METRICS_TOKEN and clients in
+    METRICS_ALLOWED_IPS, both empty by default.
+    """
+    if not _metrics_access_allowed(request):
+        raise Http404
+    return HttpResponse(render_metrics(registry.collect_all()), content_type=CONTENT_TYPE)
+
+
+def _metrics_access_allowed(request):
+    if request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS:
+        return True
+    if not settings.METRICS_TOKEN:
+        return False
+    expected = f'Bearer {settings.METRICS_TOKEN}'
+    return hmac.compare_digest(request.META.get('HTTP_AUTHORIZATION', ''), expected)
+
+
+def _add_to_bucket(bucket_counts, bounds, value):
+    for index, bound in enumerate(bounds):
+        if value <= bound:
+            bucket_counts[index] += 1
+            return
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
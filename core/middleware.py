@@ -0,0 +1,66 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from core.metrics import registry, stop_tracking_queries, track_queries
+
+
+class MetricsMiddleware:
+    """
+    Records the latency, database queries and body sizes of every request in
+    the metrics registry, labelled by URL name, method and status code.
+    Serves sync and async views alike without forcing a thread switch.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        stats, token = track_queries()
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_tracking_queries(token)
+        self._observe(request, response, time.perf_counter() - started, stats)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        stats, token = track_queries()
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_tracking_queries(token)
+        self._observe(request, response, time.perf_counter() - started, stats)
+        return response
+
+    def _observe(self, request, response, duration, stats):
+        match = request.resolver_match
+        view = match.view_name if match is not None and match.view_name else 'unmatched'
+        if response.has_header('Content-Length'):
+            response_bytes = int(response['Content-Length'])
+        elif response.streaming:
+            # Streamed bodies are not buffered to measure them.
+            response_bytes = 0
+        else:
+            response_bytes = len(response.content)
+        registry.observe(
+            (view, request.method, str(response.status_code)),
+            duration,
+            stats.count,
+            stats.seconds,
+            response_bytes,
+            int(request.META.get('CONTENT_LENGTH') or 0),
+        )
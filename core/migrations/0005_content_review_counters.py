@@ -0,0 +1,55 @@
+# Generated by Django 5.0.4 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_review_counters(apps, schema_editor):
+    Content = apps.get_model('core', 'Content')
+    ReviewItem = apps.get_model('core', 'ReviewItem')
+
+    def review_count(status=None):
+        review_items = ReviewItem.objects.filter(content=OuterRef('pk'))
+        if status is not None:
+            review_items = review_items.filter(status=status)
+        review_items = review_items.order_by().values('content').annotate(count=Count('pk'))
+        return Coalesce(Subquery(review_items.values('count')), 0)
+
+    Content.objects.update(
+        total_reviews=review_count(),
+        passed_reviews=review_count('PASS'),
+        failed_reviews=review_count('FAIL'),
+        pending_reviews=review_count('PENDING'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_content_file'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='failed_reviews',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='passed_reviews',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='pending_reviews',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='total_reviews',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_review_counters, migrations.RunPython.noop),
+    ]
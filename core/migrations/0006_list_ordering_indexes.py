@@ -0,0 +1,23 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_content_review_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['-created_at', '-id'], name='content_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='guideline',
+            index=models.Index(fields=['-created_at', '-id'], name='guideline_created_id_idx'),
+        ),
+    ]
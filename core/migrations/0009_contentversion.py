@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:16
+
+import core.storage
+import core.utils
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_uploadsession'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField()),
+                ('file', models.FileField(blank=True, storage=core.storage.select_content_storage, upload_to=core.utils.unique_file_name)),
+                ('delta', models.FileField(blank=True, storage=core.storage.select_content_storage, upload_to=core.utils.delta_file_name)),
+                ('size', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('digest', models.CharField(blank=True, max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='core.content')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='contentversion',
+            constraint=models.UniqueConstraint(fields=('content', 'version'), name='unique_content_version'),
+        ),
+    ]
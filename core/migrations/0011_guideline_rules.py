@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_task'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guideline',
+            name='forbidden_patterns',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='guideline',
+            name='forbidden_phrases',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='guideline',
+            name='required_phrases',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='reviewitem',
+            name='evidence',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_guideline_rules'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField()),
+                ('text', models.TextField(blank=True)),
+                ('page_offsets', models.JSONField(blank=True, default=list)),
+                ('truncated', models.BooleanField(default=False)),
+                ('extracted_at', models.DateTimeField(auto_now=True)),
+                ('content', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='extracted_text', to='core.content')),
+            ],
+        ),
+    ]
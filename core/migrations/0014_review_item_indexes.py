@@ -0,0 +1,79 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:32
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicate_review_items(apps, schema_editor):
+    """
+    Keeps one review item per content and guideline, preferring a decided one,
+    and recounts the review counters of the affected contents.
+    """
+    Content = apps.get_model('core', 'Content')
+    ReviewItem = apps.get_model('core', 'ReviewItem')
+
+    duplicates = (
+        ReviewItem.objects.values('content_id', 'guideline_id')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    affected_content_ids = set()
+    for duplicate in duplicates.iterator():
+        review_items = ReviewItem.objects.filter(
+            content_id=duplicate['content_id'], guideline_id=duplicate['guideline_id']
+        )
+        keep = (
+            review_items.exclude(status='PENDING').order_by('pk').first()
+            or review_items.order_by('pk').first()
+        )
+        review_items.exclude(pk=keep.pk).delete()
+        affected_content_ids.add(duplicate['content_id'])
+
+    def review_count(status=None):
+        review_items = ReviewItem.objects.filter(content=OuterRef('pk'))
+        if status is not None:
+            review_items = review_items.filter(status=status)
+        review_items = review_items.order_by().values('content').annotate(count=Count('pk'))
+        return Coalesce(Subquery(review_items.values('count')), 0)
+
+    Content.objects.filter(pk__in=affected_content_ids).update(
+        total_reviews=review_count(),
+        passed_reviews=review_count('PASS'),
+        failed_reviews=review_count('FAIL'),
+        pending_reviews=review_count('PENDING'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_search_vectors'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_review_items, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['author', 'title'], name='content_author_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewitem',
+            index=models.Index(fields=['content', 'status'], name='reviewitem_content_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewitem',
+            index=models.Index(fields=['reviewer', 'reviewed_at'], name='reviewitem_reviewer_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewitem',
+            index=models.Index(fields=['guideline', 'status'], name='reviewitem_guideline_st_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewitem',
+            constraint=models.UniqueConstraint(fields=('content', 'guideline'), name='unique_content_guideline'),
+        ),
+    ]
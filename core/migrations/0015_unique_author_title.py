@@ -0,0 +1,59 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:34
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def rename_duplicate_titles(apps, schema_editor):
+    """
+    Keeps the oldest content of each duplicated (author, title) pair and
+    suffixes the titles of the others with a counter, e.g. "Policy (2)".
+    """
+    Content = apps.get_model('core', 'Content')
+    max_length = Content._meta.get_field('title').max_length
+
+    duplicates = (
+        Content.objects.values('author_id', 'title')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    for duplicate in list(duplicates):
+        contents = Content.objects.filter(
+            author_id=duplicate['author_id'], title=duplicate['title']
+        ).order_by('created_at', 'pk')
+        taken = set(
+            Content.objects.filter(author_id=duplicate['author_id'])
+            .values_list('title', flat=True)
+        )
+        number = 1
+        for content in contents[1:]:
+            while True:
+                number += 1
+                suffix = f' ({number})'
+                title = duplicate['title'][:max_length - len(suffix)] + suffix
+                if title not in taken:
+                    break
+            taken.add(title)
+            Content.objects.filter(pk=content.pk).update(title=title)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_review_item_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_titles, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='content',
+            name='content_author_title_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='content',
+            constraint=models.UniqueConstraint(fields=('author', 'title'), name='unique_author_title'),
+        ),
+    ]
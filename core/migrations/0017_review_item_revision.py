@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_review_item_claims'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewitem',
+            name='revision',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
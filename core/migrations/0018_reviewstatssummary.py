@@ -0,0 +1,31 @@
+# Generated by Django 5.0.4 on 2026-10-18 20:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_review_item_revision'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewStatsSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=20)),
+                ('key', models.CharField(max_length=50)),
+                ('label', models.CharField(max_length=255)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('passed', models.PositiveIntegerField(default=0)),
+                ('failed', models.PositiveIntegerField(default=0)),
+                ('pending', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='reviewstatssummary',
+            constraint=models.UniqueConstraint(fields=('dimension', 'key'), name='unique_stats_dimension_key'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_reviewstatssummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guideline',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+    ]
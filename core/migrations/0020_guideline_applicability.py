@@ -0,0 +1,34 @@
+# Generated by Django 5.0.4 on 2026-10-18 21:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0019_guideline_is_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guideline',
+            name='active_from',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='guideline',
+            name='active_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='guideline',
+            name='author_groups',
+            field=models.ManyToManyField(blank=True, related_name='guidelines', to='auth.group'),
+        ),
+        migrations.AddField(
+            model_name='guideline',
+            name='file_types',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
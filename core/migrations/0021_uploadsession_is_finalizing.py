@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_guideline_applicability'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadsession',
+            name='is_finalizing',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -1,14 +1,42 @@
-from django.contrib.auth.models import User
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+import os
+import uuid
 
-from core.utils import unique_file_name
+from django.conf import settings
+from django.contrib.auth.models import Group, User
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.http import quote_etag
+
+from core.storage import select_content_storage
+from core.utils import delta_file_name, unique_file_name
 
 
 class Guideline(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Inactive guidelines are not fanned out to new contents; their existing
+    # review items are kept.
+    is_active = models.BooleanField(default=True)
+
+    # Applicability scope: the file extensions and author groups the guideline
+    # is fanned out to (empty means all) and the upload dates it covers.
+    file_types = models.JSONField(default=list, blank=True)
+    author_groups = models.ManyToManyField(Group, blank=True, related_name='guidelines')
+    active_from = models.DateTimeField(null=True, blank=True)
+    active_until = models.DateTimeField(null=True, blank=True)
+
+    # Optional machine-checkable rules used to pre-screen uploaded documents.
+    forbidden_phrases = models.JSONField(default=list, blank=True)
+    forbidden_patterns = models.JSONField(default=list, blank=True)
+    required_phrases = models.JSONField(default=list, blank=True)
+
+    # Weighted tsvector of title and description, maintained by core.search and
+    # GIN indexed on PostgreSQL.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def __str__(self):
         return self.title
@@ -16,31 +44,93 @@ class Guideline(models.Model):
     class Meta:
         verbose_name = 'Compliance Guideline'
         verbose_name_plural = 'Compliance Guidelines'
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='guideline_created_id_idx'),
+        ]
+
+
+def _review_count(status=None):
+    """
+    Builds a correlated subquery counting the review items of the outer Content,
+    optionally restricted to a single status.
+    """
+    review_items = ReviewItem.objects.filter(content=OuterRef('pk'))
+    if status is not None:
+        review_items = review_items.filter(status=status)
+    review_items = review_items.order_by().values('content').annotate(count=Count('pk'))
+    return Coalesce(Subquery(review_items.values('count')), 0)
+
+
+class ContentQuerySet(models.QuerySet):
+    def refresh_review_counts(self):
+        """
+        Recomputes the review counters of every Content in the queryset from its
+        review items in a single UPDATE statement. The content rows are locked
+        first, in id order, so concurrent recomputations run one after the
+        other and each one counts the review item changes committed before it.
+        """
+        # The lock only needs a transaction; a failed UPDATE rolls back the caller's.
+        with transaction.atomic(savepoint=False):
+            list(self.select_for_update().order_by('pk').values_list('pk', flat=True))
+            return self.update(
+                total_reviews=_review_count(),
+                passed_reviews=_review_count(ReviewItem.StatusChoices.PASSED),
+                failed_reviews=_review_count(ReviewItem.StatusChoices.FAILED),
+                pending_reviews=_review_count(ReviewItem.StatusChoices.PENDING),
+            )
 
 
 class Content(models.Model):
     title = models.CharField(max_length=255)
-    file = models.FileField(upload_to=unique_file_name)
+    file = models.FileField(upload_to=unique_file_name, storage=select_content_storage)
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='content')
     version = models.IntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Denormalized review counters, kept in sync with review_items so that the
+    # review status never needs a query.
+    total_reviews = models.PositiveIntegerField(default=0, editable=False)
+    passed_reviews = models.PositiveIntegerField(default=0, editable=False)
+    failed_reviews = models.PositiveIntegerField(default=0, editable=False)
+    pending_reviews = models.PositiveIntegerField(default=0, editable=False)
+
+    # Weighted tsvector of title and extracted text, maintained by core.search
+    # and GIN indexed on PostgreSQL.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ContentQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='content_created_id_idx'),
+        ]
+        constraints = [
+            # Titles are unique per author; enforced here so that concurrent
+            # uploads cannot both pass a check in the view.
+            models.UniqueConstraint(fields=['author', 'title'], name='unique_author_title'),
+        ]
+
     def __str__(self):
         return f"{self.title} (v-{self.version})"
 
+    @property
+    def etag(self):
+        """
+        Entity tag of the stored state, matched against If-Match on updates.
+        """
+        return quote_etag(f'{self.version}-{self.updated_at.timestamp():.6f}')
+
+    @property
+    def latest_version(self):
+        return self.versions.order_by('-version').first()
+
     @property
     def review_status(self):
-        try:
-            passed_reviews = self.review_items.filter(
-                status=ReviewItem.StatusChoices.PASSED
-            ).count()
-            if passed_reviews == self.review_items.count():
-                return "Completed"
-            else:
-                return "Pending"
-        except ObjectDoesNotExist:
-            return "No review items"
+        if self.passed_reviews == self.total_reviews:
+            return "Completed"
+        else:
+            return "Pending"
 
 
 class ReviewItem(models.Model):
@@ -64,6 +154,223 @@ class ReviewItem(models.Model):
         max_length=10, choices=StatusChoices.choices, default=StatusChoices.PENDING
     )
     reviewed_at = models.DateTimeField(null=True, blank=True)
+    # Rule matches recorded when the item was decided by the pre-screening engine.
+    evidence = models.JSONField(null=True, blank=True)
+    # Lease taken by a reviewer pulling the item from the review queue.
+    claimed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='claimed_review_items',
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True)
+    # Incremented on every update, exposed as the ETag for If-Match updates.
+    revision = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        constraints = [
+            # One review per guideline and content; also lets a repeated
+            # fan-out skip the items that already exist.
+            models.UniqueConstraint(
+                fields=['content', 'guideline'], name='unique_content_guideline'
+            ),
+        ]
+        indexes = [
+            # Review counters and status pages of a content.
+            models.Index(fields=['content', 'status'], name='reviewitem_content_status_idx'),
+            # A reviewer's recent decisions.
+            models.Index(fields=['reviewer', 'reviewed_at'], name='reviewitem_reviewer_at_idx'),
+            # Open reviews per guideline.
+            models.Index(fields=['guideline', 'status'], name='reviewitem_guideline_st_idx'),
+            # The review queue hands out pending items oldest first.
+            models.Index(
+                fields=['id'],
+                condition=Q(status='PENDING'),
+                name='reviewitem_pending_queue_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.guideline} - {self.status}"
+
+    @property
+    def etag(self):
+        """
+        Entity tag of the stored state, matched against If-Match on updates.
+        """
+        return quote_etag(str(self.revision))
+
+    def is_claimed_by_other(self, user):
+        """
+        Checks whether another reviewer holds an unexpired claim on the item.
+        """
+        return (
+            self.claimed_by_id is not None
+            and self.claimed_by_id != user.pk
+            and self.claim_expires_at is not None
+            and self.claim_expires_at > timezone.now()
+        )
+
+
+class StoredBlob(models.Model):
+    """
+    A file kept once by the content-addressed storage, with the number of
+    references held on it.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    digest = models.CharField(max_length=64, db_index=True)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+
+class UploadSession(models.Model):
+    """
+    A resumable upload whose chunks are appended to a temporary file until it
+    is finalized into a Content.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions')
+    title = models.CharField(max_length=255)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField(null=True, blank=True)
+    offset = models.PositiveBigIntegerField(default=0)
+    # Set while the completed file is verified and stored as a Content.
+    is_finalizing = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset} bytes)"
+
+    @property
+    def temporary_path(self):
+        return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{self.pk.hex}.part')
+
+    def discard(self):
+        """
+        Deletes the session together with its temporary file.
+        """
+        try:
+            os.remove(self.temporary_path)
+        except FileNotFoundError:
+            pass
+        self.delete()
+
+
+class ContentVersion(models.Model):
+    """
+    One revision of a Content file. The file of a revision is either stored in
+    full or, once a newer revision exists, as a delta against that revision.
+    """
+    content = models.ForeignKey(Content, on_delete=models.CASCADE, related_name='versions')
+    version = models.PositiveIntegerField()
+    file = models.FileField(
+        upload_to=unique_file_name, storage=select_content_storage, blank=True
+    )
+    delta = models.FileField(
+        upload_to=delta_file_name, storage=select_content_storage, blank=True
+    )
+    size = models.PositiveBigIntegerField(null=True, blank=True)
+    digest = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # Also serves "latest version" lookups as a backward index scan.
+            models.UniqueConstraint(
+                fields=['content', 'version'], name='unique_content_version'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.content_id} (v-{self.version})"
+
+
+class ContentText(models.Model):
+    """
+    The normalized text extracted from the current file of a Content, with the
+    offset at which each page starts. Extracted once per content version.
+    """
+    content = models.OneToOneField(
+        Content, on_delete=models.CASCADE, related_name='extracted_text'
+    )
+    version = models.PositiveIntegerField()
+    text = models.TextField(blank=True)
+    page_offsets = models.JSONField(default=list, blank=True)
+    truncated = models.BooleanField(default=False)
+    extracted_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.content_id} (v-{self.version})"
+
+    def page_text(self, page):
+        """
+        Returns the text of a page, numbered from 1.
+        """
+        start = self.page_offsets[page - 1]
+        end = self.page_offsets[page] if page < len(self.page_offsets) else len(self.text)
+        return self.text[start:end].strip()
+
+
+class Task(models.Model):
+    """
+    A unit of background work queued in the database and executed by the
+    run_worker management command.
+    """
+    class StatusChoices(models.TextChoices):
+        QUEUED = 'QUEUED', 'Queued'
+        RUNNING = 'RUNNING', 'Running'
+        DONE = 'DONE', 'Done'
+        FAILED = 'FAILED', 'Failed'
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10, choices=StatusChoices.choices, default=StatusChoices.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='task_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
+
+
+class ReviewStatsSummary(models.Model):
+    """
+    Review counts per dashboard dimension, precomputed by the
+    refresh_review_stats command for large datasets.
+    """
+    dimension = models.CharField(max_length=20)
+    key = models.CharField(max_length=50)
+    label = models.CharField(max_length=255)
+    total = models.PositiveIntegerField(default=0)
+    passed = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    pending = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'key'], name='unique_stats_dimension_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}: {self.label}"
@@ -0,0 +1,115 @@
+import base64
+import binascii
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (created_at, id), newest first. The cursor encodes the
+    full (created_at, id) position of the row a page ends at, so every page
+    costs the same index range scan, also when many rows share a created_at.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        position, self.reverse = self.decode_cursor(request)
+
+        if self.reverse:
+            queryset = queryset.order_by('created_at', 'id')
+            if position is not None:
+                queryset = queryset.filter(newer_than(position))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+            if position is not None:
+                queryset = queryset.filter(older_than(position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = bool(self.page), has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encode_cursor(self.page[-1])
+        )
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encode_cursor(self.page[0], reverse=True)
+        )
+
+    def decode_cursor(self, request):
+        """
+        Returns the position and direction of the request's cursor, raising
+        NotFound when it is malformed.
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            raise NotFound(self.invalid_cursor_message)
+        created_at, pk, reverse = decoded
+        return (created_at, pk), reverse
+
+
+def encode_cursor(instance, reverse=False):
+    """
+    Encodes the (created_at, id) position of a row as an opaque cursor. Reverse
+    cursors page towards newer rows.
+    """
+    position = f'{instance.created_at.isoformat()}|{instance.pk}'
+    if reverse:
+        position += '|r'
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a cursor into a (created_at, id, reverse) tuple, or None when invalid.
+    """
+    try:
+        created_at, pk, *flags = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        created_at = parse_datetime(created_at)
+        pk = int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    if created_at is None or flags not in ([], ['r']):
+        return None
+    return created_at, pk, bool(flags)
+
+
+def older_than(position):
+    """
+    Returns the filter selecting the rows after a position in the list order.
+    """
+    created_at, pk = position
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+
+
+def newer_than(position):
+    """
+    Returns the filter selecting the rows before a position in the list order.
+    """
+    created_at, pk = position
+    return Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
@@ -0,0 +1,231 @@
+import re
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.cache import GuidelineCache, invalidate_content_responses
+from core.extraction import extract_content_text
+from core.matching import AhoCorasick
+from core.models import Content, Guideline, ReviewItem
+from core.taskqueue import enqueue
+
+# Maximum number of matches recorded as evidence per rule.
+MAX_EVIDENCE_PER_RULE = 5
+
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+class RuleSet:
+    """
+    The rules of every guideline compiled into single-pass matchers: one
+    Aho-Corasick automaton for all phrases and one combined regular expression
+    for all forbidden patterns.
+    """
+    def __init__(self, guidelines):
+        self.guideline_ids = set()
+        self.required_phrases = defaultdict(list)
+        phrases = []
+        combinable = []
+        self.separate_patterns = []
+
+        for guideline in guidelines:
+            rules = (
+                guideline.forbidden_phrases,
+                guideline.forbidden_patterns,
+                guideline.required_phrases,
+            )
+            if not any(rules):
+                continue
+            self.guideline_ids.add(guideline.pk)
+
+            for phrase in guideline.forbidden_phrases:
+                phrases.append((phrase.lower(), (guideline.pk, 'forbidden_phrase', phrase)))
+            for phrase in guideline.required_phrases:
+                phrases.append((phrase.lower(), (guideline.pk, 'required_phrase', phrase)))
+                self.required_phrases[guideline.pk].append(phrase)
+            for pattern in guideline.forbidden_patterns:
+                try:
+                    compiled = re.compile(pattern, _PATTERN_FLAGS)
+                except re.error:
+                    continue
+                # Patterns with their own groups could be broken by the group
+                # renumbering of the combined expression, and inline global
+                # flags are only valid at its very start, so both run alone.
+                if compiled.groups or not _is_combinable(pattern):
+                    self.separate_patterns.append((guideline.pk, pattern, compiled))
+                else:
+                    combinable.append((guideline.pk, pattern, compiled))
+
+        self.phrase_matcher = AhoCorasick(phrases) if phrases else None
+        self.combined_patterns = combinable
+        self.combined_regex = None
+        if combinable:
+            # Zero-width lookaheads report a match at every position, so
+            # matches of different patterns may overlap.
+            try:
+                self.combined_regex = re.compile(
+                    '|'.join(
+                        f'(?=(?P<p{index}>{pattern}))'
+                        for index, (_, pattern, _) in enumerate(combinable)
+                    ),
+                    _PATTERN_FLAGS,
+                )
+            except re.error:
+                # A pattern that only compiles alone must not fail uploads.
+                self.separate_patterns.extend(combinable)
+                self.combined_patterns = []
+
+    def scan(self, text):
+        """
+        Scans a document once and decides every guideline with rules.
+        Args:
+            text: The text of the document.
+        Returns:
+            A dict mapping guideline id to a (status, evidence) pair.
+        """
+        evidence = defaultdict(list)
+        found_required = set()
+
+        if self.phrase_matcher is not None:
+            lowered = text.lower()
+            for start, end, (guideline_id, rule, phrase) in self.phrase_matcher.find_all(lowered):
+                if not _is_whole_word(lowered, start, end):
+                    continue
+                if rule == 'required_phrase':
+                    found_required.add((guideline_id, phrase))
+                else:
+                    _add_evidence(evidence[guideline_id], rule, phrase, start)
+
+        if self.combined_regex is not None:
+            # End of the last reported match per pattern, so a pattern is not
+            # reported again at every position inside its own match.
+            match_ends = [0] * len(self.combined_patterns)
+            for match in self.combined_regex.finditer(text):
+                position = match.start()
+                # Only the first alternative is reported per position, so
+                # check the other patterns at positions that matched.
+                for index, (guideline_id, pattern, compiled) in enumerate(
+                    self.combined_patterns
+                ):
+                    if position < match_ends[index]:
+                        continue
+                    if match.group(f'p{index}') is not None:
+                        end = match.end(f'p{index}')
+                    else:
+                        pattern_match = compiled.match(text, position)
+                        if pattern_match is None:
+                            continue
+                        end = pattern_match.end()
+                    match_ends[index] = max(end, position + 1)
+                    _add_evidence(
+                        evidence[guideline_id], 'forbidden_pattern', pattern, position
+                    )
+
+        for guideline_id, pattern, compiled in self.separate_patterns:
+            for match in compiled.finditer(text):
+                if not _add_evidence(
+                    evidence[guideline_id], 'forbidden_pattern', pattern, match.start()
+                ):
+                    break
+
+        results = {}
+        for guideline_id in self.guideline_ids:
+            guideline_evidence = evidence.get(guideline_id, [])
+            for phrase in self.required_phrases.get(guideline_id, []):
+                if (guideline_id, phrase) not in found_required:
+                    guideline_evidence.append(
+                        {'rule': 'required_phrase', 'value': phrase, 'found': False}
+                    )
+            status = (
+                ReviewItem.StatusChoices.FAILED
+                if guideline_evidence
+                else ReviewItem.StatusChoices.PASSED
+            )
+            results[guideline_id] = (status, guideline_evidence)
+        return results
+
+
+rule_set = GuidelineCache(lambda: RuleSet(Guideline.objects.filter(is_active=True)))
+
+
+def schedule_prescreen(content):
+    """
+    Queues the pre-screening of a content when any guideline carries rules.
+    """
+    if rule_set.get().guideline_ids:
+        enqueue('core.prescreen_content', content_id=content.pk)
+
+
+def prescreen_content(content):
+    """
+    Decides the pending review items of a content whose guideline has rules,
+    recording the matched evidence. Items decided by a human are left alone.
+    Returns:
+        The number of review items decided.
+    """
+    rules = rule_set.get()
+    if not rules.guideline_ids:
+        return 0
+
+    extracted = extract_content_text(content)
+    if extracted is None:
+        return 0
+    results = rules.scan(extracted.text)
+
+    with transaction.atomic():
+        review_items = list(
+            content.review_items.select_for_update()
+            .filter(guideline_id__in=rules.guideline_ids)
+            .filter(
+                Q(status=ReviewItem.StatusChoices.PENDING)
+                | Q(reviewer__isnull=True, evidence__isnull=False)
+            )
+            .order_by('pk')
+        )
+        reviewed_at = timezone.now()
+        for review_item in review_items:
+            review_item.status, review_item.evidence = results[review_item.guideline_id]
+            review_item.reviewed_at = reviewed_at
+            review_item.revision += 1
+
+        ReviewItem.objects.bulk_update(
+            review_items, ('status', 'evidence', 'reviewed_at', 'revision')
+        )
+        Content.objects.filter(pk=content.pk).refresh_review_counts()
+
+    invalidate_content_responses(content.pk)
+    return len(review_items)
+
+
+def _is_combinable(pattern):
+    try:
+        re.compile(f'(?=(?P<p0>{pattern}))', _PATTERN_FLAGS)
+    except re.error:
+        return False
+    return True
+
+
+def _is_whole_word(text, start, end):
+    """
+    Checks that a match is not part of a longer word.
+    """
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or after.isalnum())
+
+
+def _add_evidence(evidence, rule, value, offset):
+    """
+    Records a rule match unless the rule already has enough evidence.
+    Returns:
+        False when the evidence limit for the rule has been reached.
+    """
+    matches = sum(
+        1 for entry in evidence if entry['rule'] == rule and entry['value'] == value
+    )
+    if matches >= MAX_EVIDENCE_PER_RULE:
+        return False
+    evidence.append({'rule': rule, 'value': value, 'offset': offset})
+    return True
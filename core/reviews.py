@@ -0,0 +1,200 @@
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import CharField, F, IntegerField, Q, Value
+from django.utils import timezone
+
+from core.applicability import applicability_index, filter_applicable_contents
+from core.cache import invalidate_content_responses
+from core.models import Content, ReviewItem, Task
+from core.prescreen import rule_set, schedule_prescreen
+from core.taskqueue import enqueue, enqueue_many
+
+REVIEW_COUNTER_FIELDS = ('total_reviews', 'passed_reviews', 'failed_reviews', 'pending_reviews')
+
+
+def create_review_items(content, batch_size=None):
+    """
+    Creates a pending ReviewItem per applicable Guideline for the given
+    content using batched inserts inside a single transaction.
+    Args:
+        content: The Content instance to fan out reviews for.
+        batch_size: The number of review items per INSERT statement.
+    Returns:
+        The number of review items of the content.
+    """
+    batch_size = batch_size or settings.REVIEW_FANOUT_BATCH_SIZE
+    guideline_ids = applicability_index.get().for_content(content)
+    review_items = (
+        ReviewItem(content_id=content.pk, guideline_id=guideline_id)
+        for guideline_id in guideline_ids
+    )
+
+    with transaction.atomic():
+        while batch := list(islice(review_items, batch_size)):
+            # Items left by an earlier fan-out of the same content, or by a
+            # concurrent guideline back-propagation, are skipped by the unique
+            # (content, guideline) constraint.
+            ReviewItem.objects.bulk_create(batch, batch_size=batch_size, ignore_conflicts=True)
+
+        # Skipped items are not reported by the INSERT, so the counters are
+        # recounted rather than set from the batch sizes.
+        Content.objects.filter(pk=content.pk).refresh_review_counts()
+        content.refresh_from_db(fields=REVIEW_COUNTER_FIELDS)
+
+    invalidate_content_responses(content.pk)
+    schedule_prescreen(content)
+    return content.total_reviews
+
+
+def should_defer_fan_out():
+    """
+    Returns True when the active guideline set is large enough for the review
+    fan-out to be moved off the request path. The count comes from the cached
+    applicability index, so the decision runs no query of its own.
+    """
+    threshold = settings.REVIEW_FANOUT_DEFER_THRESHOLD
+    return bool(threshold) and applicability_index.get().guideline_count > threshold
+
+
+def defer_review_items(content_id):
+    """
+    Queues the review fan-out of a content as a background task, picked up by
+    a worker once the current transaction commits.
+    """
+    enqueue('core.create_review_items', content_id=content_id)
+
+
+def schedule_guideline_backfill(guideline_id, after_id=0, delay=0):
+    """
+    Queues the creation of a guideline's missing review items for the
+    contents after `after_id`, once the current transaction commits. A full
+    backfill is not queued twice, e.g. when a guideline is created with its
+    author groups: the queued task reads the guideline's scope when it runs.
+    """
+    if after_id == 0 and Task.objects.filter(
+        name='core.backfill_guideline_reviews',
+        status=Task.StatusChoices.QUEUED,
+        payload__guideline_id=guideline_id,
+        payload__after_id=0,
+    ).exists():
+        return
+    enqueue(
+        'core.backfill_guideline_reviews',
+        run_after=timezone.now() + timedelta(seconds=delay),
+        guideline_id=guideline_id,
+        after_id=after_id,
+    )
+
+
+def backfill_guideline_reviews(guideline, after_id=0, chunk_size=None):
+    """
+    Creates the missing pending review items of a guideline for the applicable
+    contents of the next chunk in id order, with a single INSERT ... SELECT
+    that skips the contents which already have one. Only the chunk's rows are
+    locked, for the duration of one short transaction.
+    Args:
+        guideline: The Guideline to back-propagate.
+        after_id: The id of the last content of the previous chunk.
+        chunk_size: The number of contents per chunk.
+    Returns:
+        A (created review items, id of the chunk's last content) tuple. The id
+        is None once no content is left.
+    """
+    chunk_size = chunk_size or settings.GUIDELINE_BACKFILL_CHUNK_SIZE
+    contents = Content.objects.filter(pk__gt=after_id).order_by('pk')
+    last_ids = list(contents.values_list('pk', flat=True)[chunk_size - 1:chunk_size])
+    last_id = last_ids[0] if last_ids else None
+    if last_id is not None:
+        contents = contents.filter(pk__lte=last_id)
+
+    select = (
+        filter_applicable_contents(contents, guideline)
+        .order_by()
+        .annotate(
+            guideline_id=Value(guideline.pk, output_field=IntegerField()),
+            pending=Value(ReviewItem.StatusChoices.PENDING, output_field=CharField()),
+            revision=Value(1, output_field=IntegerField()),
+        )
+        .values_list('pk', 'guideline_id', 'pending', 'revision')
+    )
+    select_sql, params = select.query.sql_with_params()
+    sql = (
+        f'INSERT INTO {connection.ops.quote_name(ReviewItem._meta.db_table)} '
+        f'(content_id, guideline_id, status, revision) {select_sql} '
+        'ON CONFLICT (content_id, guideline_id) DO NOTHING RETURNING content_id'
+    )
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            content_ids = [row[0] for row in cursor.fetchall()]
+        if content_ids:
+            Content.objects.filter(pk__in=content_ids).update(
+                total_reviews=F('total_reviews') + 1,
+                pending_reviews=F('pending_reviews') + 1,
+            )
+            if guideline.pk in rule_set.get().guideline_ids:
+                enqueue_many(
+                    'core.prescreen_content',
+                    [{'content_id': content_id} for content_id in content_ids],
+                )
+            # Moves the cached detail and review status of the chunk's
+            # contents to a new version once the chunk commits.
+            invalidate_content_responses(*content_ids)
+
+    return len(content_ids), last_id
+
+
+def claim_review_items(reviewer, limit, guideline_id=None):
+    """
+    Claims up to `limit` pending review items for a reviewer, oldest first.
+    Items the reviewer already holds count towards the limit and have their
+    lease renewed. Rows locked by concurrent claims are skipped instead of
+    waited on, so reviewers never queue behind each other.
+    Args:
+        reviewer: The User claiming review items.
+        limit: The maximum number of items the reviewer holds afterwards.
+        guideline_id: Only claim items of this guideline.
+    Returns:
+        The claimed ReviewItem instances.
+    """
+    now = timezone.now()
+    pending = ReviewItem.objects.filter(status=ReviewItem.StatusChoices.PENDING)
+    if guideline_id is not None:
+        pending = pending.filter(guideline_id=guideline_id)
+    pending = pending.select_for_update(skip_locked=True).order_by('pk')
+
+    with transaction.atomic():
+        claimed_ids = list(
+            pending.filter(claimed_by=reviewer, claim_expires_at__gt=now)
+            .values_list('pk', flat=True)[:limit]
+        )
+        if len(claimed_ids) < limit:
+            claimed_ids += pending.filter(
+                Q(claimed_by__isnull=True) | Q(claim_expires_at__lte=now)
+            ).values_list('pk', flat=True)[:limit - len(claimed_ids)]
+        ReviewItem.objects.filter(pk__in=claimed_ids).update(
+            claimed_by=reviewer,
+            claim_expires_at=now + timedelta(seconds=settings.REVIEW_CLAIM_TIMEOUT),
+        )
+
+    return list(
+        ReviewItem.objects.filter(pk__in=claimed_ids).select_related('reviewer').order_by('pk')
+    )
+
+
+def release_review_items(reviewer, guideline_id=None):
+    """
+    Releases the claims a reviewer holds on pending review items.
+    Returns:
+        The number of review items released.
+    """
+    claimed = ReviewItem.objects.filter(
+        claimed_by=reviewer, status=ReviewItem.StatusChoices.PENDING
+    )
+    if guideline_id is not None:
+        claimed = claimed.filter(guideline_id=guideline_id)
+    return claimed.update(claimed_by=None, claim_expires_at=None)
@@ -0,0 +1,165 @@
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import (SearchHeadline, SearchQuery,
+                                            SearchRank, SearchVector)
+from django.db import connection
+from django.db.models import Case, F, FloatField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from core.models import Content, ContentText, Guideline
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_STOP = '</mark>'
+
+# Characters of context shown around a match by the fallback highlighter.
+_FALLBACK_CONTEXT = 60
+
+
+def full_text_search_enabled():
+    """
+    Checks whether the database supports tsvector full-text search.
+    """
+    return connection.vendor == 'postgresql'
+
+
+def search_query(text):
+    """
+    Builds the tsquery for a user supplied search string.
+    """
+    return SearchQuery(text, search_type='websearch', config=settings.SEARCH_CONFIG)
+
+
+def update_content_search_vectors(contents):
+    """
+    Recomputes the search vector of the given contents from their title and
+    extracted text in a single UPDATE. A no-op without full-text search.
+    Args:
+        contents: A queryset of Content.
+    """
+    if not full_text_search_enabled():
+        return
+    text = ContentText.objects.filter(content=OuterRef('pk')).values('text')
+    contents.update(
+        search_vector=(
+            SearchVector('title', weight='A', config=settings.SEARCH_CONFIG)
+            + SearchVector(Subquery(text), weight='B', config=settings.SEARCH_CONFIG)
+        )
+    )
+
+
+def update_guideline_search_vectors(guidelines):
+    """
+    Recomputes the search vector of the given guidelines from their title and
+    description in a single UPDATE. A no-op without full-text search.
+    Args:
+        guidelines: A queryset of Guideline.
+    """
+    if not full_text_search_enabled():
+        return
+    guidelines.update(
+        search_vector=(
+            SearchVector('title', weight='A', config=settings.SEARCH_CONFIG)
+            + SearchVector('description', weight='B', config=settings.SEARCH_CONFIG)
+        )
+    )
+
+
+def search_contents(text, limit):
+    """
+    Returns the contents best matching a search string, ranked, with a
+    highlighted excerpt of the matching text.
+    Args:
+        text: The search string.
+        limit: The maximum number of results.
+    Returns:
+        A list of dicts with the id, title, rank and headline of each content.
+    """
+    contents = Content.objects.annotate(body=F('extracted_text__text'))
+    return _search(contents, text, limit)
+
+
+def search_guidelines(text, limit):
+    """
+    Returns the guidelines best matching a search string, ranked, with a
+    highlighted excerpt of the matching description.
+    Args:
+        text: The search string.
+        limit: The maximum number of results.
+    Returns:
+        A list of dicts with the id, title, rank and headline of each guideline.
+    """
+    guidelines = Guideline.objects.annotate(body=F('description'))
+    return _search(guidelines, text, limit)
+
+
+def _search(queryset, text, limit):
+    if full_text_search_enabled():
+        query = search_query(text)
+        results = (
+            queryset.filter(search_vector=query)
+            .annotate(
+                rank=SearchRank(F('search_vector'), query),
+                headline=SearchHeadline(
+                    Coalesce('body', 'title'),
+                    query,
+                    config=settings.SEARCH_CONFIG,
+                    start_sel=HIGHLIGHT_START,
+                    stop_sel=HIGHLIGHT_STOP,
+                    max_fragments=3,
+                ),
+            )
+            .order_by('-rank', '-id')
+            .values('id', 'title', 'rank', 'headline')[:limit]
+        )
+        return list(results)
+    return _fallback_search(queryset, text, limit)
+
+
+def _fallback_search(queryset, text, limit):
+    """
+    Substring search used where tsvector is unavailable (SQLite in tests).
+    Every term must occur in one of the fields; title matches rank higher.
+    """
+    terms = re.findall(r'\w+', text.lower())
+    if not terms:
+        return []
+
+    rank = Value(0.0)
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) | Q(body__icontains=term)
+        )
+        rank = rank + Case(
+            When(title__icontains=term, then=Value(1.0)),
+            default=Value(0.4),
+            output_field=FloatField(),
+        )
+    rows = (
+        queryset.annotate(rank=rank / Value(float(len(terms))))
+        .order_by('-rank', '-id')
+        .values('id', 'title', 'rank', 'body')[:limit]
+    )
+    return [
+        {
+            'id': row['id'],
+            'title': row['title'],
+            'rank': row['rank'],
+            'headline': _highlight(row['body'] or row['title'], terms),
+        }
+        for row in rows
+    ]
+
+
+def _highlight(text, terms):
+    """
+    Returns an excerpt of the text around the first match with every term
+    occurrence wrapped in the highlight markers.
+    """
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max(match.start() - _FALLBACK_CONTEXT, 0) if match else 0
+    end = (match.end() if match else 0) + _FALLBACK_CONTEXT
+    return pattern.sub(
+        lambda found: f'{HIGHLIGHT_START}{found.group()}{HIGHLIGHT_STOP}', text[start:end]
+    )
@@ -1,22 +1,103 @@
-from os.path import splitext
+import re
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from rest_framework import serializers
 
 from core.constants import ALLOWED_EXTENSIONS
-from core.models import Content, Guideline, ReviewItem
+from core.models import (Content, ContentVersion, Guideline, ReviewItem,
+                         UploadSession)
+from core.utils import has_allowed_extension
 
+INVALID_FILE_TYPE_MESSAGE = (
+    'Invalid file type. Only images, Word documents, TXT, and PDF files are allowed.'
+)
 
-class GuidelineSerializer(serializers.ModelSerializer):
+
+class SparseFieldsetMixin:
+    """
+    Restricts the serialized fields of GET responses to the comma separated
+    names given in the `fields` query parameter.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        if request is None or request.method != 'GET':
+            return
+
+        # Plain Django requests, as served by the async views, have no query_params.
+        query_params = getattr(request, 'query_params', request.GET)
+        requested_fields = query_params.get('fields')
+        if not requested_fields:
+            return
+
+        requested_fields = {name.strip() for name in requested_fields.split(',')}
+        for field_name in set(self.fields) - requested_fields:
+            self.fields.pop(field_name)
+
+
+class GuidelineSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Guideline model.
     """
+    forbidden_phrases = serializers.ListField(
+        child=serializers.CharField(), required=False
+    )
+    forbidden_patterns = serializers.ListField(
+        child=serializers.CharField(), required=False
+    )
+    required_phrases = serializers.ListField(
+        child=serializers.CharField(), required=False
+    )
+    file_types = serializers.ListField(
+        child=serializers.CharField(), required=False
+    )
+
     class Meta:
         model = Guideline
-        fields = '__all__'
+        exclude = ('search_vector',)
+
+    def validate_file_types(self, file_types):
+        """
+        Normalizes file types to lowercase extensions with a leading dot and
+        validates them against the allowed extensions.
+        """
+        normalized = []
+        for file_type in file_types:
+            extension = '.' + file_type.strip().lower().lstrip('.')
+            if extension not in ALLOWED_EXTENSIONS:
+                raise ValidationError(
+                    f"Unsupported file type '{file_type}'. "
+                    f"Expected one of {', '.join(ALLOWED_EXTENSIONS)}."
+                )
+            if extension not in normalized:
+                normalized.append(extension)
+        return normalized
+
+    def validate(self, attrs):
+        """
+        Validates that the applicability date range is not empty.
+        """
+        active_from = attrs.get('active_from', getattr(self.instance, 'active_from', None))
+        active_until = attrs.get('active_until', getattr(self.instance, 'active_until', None))
+        if active_from and active_until and active_until <= active_from:
+            raise ValidationError('active_until must be later than active_from.')
+        return attrs
+
+    def validate_forbidden_patterns(self, patterns):
+        """
+        Validates that every forbidden pattern is a valid regular expression.
+        """
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as error:
+                raise ValidationError(f"Invalid pattern '{pattern}': {error}.")
+        return patterns
 
 
-class ContentSerializer(serializers.ModelSerializer):
+class ContentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Content model.
     """
@@ -38,13 +119,8 @@ class ContentSerializer(serializers.ModelSerializer):
         """
         Validates the file extension of the uploaded file.
         """
-        _, extension = splitext(file.name)
-        extension = extension.lower()
-
-        if extension not in ALLOWED_EXTENSIONS:
-            raise ValidationError(
-                'Invalid file type. Only images, Word documents, TXT, and PDF files are allowed.'
-            )
+        if not has_allowed_extension(file.name):
+            raise ValidationError(INVALID_FILE_TYPE_MESSAGE)
         return file
 
     def get_review_status(self, obj):
@@ -54,11 +130,46 @@ class ContentSerializer(serializers.ModelSerializer):
         return obj.review_status
 
 
+class CachedGuidelineField(serializers.Field):
+    """
+    Read-only field serializing the guideline of a ReviewItem. When the
+    serializer context holds a `guideline_map` the guideline is served from it
+    instead of being loaded from the database.
+    """
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, review_item):
+        guideline_map = self.context.get('guideline_map')
+        if guideline_map is not None and review_item.guideline_id in guideline_map:
+            return guideline_map[review_item.guideline_id]
+        return GuidelineSerializer(review_item.guideline).data
+
+
+class ContentVersionSerializer(serializers.ModelSerializer):
+    """
+    Serializer for ContentVersion model.
+    """
+    stored_as = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ContentVersion
+        fields = ('version', 'size', 'digest', 'stored_as', 'created_at')
+
+    def get_stored_as(self, obj):
+        """
+        Returns whether the revision is stored as a full file or as a delta.
+        """
+        return 'file' if obj.file else 'delta'
+
+
 class ReviewItemSerializer(serializers.ModelSerializer):
     """
     Serializer for ReviewItem model.
     """
-    guideline = GuidelineSerializer(read_only=True)
+    guideline = CachedGuidelineField()
     status_choices = [
         ('PENDING', 'Pending'),
         ('PASS', 'Passed'),
@@ -69,7 +180,8 @@ class ReviewItemSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ReviewItem
-        fields = ('id', 'guideline', 'status', 'reviewer', 'reviewed_at')
+        fields = ('id', 'guideline', 'status', 'reviewer', 'reviewed_at', 'evidence', 'revision')
+        read_only_fields = ('evidence', 'revision')
 
     def get_reviewer(self, obj):
         """
@@ -79,3 +191,87 @@ class ReviewItemSerializer(serializers.ModelSerializer):
             return obj.reviewer.get_full_name()
         else:
             return None
+
+
+class ClaimedReviewItemSerializer(ReviewItemSerializer):
+    """
+    Serializer for a ReviewItem handed out by the review queue.
+    """
+    class Meta(ReviewItemSerializer.Meta):
+        fields = (*ReviewItemSerializer.Meta.fields, 'content', 'claim_expires_at')
+
+
+class ReviewQueueSerializer(serializers.Serializer):
+    """
+    Serializer for the parameters of a review queue claim.
+    """
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.REVIEW_CLAIM_MAX_ITEMS, default=10
+    )
+    guideline = serializers.IntegerField(required=False)
+
+
+class ReviewItemBulkUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for one entry of a bulk review submission.
+    """
+    review_item_id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=ReviewItem.StatusChoices.choices)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Serializer for UploadSession model.
+    """
+    class Meta:
+        model = UploadSession
+        read_only_fields = ('id', 'offset', 'created_at')
+        fields = (*read_only_fields, 'title', 'filename', 'size')
+
+    def validate_filename(self, filename):
+        """
+        Validates the file extension of the file to be uploaded.
+        """
+        if not has_allowed_extension(filename):
+            raise ValidationError(INVALID_FILE_TYPE_MESSAGE)
+        return filename
+
+
+class UploadCompleteSerializer(serializers.Serializer):
+    """
+    Serializer for finalizing an UploadSession.
+    """
+    sha256 = serializers.RegexField(r'^[0-9a-fA-F]{64}$')
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of a search.
+    """
+    q = serializers.CharField(max_length=500)
+    type = serializers.ChoiceField(choices=('contents', 'guidelines'), required=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.SEARCH_MAX_RESULTS, default=20
+    )
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """
+    Serializer for one ranked search result.
+    """
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    rank = serializers.FloatField()
+    headline = serializers.CharField()
+
+
+class ReviewStatsSerializer(serializers.Serializer):
+    """
+    Serializer for the review counts of one dashboard group.
+    """
+    key = serializers.CharField()
+    label = serializers.CharField()
+    total = serializers.IntegerField()
+    passed = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    pending = serializers.IntegerField()
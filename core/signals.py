@@ -1,7 +1,22 @@
-from django.db.models.signals import post_save
+from django.db.backends.signals import connection_created
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete, pre_save)
 from django.dispatch import receiver
 
-from core.models import Content, Guideline, ReviewItem
+from core.cache import (invalidate_content_responses,
+                        invalidate_guideline_caches, invalidate_responses)
+from core.extraction import schedule_extraction
+from core.metrics import record_query
+from core.models import Content, ContentVersion, Guideline, ReviewItem
+from core.reviews import (create_review_items, defer_review_items,
+                          schedule_guideline_backfill, should_defer_fan_out)
+from core.search import (update_content_search_vectors,
+                         update_guideline_search_vectors)
+from core.storage import release_file
+from core.versioning import record_version
+
+# Guideline fields deciding which contents a guideline applies to.
+_GUIDELINE_SCOPE_FIELDS = ('is_active', 'file_types', 'active_from', 'active_until')
 
 
 @receiver(post_save, sender=Content)
@@ -10,6 +25,160 @@ def create_review(sender, instance, created, **kwargs):
     Create ReviewItem instances for each Guideline when a Content is created.
     """
     if created:
-        content = instance
-        for guideline in Guideline.objects.all():
-            ReviewItem.objects.create(content=content, guideline=guideline)
+        if should_defer_fan_out():
+            defer_review_items(instance.pk)
+        else:
+            create_review_items(instance)
+
+
+@receiver(post_save, sender=Content)
+def record_initial_version(sender, instance, created, **kwargs):
+    """
+    Record the first ContentVersion when a Content is created.
+    """
+    if created:
+        record_version(instance)
+
+
+@receiver(post_save, sender=Content)
+def extract_initial_text(sender, instance, created, **kwargs):
+    """
+    Queue the text extraction of a newly created Content.
+    """
+    if created:
+        schedule_extraction(instance)
+
+
+@receiver(post_save, sender=Content)
+def index_content(sender, instance, **kwargs):
+    """
+    Refresh the search vector of a saved Content.
+    """
+    update_content_search_vectors(Content.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Content)
+def release_content_file(sender, instance, **kwargs):
+    """
+    Drop the reference a deleted Content held on its stored file.
+    """
+    release_file(instance.file.storage, instance.file.name)
+
+
+@receiver(post_save, sender=Content)
+@receiver(post_delete, sender=Content)
+def invalidate_content(sender, instance, **kwargs):
+    """
+    Drop the cached responses of a Content whenever it is written.
+    """
+    invalidate_content_responses(instance.pk)
+
+
+@receiver(post_save, sender=ReviewItem)
+@receiver(post_delete, sender=ReviewItem)
+def invalidate_review_item_content(sender, instance, **kwargs):
+    """
+    Drop the cached responses of the Content a ReviewItem belongs to.
+    """
+    invalidate_content_responses(instance.content_id)
+
+
+@receiver(post_delete, sender=ContentVersion)
+def release_version_files(sender, instance, **kwargs):
+    """
+    Drop the references a deleted ContentVersion held on its stored files.
+    """
+    release_file(instance.file.storage, instance.file.name)
+    release_file(instance.delta.storage, instance.delta.name)
+
+
+@receiver(post_save, sender=Guideline)
+def index_guideline(sender, instance, **kwargs):
+    """
+    Refresh the search vector of a saved Guideline.
+    """
+    update_guideline_search_vectors(Guideline.objects.filter(pk=instance.pk))
+
+
+@receiver(pre_save, sender=Guideline)
+def remember_guideline_scope(sender, instance, **kwargs):
+    """
+    Remember the activity and applicability scope of an existing Guideline
+    before this save.
+    """
+    if not instance._state.adding:
+        instance._previous_scope = (
+            Guideline.objects.filter(pk=instance.pk).values(*_GUIDELINE_SCOPE_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Guideline)
+def backfill_guideline(sender, instance, created, **kwargs):
+    """
+    Queue the review items of existing contents for a Guideline that was
+    added, reactivated or rescoped.
+    """
+    if not instance.is_active:
+        return
+    previous = getattr(instance, '_previous_scope', None)
+    if created or (previous is not None and any(
+        previous[field] != getattr(instance, field) for field in _GUIDELINE_SCOPE_FIELDS
+    )):
+        schedule_guideline_backfill(instance.pk)
+
+
+@receiver(m2m_changed, sender=Guideline.author_groups.through)
+def rescope_guideline(sender, instance, action, reverse, **kwargs):
+    """
+    Drop the guideline caches when the author groups of a Guideline change,
+    and queue the review items of the contents it now applies to.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    invalidate_guideline_caches()
+    invalidate_responses('guidelines')
+    if not reverse and instance.is_active:
+        schedule_guideline_backfill(instance.pk)
+
+
+@receiver(post_save, sender=Guideline)
+@receiver(post_delete, sender=Guideline)
+def invalidate_guidelines(sender, instance, **kwargs):
+    """
+    Drop the in-process guideline caches and cached guideline responses
+    whenever a Guideline is written.
+    """
+    invalidate_guideline_caches()
+    invalidate_responses('guidelines')
+
+
+@receiver(pre_delete, sender=Guideline)
+def collect_guideline_contents(sender, instance, **kwargs):
+    """
+    Remember which contents lose a review item when a Guideline is deleted.
+    """
+    instance._affected_content_ids = list(
+        ReviewItem.objects.filter(guideline=instance)
+        .values_list('content_id', flat=True)
+        .distinct()
+    )
+
+
+@receiver(post_delete, sender=Guideline)
+def refresh_guideline_contents(sender, instance, **kwargs):
+    """
+    Recompute the review counters of the contents affected by a deleted Guideline.
+    """
+    content_ids = getattr(instance, '_affected_content_ids', [])
+    if content_ids:
+        Content.objects.filter(pk__in=content_ids).refresh_review_counts()
+        invalidate_content_responses(*content_ids)
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    """
+    Count the queries of every database connection in the request metrics.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
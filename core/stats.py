@@ -0,0 +1,111 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.models import Content, ReviewItem, ReviewStatsSummary
+
+STATS_DIMENSIONS = ('guideline', 'author', 'day')
+
+COUNT_FIELDS = ('total', 'passed', 'failed', 'pending')
+
+
+def _guideline_rows():
+    """
+    Counts review items by status per guideline in one grouped query.
+    """
+    return (
+        ReviewItem.objects.values(key=F('guideline_id'), label=F('guideline__title'))
+        .annotate(
+            total=Count('pk'),
+            passed=Count('pk', filter=Q(status=ReviewItem.StatusChoices.PASSED)),
+            failed=Count('pk', filter=Q(status=ReviewItem.StatusChoices.FAILED)),
+            pending=Count('pk', filter=Q(status=ReviewItem.StatusChoices.PENDING)),
+        )
+        .order_by('key')
+    )
+
+
+def _content_rows(key, label):
+    """
+    Sums the review counters stored on Content per group in one grouped query,
+    without touching the review items.
+    """
+    return (
+        Content.objects.values(key=key, label=label)
+        .annotate(
+            total=Sum('total_reviews'),
+            passed=Sum('passed_reviews'),
+            failed=Sum('failed_reviews'),
+            pending=Sum('pending_reviews'),
+        )
+        .order_by('key')
+    )
+
+
+def live_stats(dimension):
+    """
+    Computes the review counts of a dashboard dimension from the live tables.
+    Args:
+        dimension: One of STATS_DIMENSIONS.
+    Returns:
+        A list of dicts with the key, label and review counts of each group.
+    """
+    if dimension == 'guideline':
+        rows = _guideline_rows()
+    elif dimension == 'author':
+        rows = _content_rows(F('author_id'), F('author__username'))
+    else:
+        rows = _content_rows(TruncDate('created_at'), TruncDate('created_at'))
+    return [
+        {
+            'key': str(row['key']),
+            'label': str(row['label']),
+            **{field: row[field] or 0 for field in COUNT_FIELDS},
+        }
+        for row in rows
+    ]
+
+
+def summary_stats(dimension):
+    """
+    Returns the review counts of a dashboard dimension from the summary table.
+    """
+    return list(
+        ReviewStatsSummary.objects.filter(dimension=dimension)
+        .order_by('pk')
+        .values('key', 'label', *COUNT_FIELDS)
+    )
+
+
+def review_stats(dimensions):
+    """
+    Returns the review counts of the given dashboard dimensions, read from the
+    summary table when REVIEW_STATS_FROM_SUMMARY is set.
+    """
+    if settings.REVIEW_STATS_FROM_SUMMARY:
+        summary = ReviewStatsSummary.objects.order_by('refreshed_at').first()
+        stats = {dimension: summary_stats(dimension) for dimension in dimensions}
+        stats['refreshed_at'] = summary.refreshed_at if summary else None
+        return stats
+    return {dimension: live_stats(dimension) for dimension in dimensions}
+
+
+def refresh_review_stats_summary():
+    """
+    Rebuilds the summary table from the live tables in one transaction, so
+    readers see either the previous or the new snapshot.
+    Returns:
+        The number of summary rows written.
+    """
+    refreshed_at = timezone.now()
+    summaries = [
+        ReviewStatsSummary(dimension=dimension, refreshed_at=refreshed_at, **row)
+        for dimension in STATS_DIMENSIONS
+        for row in live_stats(dimension)
+    ]
+    with transaction.atomic():
+        ReviewStatsSummary.objects.all().delete()
+        ReviewStatsSummary.objects.bulk_create(summaries, batch_size=1000)
+    return len(summaries)
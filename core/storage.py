@@ -0,0 +1,147 @@
+import hashlib
+import os
+from functools import partial
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that keeps a single copy of every distinct upload under
+    the SHA-256 digest of its bytes. Each save takes a reference on the blob and
+    release() drops it, deleting the file once nothing refers to it anymore.
+    """
+    def _save(self, name, content):
+        from core.models import StoredBlob
+
+        _, extension = os.path.splitext(name)
+        digest = getattr(content, 'sha256', None) or file_digest(content)
+        blob_name = self.blob_name(digest, extension)
+
+        # The blob row stays locked until the file is known to be present and
+        # referenced, so a concurrent release cannot delete it in between.
+        with transaction.atomic():
+            blob = self._lock_blob(blob_name, digest, content.size)
+            # Uploads hashed by HashingUploadHandler never touch the blob
+            # store again when their digest is already present.
+            if not self.exists(blob_name):
+                temp_name = super()._save(f'{blob_name}.{uuid4().hex}.part', content)
+                os.replace(self.path(temp_name), self.path(blob_name))
+            StoredBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+        return blob_name
+
+    def blob_name(self, digest, extension):
+        """
+        Returns the storage name of the blob with the given digest.
+        """
+        return os.path.join('blobs', digest[:2], digest[2:4], f'{digest}{extension.lower()}')
+
+    def retain(self, name):
+        """
+        Takes one more reference on an already stored blob.
+        """
+        from core.models import StoredBlob
+
+        StoredBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1)
+
+    def release(self, name):
+        """
+        Drops one reference to the blob. The file is deleted once the release
+        commits, if nothing took a new reference in the meantime.
+        """
+        from core.models import StoredBlob
+
+        with transaction.atomic():
+            blob = StoredBlob.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                return
+            StoredBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') - 1)
+            if blob.ref_count <= 1:
+                transaction.on_commit(partial(self._collect, name))
+
+    def _collect(self, name):
+        """
+        Deletes an unreferenced blob and its row while holding the row lock.
+        """
+        from core.models import StoredBlob
+
+        with transaction.atomic():
+            blob = StoredBlob.objects.select_for_update().filter(
+                name=name, ref_count__lte=0
+            ).first()
+            if blob is not None:
+                blob.delete()
+                self.delete(name)
+
+    def _lock_blob(self, name, digest, size):
+        """
+        Returns the row of a blob locked until the current transaction ends,
+        creating it without references when it does not exist yet.
+        """
+        from core.models import StoredBlob
+
+        while True:
+            blob = StoredBlob.objects.select_for_update().filter(name=name).first()
+            if blob is not None:
+                return blob
+            try:
+                with transaction.atomic():
+                    return StoredBlob.objects.create(
+                        name=name, digest=digest, size=size, ref_count=0
+                    )
+            except IntegrityError:
+                # Another save created the row first; lock that one instead.
+                continue
+
+
+def file_digest(content):
+    """
+    Returns the hex SHA-256 digest of a Django File, read chunk by chunk.
+    """
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def select_content_storage():
+    """
+    Returns the storage used for Content files.
+    """
+    if settings.CONTENT_ADDRESSED_STORAGE:
+        return ContentAddressedStorage()
+    return default_storage
+
+
+def retain_file(storage, name):
+    """
+    Takes a reference on a stored file for a new holder when content-addressed
+    storage is enabled.
+    """
+    if name and isinstance(storage, ContentAddressedStorage):
+        storage.retain(name)
+
+
+def release_file(storage, name):
+    """
+    Releases the reference a Content held on a stored file when content-addressed
+    storage is enabled. Plain storages keep the file untouched.
+    """
+    if name and isinstance(storage, ContentAddressedStorage):
+        storage.release(name)
+
+
+def discard_unsaved_file(storage, name):
+    """
+    Drops a file stored for a Content whose database write was rolled back.
+    """
+    if not name:
+        return
+    if isinstance(storage, ContentAddressedStorage):
+        storage.release(name)
+    else:
+        storage.delete(name)
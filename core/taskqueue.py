@@ -0,0 +1,207 @@
+import logging
+import time
+import traceback
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.models import Task
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+def task(name, max_attempts=3):
+    """
+    Registers a function as a background task under the given name.
+    Args:
+        name: The name used to enqueue the task.
+        max_attempts: How many times the task is tried before it is failed.
+    """
+    def decorator(function):
+        function.task_name = name
+        function.max_attempts = max_attempts
+        _registry[name] = function
+        return function
+
+    return decorator
+
+
+def enqueue(name, run_after=None, **payload):
+    """
+    Queues a registered task. The task row is written in the current
+    transaction, so workers only see it once the caller commits.
+    Args:
+        name: The name of the registered task.
+        run_after: The earliest time the task may run, defaults to now.
+        **payload: JSON serializable keyword arguments for the task.
+    Returns:
+        The created Task instance.
+    """
+    function = _registry[name]
+    queued_task = Task.objects.create(
+        name=name,
+        payload=payload,
+        max_attempts=function.max_attempts,
+        run_after=run_after or timezone.now(),
+    )
+    if settings.TASK_QUEUE_EAGER:
+        transaction.on_commit(partial(_run_eagerly, queued_task.pk))
+    return queued_task
+
+
+def enqueue_many(name, payloads):
+    """
+    Queues a registered task once per payload with a single INSERT, in the
+    current transaction like enqueue().
+    Args:
+        name: The name of the registered task.
+        payloads: A list of JSON serializable keyword argument dicts.
+    Returns:
+        The created Task instances.
+    """
+    function = _registry[name]
+    queued_tasks = Task.objects.bulk_create(
+        Task(name=name, payload=payload, max_attempts=function.max_attempts)
+        for payload in payloads
+    )
+    if settings.TASK_QUEUE_EAGER:
+        for queued_task in queued_tasks:
+            transaction.on_commit(partial(_run_eagerly, queued_task.pk))
+    return queued_tasks
+
+
+def claim_tasks(worker_id, limit):
+    """
+    Claims up to `limit` runnable tasks for a worker. Rows locked by other
+    workers are skipped, and running tasks whose lease expired are reclaimed
+    while they have attempts left. The others, e.g. tasks that kept killing
+    their worker, are failed.
+    Returns:
+        The claimed Task instances.
+    """
+    now = timezone.now()
+    lease_expired = now - timedelta(seconds=settings.TASK_LEASE_TIMEOUT)
+    with transaction.atomic():
+        Task.objects.filter(
+            status=Task.StatusChoices.RUNNING,
+            locked_at__lt=lease_expired,
+            attempts__gte=F('max_attempts'),
+        ).update(
+            status=Task.StatusChoices.FAILED,
+            locked_by='',
+            locked_at=None,
+            finished_at=now,
+            last_error='Lease expired on the last attempt.',
+        )
+        claimed = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Task.StatusChoices.QUEUED, run_after__lte=now)
+                | Q(
+                    status=Task.StatusChoices.RUNNING,
+                    locked_at__lt=lease_expired,
+                    attempts__lt=F('max_attempts'),
+                )
+            )
+            .order_by('run_after', 'pk')[:limit]
+        )
+        Task.objects.filter(pk__in=[claimed_task.pk for claimed_task in claimed]).update(
+            status=Task.StatusChoices.RUNNING,
+            locked_by=worker_id,
+            locked_at=now,
+            started_at=now,
+            attempts=F('attempts') + 1,
+        )
+
+    for claimed_task in claimed:
+        claimed_task.status = Task.StatusChoices.RUNNING
+        claimed_task.locked_by = worker_id
+        claimed_task.attempts += 1
+    return claimed
+
+
+def run_task(claimed_task):
+    """
+    Executes a claimed task, recording its duration and outcome. Failed tasks
+    are retried with exponential backoff until max_attempts is reached. The
+    outcome is only recorded while the task is still locked by the worker
+    that claimed it, so a worker whose lease expired and was reclaimed does
+    not overwrite the new owner's run.
+    """
+    started = time.perf_counter()
+    try:
+        _registry[claimed_task.name](**claimed_task.payload)
+    except Exception:
+        logger.exception('Task %s (%s) failed', claimed_task.pk, claimed_task.name)
+        if claimed_task.attempts < claimed_task.max_attempts:
+            delay = settings.TASK_RETRY_DELAY * 2 ** (claimed_task.attempts - 1)
+            status = Task.StatusChoices.QUEUED
+            run_after = timezone.now() + timedelta(seconds=delay)
+        else:
+            status = Task.StatusChoices.FAILED
+            run_after = claimed_task.run_after
+        error = traceback.format_exc()
+    else:
+        status = Task.StatusChoices.DONE
+        run_after = claimed_task.run_after
+        error = ''
+
+    duration_ms = int((time.perf_counter() - started) * 1000)
+    recorded = Task.objects.filter(pk=claimed_task.pk, locked_by=claimed_task.locked_by).update(
+        status=status,
+        run_after=run_after,
+        locked_by='',
+        locked_at=None,
+        finished_at=timezone.now(),
+        duration_ms=duration_ms,
+        last_error=error,
+    )
+    if not recorded:
+        logger.warning(
+            'Task %s (%s) was reclaimed from worker %s, its outcome was not recorded',
+            claimed_task.pk, claimed_task.name, claimed_task.locked_by,
+        )
+    return status
+
+
+def purge_tasks(older_than, batch_size=1000):
+    """
+    Deletes done and failed tasks that finished before a cutoff, in batches so
+    no single statement holds locks on a large part of the queue table.
+    Args:
+        older_than: The cutoff datetime.
+        batch_size: The maximum number of rows deleted per statement.
+    Returns:
+        The number of deleted tasks.
+    """
+    finished = Task.objects.filter(
+        status__in=[Task.StatusChoices.DONE, Task.StatusChoices.FAILED],
+        finished_at__lt=older_than,
+    )
+    deleted = 0
+    while True:
+        batch = list(finished.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not batch:
+            return deleted
+        deleted += Task.objects.filter(pk__in=batch).delete()[0]
+
+
+def _run_eagerly(task_id):
+    """
+    Runs a queued task in the current process, used when TASK_QUEUE_EAGER is set.
+    """
+    now = timezone.now()
+    Task.objects.filter(pk=task_id).update(
+        status=Task.StatusChoices.RUNNING,
+        locked_by='eager',
+        locked_at=now,
+        started_at=now,
+        attempts=F('attempts') + 1,
+    )
+    run_task(Task.objects.get(pk=task_id))
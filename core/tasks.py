@@ -0,0 +1,69 @@
+from django.conf import settings
+
+from core.extraction import extract_content_text
+from core.models import Content, ContentVersion, Guideline
+from core.prescreen import prescreen_content
+from core.reviews import (backfill_guideline_reviews, create_review_items,
+                          schedule_guideline_backfill)
+from core.taskqueue import task
+from core.versioning import compact_version
+
+
+@task('core.create_review_items')
+def create_review_items_task(content_id):
+    """
+    Fans out the review items of a content whose upload deferred it. Items a
+    guideline back-propagation already created are skipped by the fan-out.
+    """
+    content = Content.objects.filter(pk=content_id).first()
+    if content is not None:
+        create_review_items(content)
+
+
+@task('core.prescreen_content')
+def prescreen_content_task(content_id):
+    """
+    Runs the rule-based pre-screening of an uploaded content.
+    """
+    content = Content.objects.filter(pk=content_id).first()
+    if content is not None:
+        prescreen_content(content)
+
+
+@task('core.extract_content_text')
+def extract_content_text_task(content_id):
+    """
+    Extracts the text of a content's current file.
+    """
+    content = Content.objects.filter(pk=content_id).first()
+    if content is not None:
+        extract_content_text(content)
+
+
+@task('core.backfill_guideline_reviews')
+def backfill_guideline_reviews_task(guideline_id, after_id=0):
+    """
+    Back-propagates a guideline to one chunk of existing contents, then queues
+    the next chunk after GUIDELINE_BACKFILL_DELAY seconds. A chunk that failed
+    or whose worker went away is simply run again.
+    """
+    guideline = Guideline.objects.filter(pk=guideline_id, is_active=True).first()
+    if guideline is None:
+        return
+    _, last_id = backfill_guideline_reviews(guideline, after_id)
+    if last_id is not None:
+        schedule_guideline_backfill(
+            guideline_id, after_id=last_id, delay=settings.GUIDELINE_BACKFILL_DELAY
+        )
+
+
+@task('core.compact_content_version')
+def compact_content_version_task(version_id, newer_version_id):
+    """
+    Stores a revision as a delta against the next one where that pays off.
+    """
+    versions = ContentVersion.objects.select_related('content').in_bulk(
+        [version_id, newer_version_id]
+    )
+    if version_id in versions and newer_version_id in versions:
+        compact_version(versions[version_id], versions[newer_version_id])
@@ -1,13 +1,58 @@
+import csv
+import hashlib
+import json
+import os
 import tempfile
-
-from django.contrib.auth.models import User
-from django.test import TestCase
+import unittest
+import zipfile
+from io import BytesIO, StringIO
+
+from django.conf import settings
+from django.contrib.auth.models import Group, User
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.test import AsyncClient, override_settings
+from django.test import TestCase as DjangoTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
-
-from core.models import Content, Guideline, ReviewItem
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.applicability import ApplicabilityIndex, applicability_index
+from core.benchmarks import (SCENARIOS, TRANSPORTS, compare_to_baseline,
+                             delete_benchmark_data, generate_dataset,
+                             run_scenario)
+from core.cache import invalidate_content_responses, invalidate_guideline_caches
+from core.delta import apply_delta, make_delta
+from core.export import iter_export
+from core.extraction import TextNormalizer, extract_content_text
+from core.metrics import Series, registry
+from core.models import (Content, ContentText, Guideline, ReviewItem,
+                         ReviewStatsSummary, StoredBlob, Task, UploadSession)
+from core.prescreen import RuleSet, rule_set
+from core.reviews import backfill_guideline_reviews, create_review_items
 from core.serializers import GuidelineSerializer, ReviewItemSerializer
+from core.storage import ContentAddressedStorage
+from core.taskqueue import claim_tasks, enqueue, run_task, task
+
+
+class TestCase(DjangoTestCase):
+    """
+    Drops the in-process guideline caches and the response cache before every
+    test: the writes of the previous test were rolled back without sending
+    any signal, and its invalidations never committed.
+    """
+    def run(self, result=None):
+        invalidate_guideline_caches()
+        caches[settings.RESPONSE_CACHE_ALIAS].clear()
+        return super().run(result)
 
 
 class GuidelineViewSetTestCase(TestCase):
@@ -45,10 +90,73 @@ class GuidelineViewSetTestCase(TestCase):
         Test case for listing guidelines.
         """
         response = self.client.get(reverse('guideline-list'))
-        guidelines = Guideline.objects.all()
+        guidelines = Guideline.objects.order_by('-created_at', '-id')
         serializer = GuidelineSerializer(guidelines, many=True)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
+
+    def test_list_guidelines_paginated_with_cursor(self):
+        """
+        Test case for walking the guideline list with cursor pagination.
+        """
+        response = self.client.get(reverse('guideline-list'), {'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], self.guideline2.id)
+        self.assertIsNone(response.data['previous'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], self.guideline1.id)
+        self.assertIsNone(response.data['next'])
+
+    def test_cursor_pages_rows_sharing_created_at(self):
+        """
+        Test case for paging forward and back through rows with the same
+        created_at using the id as tie-breaker, without offsets.
+        """
+        for index in range(3):
+            Guideline.objects.create(title=f'Guideline {index + 3}', description='Description')
+        Guideline.objects.update(created_at=self.guideline1.created_at)
+        expected = list(Guideline.objects.order_by('-id').values_list('id', flat=True))
+
+        seen = []
+        url, params = reverse('guideline-list'), {'page_size': 2}
+        with CaptureQueriesContext(connection) as queries:
+            while url:
+                response = self.client.get(url, params)
+                seen.extend(guideline['id'] for guideline in response.data['results'])
+                last_page, url, params = response, response.data['next'], None
+        self.assertEqual(seen, expected)
+        self.assertFalse(any('OFFSET' in query['sql'] for query in queries))
+
+        response = self.client.get(last_page.data['previous'])
+        self.assertEqual(
+            [guideline['id'] for guideline in response.data['results']], expected[2:4]
+        )
+        response = self.client.get(response.data['previous'])
+        self.assertEqual(
+            [guideline['id'] for guideline in response.data['results']], expected[:2]
+        )
+        self.assertIsNone(response.data['previous'])
+
+    def test_list_guidelines_sparse_fieldset(self):
+        """
+        Test case for limiting the serialized guideline fields.
+        """
+        response = self.client.get(reverse('guideline-list'), {'fields': 'id,title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for guideline in response.data['results']:
+            self.assertEqual(set(guideline), {'id', 'title'})
+
+    def test_search_vector_not_exposed(self):
+        """
+        Test case for leaving the search vector out of guideline responses.
+        """
+        response = self.client.get(reverse('guideline-detail', args=[self.guideline1.id]))
+
+        self.assertNotIn('search_vector', response.data)
+        self.assertIn('title', response.data)
 
     def test_retrieve_guideline(self):
         """
@@ -135,7 +243,40 @@ class ContentListViewTestCase(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_get_content_list_sparse_fieldset(self):
+        """
+        Test case for limiting the serialized content fields.
+        """
+        url = reverse('content-list')
+        response = self.client.get(url, {'fields': 'id,review_status'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'],
+            [
+                {'id': self.content2.id, 'review_status': 'Completed'},
+                {'id': self.content1.id, 'review_status': 'Completed'},
+            ],
+        )
+
+    def test_get_content_list_query_count_is_constant(self):
+        """
+        Test case for listing contents without a per-row review status query.
+        """
+        url = reverse('content-list')
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+        for index in range(5):
+            Content.objects.create(
+                title=f'Extra Content {index}', file='extra.txt', author=self.user
+            )
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data['results']), 7)
 
     def test_get_content_list_unauthenticated(self):
         """
@@ -192,6 +333,22 @@ class ContentUploadViewTestCase(TestCase):
             Guideline.objects.count(),
         )
 
+    @override_settings(FILE_UPLOAD_HANDLERS=[
+        'core.uploadhandler.HashingMemoryFileUploadHandler',
+        'core.uploadhandler.HashingTemporaryFileUploadHandler',
+    ])
+    def test_upload_content_with_hashing_handlers(self):
+        """
+        Test case for uploading small and large files through the hashing upload handlers.
+        """
+        url = reverse('content-upload')
+        for title, size in (('Small Content', 10), ('Large Content', 3 * 1024 * 1024)):
+            upload = SimpleUploadedFile(f'{title}.txt', b'x' * size, content_type='text/plain')
+            response = self.client.post(url, {'title': title, 'file': upload}, format='multipart')
+
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(Content.objects.get(title=title).file.size, size)
+
     def test_upload_content_with_same_title(self):
         """
         Test case for uploading content with the same title.
@@ -215,6 +372,44 @@ class ContentUploadViewTestCase(TestCase):
             'Content with the same title already exists. Please choose a unique title or update existing content.',
         )
 
+    def test_upload_content_with_same_title_checked_by_constraint(self):
+        """
+        Test case for rejecting a duplicate title with a single INSERT attempt
+        and dropping the stored file.
+        """
+        Content.objects.create(
+            title='Test Content', file='testfile.txt', author=self.user
+        )
+        stored_files = set(default_storage.listdir('uploads')[1])
+
+        with self.assertNumQueries(4):
+            # Savepoint, rejected INSERT, rollback and release of the savepoint.
+            response = self.client.post(
+                reverse('content-upload'),
+                {'title': 'Test Content', 'file': SimpleUploadedFile('a.txt', b'text')},
+                format='multipart',
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(set(default_storage.listdir('uploads')[1]), stored_files)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Content.objects.create(title='Test Content', file='other.txt', author=self.user)
+
+    def test_upload_content_same_title_other_author(self):
+        """
+        Test case for titles being unique per author only.
+        """
+        other_user = User.objects.create_user(username='otheruser', password='testpassword')
+        Content.objects.create(title='Test Content', file='testfile.txt', author=other_user)
+
+        response = self.client.post(
+            reverse('content-upload'),
+            {'title': 'Test Content', 'file': SimpleUploadedFile('a.txt', b'text')},
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     def test_upload_content_invalid_data(self):
         """
         Test case for uploading content with invalid data.
@@ -296,6 +491,18 @@ class ContentDetailViewTestCase(TestCase):
         self.content1.refresh_from_db()
         self.assertEqual(self.content1.title, 'Updated Content 1')
 
+    def test_patch_content_detail_duplicate_title(self):
+        """
+        Test case for renaming content to a title the author already uses.
+        """
+        url = reverse('content-detail', kwargs={'pk': self.content1.pk})
+
+        response = self.client.patch(url, {'title': 'Content 2'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.content1.refresh_from_db()
+        self.assertEqual(self.content1.title, 'Content 1')
+
     def test_patch_content_detail_unauthorized(self):
         """
         Test case for updating content detail with unauthorized user.
@@ -362,6 +569,92 @@ class ContentReviewStatusViewTestCase(TestCase):
         ).data
         self.assertEqual(response.data, expected_data)
 
+    def test_get_review_status_query_count_is_constant(self):
+        """
+        Test case for serving review status in a constant number of queries.
+        """
+        url = reverse('content-review-status', kwargs={'content_id': self.content.pk})
+        self.review_item1.reviewer = self.user
+        self.review_item1.save()
+        self.client.get(url)
+
+        # Content existence check and review items joined with reviewers,
+        # measured with the response cache bypassed.
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_content_responses(self.content.pk)
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(8):
+                guideline = Guideline.objects.create(
+                    title=f'Extra Guideline {index}', description='Description'
+                )
+                ReviewItem.objects.create(
+                    content=self.content, guideline=guideline, reviewer=self.user
+                )
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_content_responses(self.content.pk)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data), 10)
+
+    def test_get_review_status_served_from_cache(self):
+        """
+        Test case for serving repeated reads from the response cache.
+        """
+        url = reverse('content-review-status', kwargs={'content_id': self.content.pk})
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(url)
+        self.assertEqual(cached_response.data, response.data)
+
+        self.assertNotIn('Last-Modified', cached_response)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.review_item2.status = ReviewItem.StatusChoices.FAILED
+            self.review_item2.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[1]['status'], 'FAIL')
+
+    def test_review_status_invalidated_on_commit(self):
+        """
+        Test case for keeping the cached response until the invalidating write commits.
+        """
+        url = reverse('content-review-status', kwargs={'content_id': self.content.pk})
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.review_item2.status = ReviewItem.StatusChoices.FAILED
+            self.review_item2.save()
+            with self.assertNumQueries(0):
+                self.client.get(url)
+
+        response = self.client.get(url)
+        self.assertEqual(response.data[1]['status'], 'FAIL')
+
+    def test_get_review_status_reflects_guideline_updates(self):
+        """
+        Test case for invalidating cached guidelines when a guideline changes.
+        """
+        url = reverse('content-review-status', kwargs={'content_id': self.content.pk})
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guideline1.title = 'Renamed Guideline'
+            self.guideline1.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.data[0]['guideline']['title'], 'Renamed Guideline')
+
     def test_get_review_status_nonexistent_content(self):
         """
         Test case for retrieving review status for a nonexistent content.
@@ -428,6 +721,28 @@ class ContentReviewUpdateAPIViewTestCase(TestCase):
         self.assertEqual(self.review_item1.reviewer, self.user)
         self.assertIsNotNone(self.review_item1.reviewed_at)
 
+    def test_update_review_item_updates_review_counters(self):
+        """
+        Test case for keeping the content review counters in sync on update.
+        """
+        Content.objects.filter(pk=self.content.pk).refresh_review_counts()
+
+        for review_item in (self.review_item1, self.review_item2):
+            url = reverse(
+                'content-review-update',
+                kwargs={
+                    'content_id': self.content.pk,
+                    'review_item_id': review_item.pk,
+                },
+            )
+            self.client.put(url, {'status': 'PASS'}, format='json')
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 2)
+        self.assertEqual(self.content.passed_reviews, 2)
+        self.assertEqual(self.content.pending_reviews, 0)
+        self.assertEqual(self.content.review_status, 'Completed')
+
     def test_update_review_item_nonexistent_content(self):
         """
         Test case for updating review item for a nonexistent content.
@@ -477,3 +792,2498 @@ class ContentReviewUpdateAPIViewTestCase(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('status', response.data)
+
+
+class ContentReviewCountersTestCase(TestCase):
+    """
+    Test cases for the denormalized review counters on Content.
+    """
+    def setUp(self):
+        """
+        Set up test data.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.guideline1 = Guideline.objects.create(
+            title='Guideline 1', description='Description 1'
+        )
+        self.guideline2 = Guideline.objects.create(
+            title='Guideline 2', description='Description 2'
+        )
+        self.content = Content.objects.create(
+            title='Test Content', file='testfile.txt', author=self.user
+        )
+
+    def test_counters_set_on_creation(self):
+        """
+        Test case for counters initialised by the review fan-out.
+        """
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 2)
+        self.assertEqual(self.content.pending_reviews, 2)
+        self.assertEqual(self.content.review_status, 'Pending')
+
+    def test_counters_refreshed_on_guideline_delete(self):
+        """
+        Test case for counters recomputed when a guideline is deleted.
+        """
+        self.content.review_items.filter(guideline=self.guideline1).update(
+            status=ReviewItem.StatusChoices.PASSED
+        )
+        self.guideline2.delete()
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 1)
+        self.assertEqual(self.content.passed_reviews, 1)
+        self.assertEqual(self.content.pending_reviews, 0)
+        self.assertEqual(self.content.review_status, 'Completed')
+
+    def test_refresh_review_counts_command(self):
+        """
+        Test case for repairing stale counters with the management command.
+        """
+        Content.objects.update(total_reviews=0, pending_reviews=0)
+        self.content.review_items.filter(guideline=self.guideline1).update(
+            status=ReviewItem.StatusChoices.FAILED
+        )
+
+        out = StringIO()
+        call_command('refresh_review_counts', stdout=out)
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 2)
+        self.assertEqual(self.content.failed_reviews, 1)
+        self.assertEqual(self.content.pending_reviews, 1)
+        self.assertIn('Refreshed review counters of 1 contents.', out.getvalue())
+
+
+class ReviewFanOutTestCase(TestCase):
+    """
+    Test cases for the batched ReviewItem fan-out on Content creation.
+    """
+    def setUp(self):
+        """
+        Set up test data.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        Guideline.objects.bulk_create(
+            Guideline(title=f'Guideline {index}', description='Description')
+            for index in range(5)
+        )
+
+    @override_settings(REVIEW_FANOUT_BATCH_SIZE=2)
+    def test_fan_out_uses_batched_inserts(self):
+        """
+        Test case for inserting review items in batches of the configured size.
+        """
+        content = Content.objects.bulk_create(
+            [Content(title='Test Content', file='testfile.txt', author=self.user)]
+        )[0]
+        rule_set.get()
+        applicability_index.get()
+
+        # Savepoint, three INSERT batches, locked counter recount, reload of
+        # the counters and release.
+        with self.assertNumQueries(8):
+            create_review_items(content)
+
+        self.assertEqual(content.review_items.count(), 5)
+        content.refresh_from_db()
+        self.assertEqual(content.total_reviews, 5)
+        self.assertEqual(content.pending_reviews, 5)
+
+    def test_fan_out_counts_existing_items(self):
+        """
+        Test case for counting review items skipped as conflicts by their status.
+        """
+        content = Content.objects.bulk_create(
+            [Content(title='Test Content', file='testfile.txt', author=self.user)]
+        )[0]
+        ReviewItem.objects.create(
+            content=content,
+            guideline=Guideline.objects.first(),
+            status=ReviewItem.StatusChoices.PASSED,
+        )
+
+        self.assertEqual(create_review_items(content), 5)
+
+        content.refresh_from_db()
+        self.assertEqual(content.total_reviews, 5)
+        self.assertEqual(content.pending_reviews, 4)
+        self.assertEqual(content.passed_reviews, 1)
+
+    @override_settings(REVIEW_FANOUT_DEFER_THRESHOLD=3)
+    def test_fan_out_deferred_for_large_guideline_sets(self):
+        """
+        Test case for deferring the fan-out until after the transaction commits.
+        """
+        content = Content.objects.create(
+            title='Test Content', file='testfile.txt', author=self.user
+        )
+        self.assertFalse(content.review_items.exists())
+
+        queued_task = Task.objects.get(name='core.create_review_items')
+        self.assertEqual(queued_task.payload, {'content_id': content.pk})
+
+        for claimed_task in claim_tasks('test-worker', 10):
+            run_task(claimed_task)
+
+        self.assertEqual(content.review_items.count(), 5)
+
+    @override_settings(REVIEW_FANOUT_DEFER_THRESHOLD=3)
+    def test_fan_out_not_deferred_for_inactive_guidelines(self):
+        """
+        Test case for counting only active guidelines towards the deferral threshold.
+        """
+        Guideline.objects.filter(pk__in=Guideline.objects.values('pk')[:3]).update(
+            is_active=False
+        )
+        invalidate_guideline_caches()
+
+        content = Content.objects.create(
+            title='Test Content', file='testfile.txt', author=self.user
+        )
+
+        self.assertEqual(content.review_items.count(), 2)
+        self.assertFalse(Task.objects.filter(name='core.create_review_items').exists())
+
+    @override_settings(REVIEW_FANOUT_DEFER_THRESHOLD=3)
+    def test_deferred_fan_out_after_backfill_chunk(self):
+        """
+        Test case for completing a deferred fan-out after a guideline
+        back-propagation already gave the content one review item.
+        """
+        content = Content.objects.create(
+            title='Test Content', file='testfile.txt', author=self.user
+        )
+        ReviewItem.objects.create(content=content, guideline=Guideline.objects.first())
+
+        for claimed_task in claim_tasks('test-worker', 10):
+            run_task(claimed_task)
+
+        content.refresh_from_db()
+        self.assertEqual(content.review_items.count(), 5)
+        self.assertEqual(content.total_reviews, 5)
+
+
+class ContentExportViewTestCase(TestCase):
+    """
+    Test cases for the streaming content export.
+    """
+    def setUp(self):
+        """
+        Set up test data.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.guideline1 = Guideline.objects.create(
+            title='Guideline 1', description='Description 1'
+        )
+        self.guideline2 = Guideline.objects.create(
+            title='Guideline 2', description='Description 2'
+        )
+        self.content1 = Content.objects.create(
+            title='Content 1', file='content1.txt', author=self.user
+        )
+        self.content2 = Content.objects.create(
+            title='Content 2', file='content2.txt', author=self.user
+        )
+
+    def test_export_ndjson(self):
+        """
+        Test case for exporting contents as NDJSON.
+        """
+        response = self.client.get(reverse('content-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record['id'] for record in records], [self.content1.id, self.content2.id])
+        self.assertEqual(
+            [item['guideline_title'] for item in records[0]['review_items']],
+            ['Guideline 1', 'Guideline 2'],
+        )
+
+    def test_export_csv(self):
+        """
+        Test case for exporting one CSV row per review item.
+        """
+        response = self.client.get(reverse('content-export'), {'output': 'csv'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]['title'], 'Content 1')
+        self.assertEqual(rows[0]['status'], 'PENDING')
+
+    def test_export_invalid_format(self):
+        """
+        Test case for requesting an unsupported export format.
+        """
+        response = self.client.get(reverse('content-export'), {'output': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_query_count_independent_of_rows(self):
+        """
+        Test case for fetching contents and review items per chunk, not per row.
+        """
+        with self.assertNumQueries(2):
+            list(iter_export('ndjson'))
+
+    def test_export_contents_command(self):
+        """
+        Test case for exporting contents with the management command.
+        """
+        out = StringIO()
+        call_command('export_contents', stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+
+class ReviewItemBulkUpdateViewTestCase(TestCase):
+    """
+    Test cases for the bulk review submission endpoints.
+    """
+    def setUp(self):
+        """
+        Set up test data.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.guideline1 = Guideline.objects.create(
+            title='Guideline 1', description='Description 1'
+        )
+        self.guideline2 = Guideline.objects.create(
+            title='Guideline 2', description='Description 2'
+        )
+        self.content1 = Content.objects.create(
+            title='Content 1', file='content1.txt', author=self.user
+        )
+        self.content2 = Content.objects.create(
+            title='Content 2', file='content2.txt', author=self.user
+        )
+
+    def test_bulk_update_across_contents(self):
+        """
+        Test case for updating review items of several contents at once.
+        """
+        review_items = list(ReviewItem.objects.order_by('pk'))
+        data = [
+            {'review_item_id': review_item.pk, 'status': 'PASS'}
+            for review_item in review_items
+        ]
+
+        response = self.client.put(reverse('review-bulk-update'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(all(result['updated'] for result in response.data))
+        self.assertEqual(
+            ReviewItem.objects.filter(
+                status=ReviewItem.StatusChoices.PASSED, reviewer=self.user
+            ).count(),
+            4,
+        )
+        for content in (self.content1, self.content2):
+            content.refresh_from_db()
+            self.assertEqual(content.passed_reviews, 2)
+            self.assertEqual(content.review_status, 'Completed')
+
+    def test_bulk_update_for_content_skips_other_contents(self):
+        """
+        Test case for rejecting review items that belong to another content.
+        """
+        own_item = self.content1.review_items.first()
+        other_item = self.content2.review_items.first()
+        data = [
+            {'review_item_id': own_item.pk, 'status': 'FAIL'},
+            {'review_item_id': other_item.pk, 'status': 'FAIL'},
+        ]
+        url = reverse('content-review-bulk-update', kwargs={'content_id': self.content1.pk})
+
+        response = self.client.put(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                {'review_item_id': own_item.pk, 'status': 'FAIL', 'updated': True},
+                {
+                    'review_item_id': other_item.pk,
+                    'updated': False,
+                    'error': 'No Review item matches the given query.',
+                },
+            ],
+        )
+        other_item.refresh_from_db()
+        self.assertEqual(other_item.status, ReviewItem.StatusChoices.PENDING)
+
+    def test_bulk_update_invalid_data(self):
+        """
+        Test case for rejecting the whole submission when an entry is invalid.
+        """
+        review_item = ReviewItem.objects.first()
+        data = [
+            {'review_item_id': review_item.pk, 'status': 'PASS'},
+            {'review_item_id': review_item.pk, 'status': 'INVALID_STATUS'},
+        ]
+
+        response = self.client.put(reverse('review-bulk-update'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        review_item.refresh_from_db()
+        self.assertEqual(review_item.status, ReviewItem.StatusChoices.PENDING)
+
+    def test_bulk_update_duplicate_review_items(self):
+        """
+        Test case for rejecting a review item submitted twice.
+        """
+        review_item = ReviewItem.objects.first()
+        data = [
+            {'review_item_id': review_item.pk, 'status': 'PASS'},
+            {'review_item_id': review_item.pk, 'status': 'FAIL'},
+        ]
+
+        response = self.client.put(reverse('review-bulk-update'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['error'], 'Each review item can only be submitted once.'
+        )
+
+
+class ContentAddressedStorageTestCase(TestCase):
+    """
+    Test cases for the content-addressed upload storage.
+    """
+    def setUp(self):
+        """
+        Set up a storage rooted in a temporary directory.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = ContentAddressedStorage(location=self.temp_dir.name)
+
+    def tearDown(self):
+        """
+        Remove the temporary storage directory.
+        """
+        self.temp_dir.cleanup()
+
+    def test_identical_uploads_stored_once(self):
+        """
+        Test case for deduplicating uploads with the same bytes.
+        """
+        first_name = self.storage.save('uploads/a.txt', ContentFile(b'Same content'))
+        second_name = self.storage.save('uploads/b.TXT', ContentFile(b'Same content'))
+
+        self.assertEqual(first_name, second_name)
+        self.assertTrue(first_name.startswith('blobs/'))
+        self.assertEqual(StoredBlob.objects.get(name=first_name).ref_count, 2)
+
+    def test_existing_blob_not_rewritten(self):
+        """
+        Test case for skipping the write when the uploaded digest is known.
+        """
+        name = self.storage.save('uploads/a.txt', ContentFile(b'Same content'))
+        upload = ContentFile(b'Same content')
+        upload.sha256 = name.split('/')[-1].split('.')[0]
+        # Any attempt to hash or copy the upload again would fail.
+        upload.chunks = None
+
+        self.assertEqual(self.storage.save('uploads/b.txt', upload), name)
+
+    def test_release_deletes_unreferenced_blob(self):
+        """
+        Test case for deleting a blob once its last reference is released.
+        """
+        name = self.storage.save('uploads/a.txt', ContentFile(b'Same content'))
+        self.storage.save('uploads/b.txt', ContentFile(b'Same content'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.storage.release(name)
+        self.assertTrue(self.storage.exists(name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.storage.release(name)
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(StoredBlob.objects.filter(name=name).exists())
+
+    def test_blob_saved_again_before_release_commits(self):
+        """
+        Test case for keeping a blob referenced again before its release committed.
+        """
+        name = self.storage.save('uploads/a.txt', ContentFile(b'Same content'))
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.storage.release(name)
+
+        self.assertEqual(self.storage.save('uploads/b.txt', ContentFile(b'Same content')), name)
+        for callback in callbacks:
+            callback()
+
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(StoredBlob.objects.get(name=name).ref_count, 1)
+
+    def test_missing_blob_file_written_again(self):
+        """
+        Test case for rewriting a referenced blob whose file has gone.
+        """
+        name = self.storage.save('uploads/a.txt', ContentFile(b'Same content'))
+        self.storage.delete(name)
+
+        self.storage.save('uploads/b.txt', ContentFile(b'Same content'))
+
+        with self.storage.open(name) as stored_file:
+            self.assertEqual(stored_file.read(), b'Same content')
+        self.assertEqual(StoredBlob.objects.get(name=name).ref_count, 2)
+
+
+class ChunkedUploadTestCase(TestCase):
+    """
+    Test cases for the resumable chunked upload endpoints.
+    """
+    def setUp(self):
+        """
+        Set up test environment.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(CHUNKED_UPLOAD_DIR=self.temp_dir.name)
+        self.settings_override.enable()
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+        Guideline.objects.create(title='Guideline 1', description='Description 1')
+
+        self.data = b'Chunked file content' * 100
+        response = self.client.post(
+            reverse('upload-create'),
+            {'title': 'Chunked Content', 'filename': 'chunked.txt', 'size': len(self.data)},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.upload_id = response.data['id']
+
+    def tearDown(self):
+        """
+        Restore settings and remove temporary files.
+        """
+        self.settings_override.disable()
+        self.temp_dir.cleanup()
+
+    def put_chunk(self, chunk, offset):
+        """
+        Sends one chunk of the upload starting at the given offset.
+        """
+        return self.client.put(
+            reverse('upload-detail', kwargs={'upload_id': self.upload_id}),
+            chunk,
+            content_type='application/octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_chunked_upload_success(self):
+        """
+        Test case for uploading a file in chunks and finalizing it.
+        """
+        response = self.put_chunk(self.data[:1000], 0)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['offset'], 1000)
+
+        response = self.put_chunk(self.data[1000:], 1000)
+        self.assertEqual(response.data['offset'], len(self.data))
+
+        response = self.client.post(
+            reverse('upload-complete', kwargs={'upload_id': self.upload_id}),
+            {'sha256': hashlib.sha256(self.data).hexdigest()},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        content = Content.objects.get(title='Chunked Content')
+        self.assertEqual(content.file.read(), self.data)
+        self.assertEqual(content.review_items.count(), 1)
+        self.assertEqual(response.data['review_status'], 'Pending')
+
+    def test_chunk_offset_mismatch(self):
+        """
+        Test case for rejecting a chunk that does not continue the upload.
+        """
+        self.put_chunk(self.data[:1000], 0)
+
+        response = self.put_chunk(self.data[2000:], 2000)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['offset'], 1000)
+
+    def test_oversized_chunk_leaves_upload_untouched(self):
+        """
+        Test case for rejecting a chunk past the declared size without staging leftovers.
+        """
+        self.put_chunk(self.data[:1000], 0)
+
+        response = self.put_chunk(self.data[1000:] + b'extra', 1000)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            reverse('upload-detail', kwargs={'upload_id': self.upload_id})
+        )
+        self.assertEqual(response.data['offset'], 1000)
+        self.assertEqual(
+            [name for name in os.listdir(self.temp_dir.name) if name.endswith('.chunk')], []
+        )
+        response = self.put_chunk(self.data[1000:], 1000)
+        self.assertEqual(response.data['offset'], len(self.data))
+
+    def test_complete_with_checksum_mismatch(self):
+        """
+        Test case for refusing to finalize an upload with a wrong checksum.
+        """
+        self.put_chunk(self.data, 0)
+
+        response = self.client.post(
+            reverse('upload-complete', kwargs={'upload_id': self.upload_id}),
+            {'sha256': hashlib.sha256(b'other').hexdigest()},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Checksum mismatch.')
+        self.assertFalse(Content.objects.filter(title='Chunked Content').exists())
+        self.assertFalse(UploadSession.objects.get(pk=self.upload_id).is_finalizing)
+
+    def test_upload_being_finalized_is_locked(self):
+        """
+        Test case for rejecting chunks, aborts and a second completion while
+        an upload is being finalized.
+        """
+        self.put_chunk(self.data[:1000], 0)
+        UploadSession.objects.filter(pk=self.upload_id).update(
+            offset=len(self.data), is_finalizing=True
+        )
+        url = reverse('upload-complete', kwargs={'upload_id': self.upload_id})
+
+        response = self.client.post(
+            url, {'sha256': hashlib.sha256(self.data).hexdigest()}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['error'], 'Upload is being finalized.')
+
+        response = self.put_chunk(self.data[1000:], 1000)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        response = self.client.delete(
+            reverse('upload-detail', kwargs={'upload_id': self.upload_id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertTrue(UploadSession.objects.filter(pk=self.upload_id).exists())
+
+    def test_initiate_with_non_allowed_extension(self):
+        """
+        Test case for rejecting an upload of a non-allowed file type.
+        """
+        response = self.client.post(
+            reverse('upload-create'),
+            {'title': 'Executable', 'filename': 'program.exe'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ContentVersionTestCase(TestCase):
+    """
+    Test cases for the content version history.
+    """
+    def setUp(self):
+        """
+        Set up test environment.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.text = b''.join(
+            b'Line %d of the policy document.\n' % index for index in range(500)
+        )
+        response = self.client.post(
+            reverse('content-upload'),
+            {'title': 'Policy', 'file': SimpleUploadedFile('policy.txt', self.text)},
+            format='multipart',
+        )
+        self.content = Content.objects.get(pk=response.data['id'])
+
+    def upload_revision(self, data):
+        """
+        Replaces the file of the content with a new revision.
+        """
+        url = reverse('content-detail', kwargs={'pk': self.content.pk})
+        response = self.client.patch(
+            url, {'file': SimpleUploadedFile('policy.txt', data)}, format='multipart'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.content.refresh_from_db()
+        for queued_task in Task.objects.filter(name='core.compact_content_version'):
+            run_task(queued_task)
+
+    def test_revision_compacted_outside_request(self):
+        """
+        Test case for queueing the compaction of the previous revision.
+        """
+        url = reverse('content-detail', kwargs={'pk': self.content.pk})
+        revision = SimpleUploadedFile('policy.txt', self.text + b'Appendix.\n')
+        self.client.patch(url, {'file': revision}, format='multipart')
+
+        first = self.content.versions.get(version=1)
+        self.assertTrue(first.file)
+        queued_task = Task.objects.get(name='core.compact_content_version')
+        self.assertEqual(queued_task.payload['version_id'], first.pk)
+
+        run_task(queued_task)
+        first.refresh_from_db()
+        self.assertFalse(first.file)
+        self.assertTrue(first.delta)
+
+    def test_revisions_recorded_and_compacted(self):
+        """
+        Test case for keeping older text revisions as deltas.
+        """
+        revision = self.text.replace(b'Line 250 ', b'Line two hundred and fifty ')
+        self.upload_revision(revision)
+
+        first, second = self.content.versions.order_by('version')
+        self.assertEqual(self.content.latest_version, second)
+        self.assertFalse(first.file)
+        self.assertTrue(first.delta)
+        self.assertEqual(second.file.name, self.content.file.name)
+
+        url = reverse(
+            'content-version-download',
+            kwargs={'content_id': self.content.pk, 'version': 1},
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, self.text)
+
+    def test_unchanged_revision_shares_stored_file(self):
+        """
+        Test case for deduplicating a re-upload of the same bytes.
+        """
+        first_name = self.content.file.name
+        self.upload_revision(self.text)
+
+        self.assertEqual(self.content.version, 2)
+        self.assertEqual(self.content.file.name, first_name)
+        self.assertEqual(
+            set(self.content.versions.values_list('file', flat=True)), {first_name}
+        )
+
+    def test_list_versions(self):
+        """
+        Test case for listing the revisions of a content.
+        """
+        self.upload_revision(self.text + b'Appendix.\n')
+
+        response = self.client.get(
+            reverse('content-version-list', kwargs={'content_id': self.content.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['version'] for entry in response.data], [2, 1])
+        self.assertEqual([entry['stored_as'] for entry in response.data], ['file', 'delta'])
+
+    def test_delta_round_trip(self):
+        """
+        Test case for rebuilding binary data from a delta.
+        """
+        source = bytes(range(256)) * 40
+        target = source[:3000] + b'inserted bytes' + source[3100:] + b'tail'
+
+        delta = make_delta(source, target)
+
+        self.assertEqual(apply_delta(source, delta), target)
+        self.assertLess(len(delta), len(target) // 10)
+
+
+@task('tests.record_call', max_attempts=2)
+def record_call_task(value, fail=False):
+    """
+    Task used by the task queue tests.
+    """
+    TaskQueueTestCase.calls.append(value)
+    if fail:
+        raise RuntimeError('Task failed')
+
+
+class TaskQueueTestCase(TestCase):
+    """
+    Test cases for the database backed task queue.
+    """
+    calls = []
+
+    def setUp(self):
+        """
+        Reset the recorded task calls.
+        """
+        TaskQueueTestCase.calls = []
+
+    def test_claim_and_run_task(self):
+        """
+        Test case for claiming and running a queued task.
+        """
+        queued_task = enqueue('tests.record_call', value=1)
+
+        claimed = claim_tasks('test-worker', 10)
+        self.assertEqual([claimed_task.pk for claimed_task in claimed], [queued_task.pk])
+        self.assertEqual(claim_tasks('other-worker', 10), [])
+
+        run_task(claimed[0])
+
+        queued_task.refresh_from_db()
+        self.assertEqual(queued_task.status, Task.StatusChoices.DONE)
+        self.assertEqual(queued_task.attempts, 1)
+        self.assertIsNotNone(queued_task.duration_ms)
+        self.assertEqual(self.calls, [1])
+
+    def test_failed_task_retried_then_failed(self):
+        """
+        Test case for retrying a failing task until max_attempts is reached.
+        """
+        queued_task = enqueue('tests.record_call', value=1, fail=True)
+
+        run_task(claim_tasks('test-worker', 1)[0])
+        queued_task.refresh_from_db()
+        self.assertEqual(queued_task.status, Task.StatusChoices.QUEUED)
+        self.assertIn('Task failed', queued_task.last_error)
+
+        Task.objects.filter(pk=queued_task.pk).update(run_after=queued_task.created_at)
+        run_task(claim_tasks('test-worker', 1)[0])
+        queued_task.refresh_from_db()
+        self.assertEqual(queued_task.status, Task.StatusChoices.FAILED)
+        self.assertEqual(queued_task.attempts, 2)
+
+    def test_expired_lease_reclaimed_until_attempts_exhausted(self):
+        """
+        Test case for failing a task whose worker kept dying instead of
+        reclaiming it forever.
+        """
+        queued_task = enqueue('tests.record_call', value=1)
+        expired = timezone.now() - timezone.timedelta(seconds=settings.TASK_LEASE_TIMEOUT + 1)
+
+        claim_tasks('dead-worker', 1)
+        Task.objects.filter(pk=queued_task.pk).update(locked_at=expired)
+        self.assertEqual(len(claim_tasks('test-worker', 1)), 1)
+
+        Task.objects.filter(pk=queued_task.pk).update(locked_at=expired)
+        self.assertEqual(claim_tasks('test-worker', 1), [])
+
+        queued_task.refresh_from_db()
+        self.assertEqual(queued_task.status, Task.StatusChoices.FAILED)
+        self.assertEqual(queued_task.attempts, 2)
+        self.assertEqual(self.calls, [])
+
+    def test_reclaimed_task_outcome_kept(self):
+        """
+        Test case for ignoring the outcome reported by a worker whose lease
+        expired and whose task was claimed by another worker.
+        """
+        queued_task = enqueue('tests.record_call', value=1, fail=True)
+        stale_task = claim_tasks('slow-worker', 1)[0]
+        Task.objects.filter(pk=queued_task.pk).update(
+            locked_at=timezone.now() - timezone.timedelta(seconds=settings.TASK_LEASE_TIMEOUT + 1)
+        )
+        claim_tasks('test-worker', 1)
+
+        with self.assertLogs('core.taskqueue', 'WARNING'):
+            run_task(stale_task)
+
+        queued_task.refresh_from_db()
+        self.assertEqual(queued_task.status, Task.StatusChoices.RUNNING)
+        self.assertEqual(queued_task.locked_by, 'test-worker')
+        self.assertEqual(queued_task.last_error, '')
+
+    @override_settings(TASK_QUEUE_EAGER=True)
+    def test_eager_task_runs_on_commit(self):
+        """
+        Test case for running tasks right after commit in eager mode.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            queued_task = enqueue('tests.record_call', value=2)
+            self.assertEqual(self.calls, [])
+
+        queued_task.refresh_from_db()
+        self.assertEqual(queued_task.status, Task.StatusChoices.DONE)
+        self.assertEqual(self.calls, [2])
+
+    def test_purge_tasks_deletes_old_finished_tasks(self):
+        """
+        Test case for purging done and failed tasks past the retention period.
+        """
+        old = timezone.now() - timezone.timedelta(days=settings.TASK_RETENTION_DAYS + 1)
+        old_done = enqueue('tests.record_call', value=1)
+        old_failed = enqueue('tests.record_call', value=2)
+        recent_done = enqueue('tests.record_call', value=3)
+        old_queued = enqueue('tests.record_call', value=4)
+        Task.objects.filter(pk=old_done.pk).update(status=Task.StatusChoices.DONE, finished_at=old)
+        Task.objects.filter(pk=old_failed.pk).update(status=Task.StatusChoices.FAILED, finished_at=old)
+        Task.objects.filter(pk=recent_done.pk).update(
+            status=Task.StatusChoices.DONE, finished_at=timezone.now()
+        )
+        Task.objects.filter(pk=old_queued.pk).update(finished_at=old)
+
+        out = StringIO()
+        call_command('purge_tasks', stdout=out)
+
+        self.assertIn('Deleted 2 tasks.', out.getvalue())
+        self.assertEqual(
+            set(Task.objects.values_list('pk', flat=True)), {recent_done.pk, old_queued.pk}
+        )
+
+
+class PrescreenTestCase(TestCase):
+    """
+    Test cases for the rule-based pre-screening engine.
+    """
+    def setUp(self):
+        """
+        Set up guidelines with rules.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.claims = Guideline.objects.create(
+            title='No guaranteed returns',
+            description='Marketing must not promise returns.',
+            forbidden_phrases=['guaranteed returns', 'risk free'],
+            forbidden_patterns=[r'\d+% (?:profit|return)'],
+        )
+        self.disclaimer = Guideline.objects.create(
+            title='Risk disclaimer',
+            description='Documents must carry the risk disclaimer.',
+            required_phrases=['capital at risk'],
+        )
+        self.tone = Guideline.objects.create(
+            title='Tone of voice', description='Reviewed by a human.'
+        )
+
+    def test_scan_reports_matches_and_missing_phrases(self):
+        """
+        Test case for deciding guidelines with evidence in a single scan.
+        """
+        text = 'Enjoy GUARANTEED returns and a 12% profit every year.'
+
+        results = RuleSet(Guideline.objects.all()).scan(text)
+
+        self.assertEqual(set(results), {self.claims.pk, self.disclaimer.pk})
+        status, evidence = results[self.claims.pk]
+        self.assertEqual(status, ReviewItem.StatusChoices.FAILED)
+        self.assertEqual(
+            evidence,
+            [
+                {'rule': 'forbidden_phrase', 'value': 'guaranteed returns', 'offset': 6},
+                {'rule': 'forbidden_pattern', 'value': r'\d+% (?:profit|return)', 'offset': 31},
+            ],
+        )
+        self.assertEqual(
+            results[self.disclaimer.pk],
+            (
+                ReviewItem.StatusChoices.FAILED,
+                [{'rule': 'required_phrase', 'value': 'capital at risk', 'found': False}],
+            ),
+        )
+
+    def test_scan_ignores_partial_words(self):
+        """
+        Test case for passing documents where phrases only occur inside words.
+        """
+        text = 'Our risk freedom plan. Capital at risk.'
+
+        results = RuleSet(Guideline.objects.all()).scan(text)
+
+        self.assertEqual(results[self.claims.pk], (ReviewItem.StatusChoices.PASSED, []))
+        self.assertEqual(results[self.disclaimer.pk], (ReviewItem.StatusChoices.PASSED, []))
+
+    def test_overlapping_patterns_reported_for_each_guideline(self):
+        """
+        Test case for patterns of different guidelines matching at one position.
+        """
+        other = Guideline.objects.create(
+            title='Free offers', description='No free offers.', forbidden_patterns=['free']
+        )
+        wider = Guideline.objects.create(
+            title='Free money', description='No free money.', forbidden_patterns=['free money']
+        )
+
+        results = RuleSet(Guideline.objects.all()).scan('Get free money now.')
+
+        self.assertEqual(results[other.pk][0], ReviewItem.StatusChoices.FAILED)
+        self.assertEqual(results[wider.pk][0], ReviewItem.StatusChoices.FAILED)
+
+    def test_patterns_with_inline_flags_run_alone(self):
+        """
+        Test case for building the rule set when patterns carry inline global flags.
+        """
+        secret = Guideline.objects.create(
+            title='Secrets', description='No secrets.', forbidden_patterns=['(?i)secret']
+        )
+        dotall = Guideline.objects.create(
+            title='Spanning', description='No spanning.', forbidden_patterns=[r'(?s)top.+end']
+        )
+
+        rules = RuleSet(Guideline.objects.all())
+        results = rules.scan('Top\nSECRET, the end.')
+
+        self.assertEqual(len(rules.combined_patterns), 1)
+        self.assertEqual(results[secret.pk][0], ReviewItem.StatusChoices.FAILED)
+        self.assertEqual(results[dotall.pk][0], ReviewItem.StatusChoices.FAILED)
+
+    def test_rule_set_skips_inactive_guidelines(self):
+        """
+        Test case for leaving the rules of inactive guidelines out of pre-screening.
+        """
+        self.claims.is_active = False
+        self.claims.save()
+
+        self.assertEqual(rule_set.get().guideline_ids, {self.disclaimer.pk})
+
+    @override_settings(TASK_QUEUE_EAGER=True)
+    def test_upload_prescreened(self):
+        """
+        Test case for deciding rule-based review items after an upload.
+        """
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        upload = SimpleUploadedFile('flyer.txt', b'Risk free investing. Capital at risk.')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                reverse('content-upload'),
+                {'title': 'Flyer', 'file': upload},
+                format='multipart',
+            )
+
+        content = Content.objects.get(pk=response.data['id'])
+        statuses = dict(content.review_items.values_list('guideline_id', 'status'))
+        self.assertEqual(
+            statuses,
+            {
+                self.claims.pk: ReviewItem.StatusChoices.FAILED,
+                self.disclaimer.pk: ReviewItem.StatusChoices.PASSED,
+                self.tone.pk: ReviewItem.StatusChoices.PENDING,
+            },
+        )
+        self.assertEqual(
+            content.review_items.get(guideline=self.claims).evidence,
+            [{'rule': 'forbidden_phrase', 'value': 'risk free', 'offset': 0}],
+        )
+        self.assertEqual(content.failed_reviews, 1)
+        self.assertEqual(content.passed_reviews, 1)
+
+    def test_invalid_pattern_rejected(self):
+        """
+        Test case for rejecting a guideline with an invalid regular expression.
+        """
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        data = {'title': 'Broken', 'description': 'Broken', 'forbidden_patterns': ['(']}
+
+        response = client.post(reverse('guideline-list'), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('forbidden_patterns', response.data)
+
+
+def make_docx(*pages):
+    """
+    Builds a minimal .docx whose pages are separated by explicit page breaks.
+    """
+    namespace = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+    page_break = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+    body = page_break.join(
+        ''.join(f'<w:p><w:r><w:t>{paragraph}</w:t></w:r></w:p>' for paragraph in page)
+        for page in pages
+    )
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr(
+            'word/document.xml',
+            f'<w:document xmlns:w="{namespace}"><w:body>{body}</w:body></w:document>',
+        )
+    return buffer.getvalue()
+
+
+def make_pdf(*pages):
+    """
+    Builds a minimal PDF with one line of Helvetica text per page.
+    """
+    page_ids = [4 + 2 * number for number in range(len(pages))]
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for page_id, text in zip(page_ids, pages):
+        stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'
+        objects.append(
+            '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>'
+        )
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+
+    document = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(document))
+        document += f'{number} 0 obj\n{body}\nendobj\n'.encode()
+    xref = len(document)
+    document += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    document += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode()
+    document += (
+        f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'
+    ).encode()
+    return document
+
+
+class TextExtractionTestCase(TestCase):
+    """
+    Test cases for the text extraction pipeline.
+    """
+    def setUp(self):
+        """
+        Set up test environment.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def upload(self, name, data):
+        """
+        Uploads a file and returns the created content.
+        """
+        response = self.client.post(
+            reverse('content-upload'),
+            {'title': name, 'file': SimpleUploadedFile(name, data)},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Content.objects.get(pk=response.data['id'])
+
+    def test_normalizer_collapses_whitespace_across_chunks(self):
+        """
+        Test case for normalizing text fed in arbitrary chunks.
+        """
+        normalizer = TextNormalizer()
+        for chunk in ('ﬁrst  ', '  word\r', '\n\n\n\nsecond\tline', ' \n'):
+            normalizer.feed(chunk)
+
+        self.assertEqual(normalizer.text, 'first word\n\nsecond line')
+
+    @override_settings(TEXT_EXTRACTION_CHUNK_SIZE=7)
+    def test_txt_extracted_in_chunks(self):
+        """
+        Test case for extracting a text file across chunk and UTF-8 boundaries.
+        """
+        content = self.upload('notes.txt', 'Café   policy\n\n\n\nÜber alles.\n'.encode())
+
+        extracted = extract_content_text(content)
+
+        self.assertEqual(extracted.text, 'Café policy\n\nÜber alles.')
+        self.assertEqual(extracted.page_offsets, [0])
+        self.assertEqual(extracted.version, content.version)
+
+    def test_docx_extracted_per_page(self):
+        """
+        Test case for extracting paragraphs and pages of a .docx document.
+        """
+        content = self.upload(
+            'policy.docx', make_docx(['Scope', 'All staff.'], ['Appendix'])
+        )
+
+        extracted = extract_content_text(content)
+
+        self.assertEqual(extracted.text, 'Scope\nAll staff.\n\nAppendix')
+        self.assertEqual(extracted.page_text(1), 'Scope\nAll staff.')
+        self.assertEqual(extracted.page_text(2), 'Appendix')
+
+    def test_pdf_extracted_per_page(self):
+        """
+        Test case for extracting the pages of a PDF document.
+        """
+        content = self.upload('policy.pdf', make_pdf('Scope of the policy', 'Appendix'))
+
+        extracted = extract_content_text(content)
+
+        self.assertEqual(extracted.text, 'Scope of the policy\n\nAppendix')
+        self.assertEqual(extracted.page_text(1), 'Scope of the policy')
+        self.assertEqual(extracted.page_text(2), 'Appendix')
+
+    @override_settings(TEXT_EXTRACTION_MAX_CHARS=10)
+    def test_text_truncated(self):
+        """
+        Test case for truncating text over the configured size.
+        """
+        content = self.upload('long.txt', b'word ' * 100)
+
+        extracted = extract_content_text(content)
+
+        self.assertEqual(extracted.text, 'word word ')
+        self.assertTrue(extracted.truncated)
+
+    def test_extracted_once_per_version(self):
+        """
+        Test case for reusing the extracted text until the file changes.
+        """
+        content = self.upload('notes.txt', b'First draft.')
+        extract_content_text(content)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(extract_content_text(content).text, 'First draft.')
+
+        url = reverse('content-detail', kwargs={'pk': content.pk})
+        self.client.patch(
+            url, {'file': SimpleUploadedFile('notes.txt', b'Second draft.')}, format='multipart'
+        )
+        content.refresh_from_db()
+
+        self.assertEqual(extract_content_text(content).text, 'Second draft.')
+        self.assertEqual(ContentText.objects.filter(content=content).count(), 1)
+
+    def test_unreadable_file_stored_empty(self):
+        """
+        Test case for not parsing a corrupt document again.
+        """
+        content = self.upload('broken.docx', b'not a zip archive')
+
+        extracted = extract_content_text(content)
+
+        self.assertEqual(extracted.text, '')
+        self.assertIsNone(extract_content_text(self.upload('photo.png', b'png')))
+
+    @override_settings(TASK_QUEUE_EAGER=True)
+    def test_upload_extracted_in_background(self):
+        """
+        Test case for queueing the extraction of an upload.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            content = self.upload('policy.docx', make_docx(['Scope']))
+
+        self.assertEqual(content.extracted_text.text, 'Scope')
+
+    def test_extract_text_command(self):
+        """
+        Test case for extracting the text of existing contents.
+        """
+        content = self.upload('notes.txt', b'Existing text.')
+        out = StringIO()
+
+        call_command('extract_text', stdout=out)
+        call_command('extract_text', stdout=out)
+
+        self.assertEqual(content.extracted_text.text, 'Existing text.')
+        self.assertIn('Extracted the text of 1 contents.', out.getvalue())
+        self.assertIn('Extracted the text of 0 contents.', out.getvalue())
+
+
+class SearchViewTestCase(TestCase):
+    """
+    Test cases for the SearchView.
+    """
+    def setUp(self):
+        """
+        Set up contents and guidelines to search.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.policy = Content.objects.create(
+            title='Retention policy', file='policy.txt', author=self.user
+        )
+        ContentText.objects.create(
+            content=self.policy, version=1, text='Records are kept for seven years.'
+        )
+        self.memo = Content.objects.create(
+            title='Memo', file='memo.txt', author=self.user
+        )
+        ContentText.objects.create(
+            content=self.memo, version=1, text='The retention policy applies to all records.'
+        )
+        self.guideline = Guideline.objects.create(
+            title='Data retention', description='Records must be retained for seven years.'
+        )
+
+    def test_search_ranks_and_highlights(self):
+        """
+        Test case for searching contents and guidelines.
+        """
+        response = self.client.get(reverse('search'), {'q': 'retention policy'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        contents = response.data['contents']
+        self.assertEqual([result['id'] for result in contents], [self.policy.pk, self.memo.pk])
+        self.assertGreater(contents[0]['rank'], contents[1]['rank'])
+        self.assertIn('<mark>retention</mark>', contents[1]['headline'])
+        self.assertEqual(response.data['guidelines'], [])
+
+    def test_search_by_type(self):
+        """
+        Test case for limiting a search to guidelines.
+        """
+        response = self.client.get(reverse('search'), {'q': 'seven', 'type': 'guidelines'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('contents', response.data)
+        self.assertEqual(
+            [result['id'] for result in response.data['guidelines']], [self.guideline.pk]
+        )
+
+    def test_search_limit(self):
+        """
+        Test case for limiting the number of results.
+        """
+        response = self.client.get(reverse('search'), {'q': 'records', 'limit': 1})
+
+        self.assertEqual(len(response.data['contents']), 1)
+
+    def test_search_requires_query(self):
+        """
+        Test case for rejecting a search without a query.
+        """
+        response = self.client.get(reverse('search'), {'limit': 1000})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('q', response.data)
+        self.assertIn('limit', response.data)
+
+
+class ReviewItemIndexTestCase(TestCase):
+    """
+    Test cases for the review item constraints and hot query indexes.
+    """
+    def setUp(self):
+        """
+        Set up a content with review items.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.guideline = Guideline.objects.create(title='Guideline', description='Text')
+        self.content = Content.objects.create(
+            title='Test Content', file='testfile.txt', author=self.user
+        )
+
+    def test_duplicate_review_item_rejected(self):
+        """
+        Test case for the unique review item per content and guideline.
+        """
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ReviewItem.objects.create(content=self.content, guideline=self.guideline)
+
+    def test_repeated_fan_out_skips_existing_items(self):
+        """
+        Test case for fanning out a content twice.
+        """
+        create_review_items(self.content)
+
+        self.assertEqual(self.content.review_items.count(), 1)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.total_reviews, 1)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are PostgreSQL specific')
+    def test_hot_queries_use_indexes(self):
+        """
+        Test case for the query plans of the review and upload hot paths.
+        """
+        queries = {
+            'content_author_title_idx': Content.objects.filter(
+                author=self.user, title='Test Content'
+            ),
+            'reviewitem_content_status_idx': ReviewItem.objects.filter(
+                content=self.content, status=ReviewItem.StatusChoices.PENDING
+            ).values('pk'),
+            'reviewitem_reviewer_at_idx': ReviewItem.objects.filter(
+                reviewer=self.user
+            ).order_by('-reviewed_at'),
+            'reviewitem_guideline_st_idx': ReviewItem.objects.filter(
+                guideline=self.guideline, status=ReviewItem.StatusChoices.PENDING
+            ).values('pk'),
+            'unique_content_guideline': ReviewItem.objects.filter(
+                content=self.content, guideline=self.guideline
+            ),
+        }
+        with connection.cursor() as cursor:
+            # The test tables are tiny; make the planner show the index it
+            # would use at production sizes.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            for index_name, queryset in queries.items():
+                with self.subTest(index=index_name):
+                    self.assertIn(index_name, queryset.explain())
+
+
+class ReviewQueueViewTestCase(TestCase):
+    """
+    Test cases for the ReviewQueueView.
+    """
+    def setUp(self):
+        """
+        Set up contents with pending review items and two reviewers.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser', password='testpassword'
+        )
+        self.guideline1 = Guideline.objects.create(title='Guideline 1', description='Text')
+        self.guideline2 = Guideline.objects.create(title='Guideline 2', description='Text')
+        for index in range(2):
+            Content.objects.create(
+                title=f'Content {index}', file=f'content{index}.txt', author=self.user
+            )
+        self.review_item_ids = list(
+            ReviewItem.objects.order_by('pk').values_list('pk', flat=True)
+        )
+
+    def claim(self, user, **data):
+        """
+        Claims review items from the queue as the given user.
+        """
+        self.client.force_authenticate(user=user)
+        response = self.client.post(reverse('review-queue'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [review_item['id'] for review_item in response.data]
+
+    def test_reviewers_claim_disjoint_items(self):
+        """
+        Test case for handing out each pending item to one reviewer only.
+        """
+        claimed = self.claim(self.user, limit=2)
+        other_claimed = self.claim(self.other_user, limit=3)
+
+        self.assertEqual(claimed, self.review_item_ids[:2])
+        self.assertEqual(other_claimed, self.review_item_ids[2:])
+        self.assertEqual(self.claim(self.user, limit=2), claimed)
+
+    def test_claim_by_guideline(self):
+        """
+        Test case for claiming the items of one guideline.
+        """
+        claimed = self.claim(self.user, guideline=self.guideline2.pk)
+
+        self.assertEqual(
+            set(ReviewItem.objects.filter(pk__in=claimed).values_list('guideline', flat=True)),
+            {self.guideline2.pk},
+        )
+        self.assertEqual(len(claimed), 2)
+
+    def test_expired_claim_reclaimed(self):
+        """
+        Test case for handing out items whose claim expired.
+        """
+        with override_settings(REVIEW_CLAIM_TIMEOUT=-1):
+            claimed = self.claim(self.user, limit=1)
+
+        self.assertEqual(self.claim(self.other_user, limit=1), claimed)
+
+    def test_claimed_item_update_conflict(self):
+        """
+        Test case for rejecting a review of an item claimed by another reviewer.
+        """
+        review_item = ReviewItem.objects.get(pk=self.claim(self.user, limit=1)[0])
+        url = reverse(
+            'content-review-update',
+            kwargs={'content_id': review_item.content_id, 'review_item_id': review_item.pk},
+        )
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.put(url, {'status': 'PASS'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.put(url, {'status': 'PASS'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        review_item.refresh_from_db()
+        self.assertIsNone(review_item.claimed_by)
+
+    def test_claimed_item_bulk_update_conflict(self):
+        """
+        Test case for skipping items claimed by another reviewer in a bulk review.
+        """
+        claimed_id = self.claim(self.user, limit=1)[0]
+        free_id = self.review_item_ids[-1]
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.put(
+            reverse('review-bulk-update'),
+            [
+                {'review_item_id': claimed_id, 'status': 'PASS'},
+                {'review_item_id': free_id, 'status': 'PASS'},
+            ],
+            format='json',
+        )
+
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    'review_item_id': claimed_id,
+                    'updated': False,
+                    'error': 'Review item is claimed by another reviewer.',
+                },
+                {'review_item_id': free_id, 'status': 'PASS', 'updated': True},
+            ],
+        )
+
+    def test_release_claims(self):
+        """
+        Test case for releasing claimed items back to the queue.
+        """
+        claimed = self.claim(self.user, limit=2)
+
+        response = self.client.delete(reverse('review-queue'))
+
+        self.assertEqual(response.data, {'released': 2})
+        self.assertEqual(self.claim(self.other_user, limit=2), claimed)
+
+    def test_claim_limit_validated(self):
+        """
+        Test case for rejecting a claim over the maximum number of items.
+        """
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(reverse('review-queue'), {'limit': 1000}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class OptimisticConcurrencyTestCase(TestCase):
+    """
+    Test cases for If-Match conditional updates of contents and review items.
+    """
+    def setUp(self):
+        """
+        Set up a content with a review item.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+        Guideline.objects.create(title='Guideline', description='Text')
+        self.content = Content.objects.create(
+            title='Content', file='content.txt', author=self.user
+        )
+        self.review_item = self.content.review_items.get()
+        self.content_url = reverse('content-detail', kwargs={'pk': self.content.pk})
+        self.review_url = reverse(
+            'content-review-update',
+            kwargs={'content_id': self.content.pk, 'review_item_id': self.review_item.pk},
+        )
+
+    def test_content_update_with_matching_etag(self):
+        """
+        Test case for updating content with the ETag of the current state in
+        a single UPDATE statement.
+        """
+        etag = self.client.get(self.content_url)['ETag']
+        self.assertEqual(etag, self.content.etag)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                self.content_url, {'title': 'Renamed'}, format='json', HTTP_IF_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [query for query in queries if query['sql'].startswith('UPDATE "core_content"')]
+        self.assertEqual(len(updates), 1)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.title, 'Renamed')
+        self.assertEqual(response['ETag'], self.content.etag)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_content_update_with_stale_etag(self):
+        """
+        Test case for rejecting a content update based on an outdated state.
+        """
+        etag = self.content.etag
+        self.client.patch(self.content_url, {'title': 'First writer'}, format='json')
+
+        response = self.client.patch(
+            self.content_url, {'title': 'Second writer'}, format='json', HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.title, 'First writer')
+
+    def test_content_file_update_increments_version(self):
+        """
+        Test case for incrementing the version of content in the database.
+        """
+        Content.objects.filter(pk=self.content.pk).update(version=5)
+
+        response = self.client.patch(
+            self.content_url,
+            {'file': SimpleUploadedFile('content.txt', b'new revision')},
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['version'], 6)
+
+    def test_review_update_with_matching_etag(self):
+        """
+        Test case for reviewing an item with the ETag of the current revision in
+        a single UPDATE statement.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                self.review_url,
+                {'status': 'PASS'},
+                format='json',
+                HTTP_IF_MATCH=self.review_item.etag,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updates = [
+            query for query in queries if query['sql'].startswith('UPDATE "core_reviewitem"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(response.data['revision'], 2)
+        self.assertEqual(response['ETag'], '"2"')
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.passed_reviews, 1)
+
+    def test_review_update_with_stale_etag(self):
+        """
+        Test case for rejecting a review based on an outdated revision.
+        """
+        etag = self.review_item.etag
+        self.client.put(self.review_url, {'status': 'FAIL'}, format='json')
+
+        response = self.client.put(
+            self.review_url, {'status': 'PASS'}, format='json', HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.review_item.refresh_from_db()
+        self.assertEqual(self.review_item.status, ReviewItem.StatusChoices.FAILED)
+        self.assertEqual(self.review_item.revision, 2)
+
+
+class ReviewStatsViewTestCase(TestCase):
+    """
+    Test cases for the ReviewStatsView.
+    """
+    def setUp(self):
+        """
+        Set up contents of two authors with decided and pending review items.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.guideline1 = Guideline.objects.create(title='Guideline 1', description='Text')
+        self.guideline2 = Guideline.objects.create(title='Guideline 2', description='Text')
+        content1 = Content.objects.create(title='Content 1', file='c1.txt', author=self.user)
+        Content.objects.create(title='Content 2', file='c2.txt', author=self.other_user)
+
+        content1.review_items.filter(guideline=self.guideline1).update(
+            status=ReviewItem.StatusChoices.PASSED
+        )
+        content1.review_items.filter(guideline=self.guideline2).update(
+            status=ReviewItem.StatusChoices.FAILED
+        )
+        Content.objects.refresh_review_counts()
+        self.today = str(timezone.now().date())
+
+    def test_stats_per_guideline_in_one_query(self):
+        """
+        Test case for counting review items per guideline with a single query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('review-stats'), {'group_by': 'guideline'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                'guideline': [
+                    {'key': str(self.guideline1.pk), 'label': 'Guideline 1',
+                     'total': 2, 'passed': 1, 'failed': 0, 'pending': 1},
+                    {'key': str(self.guideline2.pk), 'label': 'Guideline 2',
+                     'total': 2, 'passed': 0, 'failed': 1, 'pending': 1},
+                ]
+            },
+        )
+
+    def test_stats_per_author_and_day(self):
+        """
+        Test case for summing the review counters per author and per day.
+        """
+        response = self.client.get(reverse('review-stats'))
+
+        self.assertEqual(
+            response.data['author'],
+            [
+                {'key': str(self.user.pk), 'label': 'testuser',
+                 'total': 2, 'passed': 1, 'failed': 1, 'pending': 0},
+                {'key': str(self.other_user.pk), 'label': 'otheruser',
+                 'total': 2, 'passed': 0, 'failed': 0, 'pending': 2},
+            ],
+        )
+        self.assertEqual(
+            response.data['day'],
+            [{'key': self.today, 'label': self.today,
+              'total': 4, 'passed': 1, 'failed': 1, 'pending': 2}],
+        )
+
+    def test_stats_from_summary(self):
+        """
+        Test case for serving the statistics from the refreshed summary table.
+        """
+        live = self.client.get(reverse('review-stats')).data
+        call_command('refresh_review_stats', stdout=StringIO())
+        ReviewItem.objects.update(status=ReviewItem.StatusChoices.PENDING)
+
+        with override_settings(REVIEW_STATS_FROM_SUMMARY=True):
+            response = self.client.get(reverse('review-stats'))
+
+        for dimension in ('guideline', 'author', 'day'):
+            self.assertEqual(response.data[dimension], live[dimension])
+        self.assertEqual(
+            response.data['refreshed_at'], ReviewStatsSummary.objects.first().refreshed_at
+        )
+
+    def test_stats_unsupported_dimension(self):
+        """
+        Test case for rejecting an unknown grouping.
+        """
+        response = self.client.get(reverse('review-stats'), {'group_by': 'reviewer'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncContentViewsTestCase(TestCase):
+    """
+    Test cases for the async variants of the read-heavy content views.
+    """
+    def setUp(self):
+        """
+        Set up a session authenticated client and an uploaded content.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.guideline = Guideline.objects.create(title='Guideline 1', description='Text')
+        self.client.force_login(self.user)
+
+        api_client = APIClient()
+        api_client.force_authenticate(user=self.user)
+        response = api_client.post(
+            reverse('content-upload'),
+            {'title': 'Policy', 'file': SimpleUploadedFile('policy.txt', b'Policy text')},
+            format='multipart',
+        )
+        self.content = Content.objects.get(pk=response.data['id'])
+
+    def test_list_matches_sync_view(self):
+        """
+        Test case for paginating the async list with the same payload as the sync view.
+        """
+        for index in range(2):
+            Content.objects.create(
+                title=f'Extra Content {index}', file='extra.txt', author=self.user
+            )
+
+        first = self.client.get(reverse('async-content-list'), {'page_size': 2}).json()
+        second = self.client.get(first['next']).json()
+        sync = self.client.get(reverse('content-list')).json()
+
+        self.assertEqual(first['results'] + second['results'], sync['results'])
+        self.assertIsNone(second['next'])
+
+    def test_list_invalid_cursor(self):
+        """
+        Test case for rejecting a malformed cursor.
+        """
+        response = self.client.get(reverse('async-content-list'), {'cursor': 'invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_detail_with_jwt(self):
+        """
+        Test case for authenticating with a JWT bearer token and revalidating the ETag.
+        """
+        self.client.logout()
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}
+        url = reverse('async-content-detail', kwargs={'pk': self.content.pk})
+
+        response = self.client.get(url, headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['title'], 'Policy')
+        self.assertEqual(response['ETag'], self.content.etag)
+
+        response = self.client.get(
+            url, headers={**headers, 'If-None-Match': self.content.etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_not_found(self):
+        """
+        Test case for requesting a content that does not exist.
+        """
+        url = reverse('async-content-detail', kwargs={'pk': self.content.pk + 100})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unauthenticated(self):
+        """
+        Test case for rejecting anonymous requests and invalid tokens.
+        """
+        self.client.logout()
+        url = reverse('async-content-list')
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get(url, headers={'Authorization': 'Bearer invalid'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_review_status_matches_sync_view(self):
+        """
+        Test case for listing review items like ContentReviewStatusView.
+        """
+        url = reverse('async-content-review-status', kwargs={'content_id': self.content.pk})
+        response = self.client.get(url)
+        sync = self.client.get(
+            reverse('content-review-status', kwargs={'content_id': self.content.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync.json())
+        self.assertEqual(len(response.json()), 1)
+
+    def test_review_status_with_guideline_missing_from_cache(self):
+        """
+        Test case for serializing guidelines added by another process after
+        the guideline cache was filled.
+        """
+        url = reverse('async-content-review-status', kwargs={'content_id': self.content.pk})
+        self.client.get(url)
+        # Created without signals, like a guideline written by another worker.
+        guideline = Guideline.objects.bulk_create(
+            [Guideline(title='Guideline 2', description='Text')]
+        )[0]
+        ReviewItem.objects.create(content=self.content, guideline=guideline)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[1]['guideline']['title'], 'Guideline 2')
+
+    async def test_download_streams_file(self):
+        """
+        Test case for streaming a revision stored in full.
+        """
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+        url = reverse(
+            'async-content-version-download',
+            kwargs={'content_id': self.content.pk, 'version': 1},
+        )
+
+        with override_settings(DOWNLOAD_CHUNK_SIZE=4):
+            response = await client.get(url)
+            chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(chunks), b'Policy text')
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(
+            response['Content-Disposition'], 'attachment; filename="Policy-v1.txt"'
+        )
+
+    def test_loadtest_command(self):
+        """
+        Test case for comparing the sync and async list views.
+        """
+        out = StringIO()
+        call_command(
+            'loadtest', requests=2, concurrency=1, username='testuser', stdout=out
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines], ['handler', 'wsgi', 'asgi'])
+        self.assertEqual([line.split()[-1] for line in lines[1:]], ['0', '0'])
+
+
+class BenchmarkTestCase(TestCase):
+    """
+    Test cases for the benchmark data generators, runner and command.
+    """
+    def test_generate_dataset(self):
+        """
+        Test case for generating contents fanned out to every guideline.
+        """
+        dataset = generate_dataset(users=2, guidelines=3, contents=4, seed=1)
+
+        self.assertEqual(len(dataset.users), 2)
+        self.assertEqual(len(dataset.review_items), 12)
+        self.assertEqual(
+            sorted(Content.objects.values_list('total_reviews', flat=True)), [3, 3, 3, 3]
+        )
+        self.assertEqual(
+            ReviewItem.objects.exclude(status=ReviewItem.StatusChoices.PENDING).count(),
+            sum(Content.objects.values_list('passed_reviews', flat=True))
+            + sum(Content.objects.values_list('failed_reviews', flat=True)),
+        )
+
+        generate_dataset(users=1, guidelines=1, contents=1)
+        self.assertEqual(Content.objects.count(), 1)
+        delete_benchmark_data()
+        self.assertFalse(Content.objects.exists())
+        self.assertFalse(Guideline.objects.exists())
+
+    def test_run_scenarios(self):
+        """
+        Test case for measuring every scenario without errors.
+        """
+        dataset = generate_dataset(users=2, guidelines=3, contents=4)
+        transport = TRANSPORTS['client']()
+
+        for name, scenario in SCENARIOS.items():
+            metrics = run_scenario(transport, scenario, dataset, requests=3, warmup=1)
+            self.assertEqual(metrics['errors'], 0, name)
+            self.assertGreater(metrics['queries_per_request'], 0, name)
+        self.assertEqual(Content.objects.count(), 8)
+
+    def test_compare_to_baseline(self):
+        """
+        Test case for flagging added queries and slower requests.
+        """
+        metrics = {'p50_ms': 10, 'p95_ms': 20, 'queries_per_request': 2, 'errors': 0}
+        baseline = {'scenarios': {'list': metrics}}
+
+        self.assertEqual(
+            compare_to_baseline({'scenarios': {'list': dict(metrics, p95_ms=24)}}, baseline, 0.25),
+            [],
+        )
+        regressions = compare_to_baseline(
+            {'scenarios': {'list': dict(metrics, p95_ms=30, queries_per_request=3)}},
+            baseline,
+            0.25,
+        )
+        self.assertEqual(len(regressions), 2)
+
+    def test_run_benchmarks_command(self):
+        """
+        Test case for saving a baseline and comparing a run with it.
+        """
+        options = {'users': 1, 'guidelines': 2, 'contents': 2, 'requests': 2, 'warmup': 0}
+        with tempfile.NamedTemporaryFile(suffix='.json') as baseline_file:
+            call_command(
+                'run_benchmarks',
+                scenarios='list,review-status',
+                save_baseline=baseline_file.name,
+                stdout=StringIO(),
+                **options,
+            )
+            with open(baseline_file.name) as saved:
+                baseline = json.load(saved)
+            self.assertEqual(sorted(baseline['scenarios']), ['list', 'review-status'])
+            self.assertFalse(Content.objects.exists())
+
+            baseline['scenarios']['list']['queries_per_request'] = 0
+            with open(baseline_file.name, 'w') as saved:
+                json.dump(baseline, saved)
+            with self.assertRaises(CommandError):
+                call_command(
+                    'run_benchmarks',
+                    scenarios='list',
+                    baseline=baseline_file.name,
+                    tolerance=1000,
+                    stdout=StringIO(),
+                    stderr=StringIO(),
+                    **options,
+                )
+
+
+@override_settings(METRICS_ALLOWED_IPS=['127.0.0.1'])
+class MetricsTestCase(TestCase):
+    """
+    Test cases for the request metrics middleware and endpoint.
+    """
+    def setUp(self):
+        """
+        Set up an authenticated client and empty metrics.
+        """
+        registry.reset()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.content = Content.objects.create(
+            title='Content 1', file='content1.txt', author=self.user
+        )
+
+    def sample(self, text, name, view, method='GET', status_code=200):
+        """
+        Returns the value of a sample in an exposition, or None.
+        """
+        labels = f'view="{view}",method="{method}",status="{status_code}"'
+        prefix = f'compliance_engine_{name}{{{labels}}} '
+        for line in text.splitlines():
+            if line.startswith(prefix):
+                return float(line[len(prefix):])
+        return None
+
+    def test_latency_and_queries_per_view(self):
+        """
+        Test case for recording the latency and query count of a view.
+        """
+        url = reverse('content-list')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+            self.client.get(url)
+        query_count = len(queries)
+
+        response = self.client.get(reverse('metrics'))
+        text = response.content.decode()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('# TYPE compliance_engine_http_request_duration_seconds histogram', text)
+        self.assertEqual(
+            self.sample(text, 'http_request_duration_seconds_count', 'content-list'), 2
+        )
+        self.assertEqual(
+            self.sample(text, 'db_queries_per_request_sum', 'content-list'), query_count
+        )
+        self.assertIn(
+            'compliance_engine_http_request_duration_seconds_bucket{view="content-list",'
+            'method="GET",status="200",le="+Inf"} 2',
+            text,
+        )
+        self.assertGreater(self.sample(text, 'http_response_bytes_total', 'content-list'), 0)
+
+    def test_upload_bytes(self):
+        """
+        Test case for counting the bytes of uploaded request bodies.
+        """
+        response = self.client.post(
+            reverse('content-upload'),
+            {'title': 'Upload', 'file': SimpleUploadedFile('upload.txt', b'x' * 4096)},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        text = self.client.get(reverse('metrics')).content.decode()
+        self.assertGreater(
+            self.sample(text, 'http_request_bytes_total', 'content-upload', 'POST', 201), 4096
+        )
+
+    async def test_async_view_queries(self):
+        """
+        Test case for counting the queries an async view runs through the async ORM.
+        """
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+        await client.get(reverse('async-content-detail', kwargs={'pk': self.content.pk}))
+
+        series = registry.collect()[('async-content-detail', 'GET', '200')]
+        self.assertEqual(series.count, 1)
+        # Session, user and content lookups.
+        self.assertEqual(series.query_sum, 3)
+
+    def test_metrics_restricted_to_allowed_ips(self):
+        """
+        Test case for hiding the metrics from other clients.
+        """
+        response = self.client.get(reverse('metrics'), REMOTE_ADDR='10.0.0.1')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN='')
+    def test_metrics_denied_by_default(self):
+        """
+        Test case for hiding the metrics when no address or token is configured.
+        """
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(METRICS_ALLOWED_IPS=[], METRICS_TOKEN='scrape-token')
+    def test_metrics_with_bearer_token(self):
+        """
+        Test case for serving the metrics to requests carrying the token.
+        """
+        url = reverse('metrics')
+
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer wrong-token')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_multiprocess_aggregation(self):
+        """
+        Test case for merging the metrics written by other worker processes.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            other = Series()
+            other.observe(0.02, 3, 0.001, 100, 0)
+            other.observe(0.2, 3, 0.001, 100, 0)
+            with open(f'{directory}/metrics-0.json', 'w') as snapshot:
+                json.dump(
+                    [{'labels': ['content-list', 'GET', '200'], 'series': other.to_dict()}],
+                    snapshot,
+                )
+
+            with override_settings(METRICS_MULTIPROCESS_DIR=directory):
+                self.client.get(reverse('content-list'))
+                text = self.client.get(reverse('metrics')).content.decode()
+
+        self.assertEqual(
+            self.sample(text, 'http_request_duration_seconds_count', 'content-list'), 3
+        )
+
+
+class ImportContentsTestCase(TestCase):
+    """
+    Test cases for the import_contents management command.
+    """
+    def setUp(self):
+        """
+        Set up an author, guidelines and a directory of files to import.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.guideline1 = Guideline.objects.create(title='Guideline 1', description='Text')
+        self.guideline2 = Guideline.objects.create(title='Guideline 2', description='Text')
+        Content.objects.create(title='existing', file='existing.txt', author=self.user)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        for name, data in (
+            ('a.txt', b'First policy'),
+            ('b.txt', b'Second policy'),
+            ('existing.txt', b'Already imported'),
+            ('image.gif', b'GIF89a'),
+            ('nested/c.txt', b'Third policy'),
+        ):
+            path = f'{self.directory.name}/{name}'
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as source:
+                source.write(data)
+
+    def run_import(self, source=None, **options):
+        """
+        Runs the command and returns its standard output.
+        """
+        out = StringIO()
+        call_command(
+            'import_contents', source or self.directory.name, author='testuser',
+            stdout=out, stderr=StringIO(), **options,
+        )
+        return out.getvalue()
+
+    def test_import_directory(self):
+        """
+        Test case for importing files with their versions, review items and tasks.
+        """
+        rule_set.get()
+        applicability_index.get()
+        # Lookups, then one INSERT per table for the whole batch.
+        with self.assertNumQueries(8):
+            out = self.run_import(workers=2)
+
+        self.assertIn('Imported 3 contents, skipped 2 files.', out)
+        contents = Content.objects.filter(title__in=['a', 'b', 'c']).order_by('title')
+        self.assertEqual([content.title for content in contents], ['a', 'b', 'c'])
+        for content, data in zip(contents, (b'First policy', b'Second policy', b'Third policy')):
+            self.assertEqual(content.file.read(), data)
+            self.assertEqual(content.total_reviews, 2)
+            self.assertEqual(content.review_items.count(), 2)
+            version = content.versions.get()
+            self.assertEqual(version.size, len(data))
+            self.assertEqual(version.digest, hashlib.sha256(data).hexdigest())
+        self.assertEqual(
+            Task.objects.filter(name='core.extract_content_text').count(), 4
+        )
+
+    def test_import_manifest(self):
+        """
+        Test case for importing the files listed in a CSV manifest.
+        """
+        manifest = f'{self.directory.name}/manifest.csv'
+        with open(manifest, 'w') as manifest_file:
+            manifest_file.write('path,title\na.txt,Policy A\nmissing.txt,Missing\n')
+
+        out = self.run_import(manifest)
+
+        self.assertIn('Imported 1 contents, skipped 1 files.', out)
+        self.assertTrue(Content.objects.filter(title='Policy A').exists())
+
+    def test_resume_from_checkpoint(self):
+        """
+        Test case for resuming an import after the last committed batch.
+        """
+        checkpoint_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(checkpoint_directory.cleanup)
+        checkpoint = f'{checkpoint_directory.name}/checkpoint.json'
+        with open(checkpoint, 'w') as checkpoint_file:
+            json.dump(
+                {'source': self.directory.name, 'position': 3, 'imported': 2, 'skipped': 1},
+                checkpoint_file,
+            )
+
+        out = self.run_import(checkpoint=checkpoint, batch_size=1)
+
+        self.assertIn('Resuming after 3 files.', out)
+        self.assertIn('Imported 3 contents, skipped 2 files.', out)
+        self.assertFalse(Content.objects.filter(title__in=['a', 'b']).exists())
+        self.assertTrue(Content.objects.filter(title='c').exists())
+        with open(checkpoint) as checkpoint_file:
+            self.assertEqual(json.load(checkpoint_file)['position'], 5)
+
+
+@override_settings(GUIDELINE_BACKFILL_CHUNK_SIZE=2, GUIDELINE_BACKFILL_DELAY=0)
+class GuidelineBackfillTestCase(TestCase):
+    """
+    Test cases for back-propagating new and reactivated guidelines to existing contents.
+    """
+    def setUp(self):
+        """
+        Set up five contents reviewed against one guideline.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        Guideline.objects.create(title='Guideline 1', description='Text')
+        for index in range(5):
+            Content.objects.create(title=f'Content {index}', file='c.txt', author=self.user)
+        Task.objects.all().delete()
+
+    def run_backfill_tasks(self):
+        """
+        Runs the queued backfill tasks, including the ones they queue, and
+        returns how many ran.
+        """
+        ran = 0
+        while queued_task := Task.objects.filter(
+            name='core.backfill_guideline_reviews', status=Task.StatusChoices.QUEUED
+        ).first():
+            run_task(queued_task)
+            ran += 1
+        return ran
+
+    def test_new_guideline_backfilled_in_chunks(self):
+        """
+        Test case for creating the review items of a new guideline chunk by chunk.
+        """
+        guideline = Guideline.objects.create(title='Guideline 2', description='Text')
+
+        self.assertEqual(self.run_backfill_tasks(), 3)
+        self.assertEqual(ReviewItem.objects.filter(guideline=guideline).count(), 5)
+        self.assertEqual(
+            set(Content.objects.values_list('total_reviews', 'pending_reviews')), {(2, 2)}
+        )
+
+    def test_backfill_skips_existing_items(self):
+        """
+        Test case for leaving contents that already have the review item alone.
+        """
+        guideline = Guideline.objects.create(title='Guideline 2', description='Text')
+        first_content = Content.objects.order_by('pk').first()
+        ReviewItem.objects.create(content=first_content, guideline=guideline)
+        Content.objects.refresh_review_counts()
+        rule_set.get()
+
+        # Chunk bound and author groups, then one INSERT ... SELECT and one
+        # counter UPDATE.
+        with self.assertNumQueries(6):
+            created, last_id = backfill_guideline_reviews(guideline)
+
+        self.assertEqual(created, 1)
+        self.assertEqual(last_id, Content.objects.order_by('pk')[1].pk)
+        self.run_backfill_tasks()
+        self.assertEqual(ReviewItem.objects.filter(guideline=guideline).count(), 5)
+        self.assertEqual(
+            set(Content.objects.values_list('total_reviews', 'pending_reviews')), {(2, 2)}
+        )
+
+    def test_backfill_invalidates_cached_contents(self):
+        """
+        Test case for refreshing cached content details once a chunk commits.
+        """
+        ReviewItem.objects.update(status=ReviewItem.StatusChoices.PASSED)
+        Content.objects.refresh_review_counts()
+        content = Content.objects.order_by('pk').first()
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = reverse('content-detail', kwargs={'pk': content.pk})
+        self.assertEqual(client.get(url).data['review_status'], 'Completed')
+
+        guideline = Guideline.objects.create(title='Guideline 2', description='Text')
+        with self.captureOnCommitCallbacks(execute=True):
+            backfill_guideline_reviews(guideline)
+
+        self.assertEqual(client.get(url).data['review_status'], 'Pending')
+
+    def test_reactivated_guideline(self):
+        """
+        Test case for skipping inactive guidelines and back-propagating them once reactivated.
+        """
+        guideline = Guideline.objects.create(
+            title='Guideline 2', description='Text', is_active=False
+        )
+        content = Content.objects.create(title='Content 5', file='c.txt', author=self.user)
+        self.assertEqual(self.run_backfill_tasks(), 0)
+        self.assertFalse(content.review_items.filter(guideline=guideline).exists())
+
+        guideline.is_active = True
+        guideline.save()
+        self.run_backfill_tasks()
+
+        self.assertEqual(ReviewItem.objects.filter(guideline=guideline).count(), 6)
+
+    def test_backfill_command(self):
+        """
+        Test case for back-propagating guidelines from the management command.
+        """
+        guideline = Guideline.objects.create(title='Guideline 2', description='Text')
+        after_id = Content.objects.order_by('pk')[2].pk
+        out = StringIO()
+
+        call_command(
+            'backfill_guideline_reviews', guideline.pk, after=after_id, delay=0, stdout=out
+        )
+
+        self.assertIn(f'Guideline {guideline.pk}: created 2 review items.', out.getvalue())
+        self.assertEqual(ReviewItem.objects.filter(guideline=guideline).count(), 2)
+
+
+@override_settings(GUIDELINE_BACKFILL_DELAY=0)
+class GuidelineApplicabilityTestCase(TestCase):
+    """
+    Test cases for scoping guidelines to file types, author groups and upload dates.
+    """
+    def setUp(self):
+        """
+        Set up an author in the legal group, an unscoped guideline and one
+        guideline limited to PDF files.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='testpassword'
+        )
+        self.group = Group.objects.create(name='legal')
+        self.user.groups.add(self.group)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.guideline = Guideline.objects.create(title='Guideline 1', description='Text')
+        self.pdf_guideline = Guideline.objects.create(
+            title='Guideline 2', description='Text', file_types=['.pdf']
+        )
+
+    def reviewed_guideline_ids(self, content):
+        return set(content.review_items.values_list('guideline_id', flat=True))
+
+    def test_fan_out_limited_to_file_types(self):
+        """
+        Test case for fanning contents out to the guidelines of their file type only.
+        """
+        text = Content.objects.create(title='Text', file='c.txt', author=self.user)
+        pdf = Content.objects.create(title='PDF', file='c.PDF', author=self.user)
+
+        self.assertEqual(self.reviewed_guideline_ids(text), {self.guideline.pk})
+        self.assertEqual(
+            self.reviewed_guideline_ids(pdf), {self.guideline.pk, self.pdf_guideline.pk}
+        )
+        text.refresh_from_db()
+        self.assertEqual(text.total_reviews, 1)
+
+        url = reverse('content-review-status', kwargs={'content_id': text.pk})
+        response = self.client.get(url)
+        self.assertEqual(
+            [item['guideline']['id'] for item in response.data], [self.guideline.pk]
+        )
+
+    def test_fan_out_limited_to_author_groups(self):
+        """
+        Test case for fanning contents out to the guidelines of their author's groups.
+        """
+        other_user = User.objects.create_user(username='otheruser', password='otherpassword')
+        guideline = Guideline.objects.create(title='Guideline 3', description='Text')
+        guideline.author_groups.add(self.group)
+
+        content = Content.objects.create(title='Content', file='c.txt', author=self.user)
+        other_content = Content.objects.create(
+            title='Content', file='c.txt', author=other_user
+        )
+
+        self.assertIn(guideline.pk, self.reviewed_guideline_ids(content))
+        self.assertNotIn(guideline.pk, self.reviewed_guideline_ids(other_content))
+
+    def test_fan_out_limited_to_date_range(self):
+        """
+        Test case for skipping guidelines outside their active date range.
+        """
+        now = timezone.now()
+        expired = Guideline.objects.create(
+            title='Guideline 3', description='Text', active_until=now
+        )
+        upcoming = Guideline.objects.create(
+            title='Guideline 4', description='Text', active_from=now + timezone.timedelta(days=1)
+        )
+        current = Guideline.objects.create(
+            title='Guideline 5', description='Text',
+            active_from=now - timezone.timedelta(days=1),
+            active_until=now + timezone.timedelta(days=1),
+        )
+
+        content = Content.objects.create(title='Content', file='c.txt', author=self.user)
+
+        reviewed = self.reviewed_guideline_ids(content)
+        self.assertIn(current.pk, reviewed)
+        self.assertNotIn(expired.pk, reviewed)
+        self.assertNotIn(upcoming.pk, reviewed)
+
+    def test_index_resolves_without_queries(self):
+        """
+        Test case for resolving applicable guidelines from the cached index.
+        """
+        index = applicability_index.get()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                index.guideline_ids('.pdf', timezone.now()),
+                [self.guideline.pk, self.pdf_guideline.pk],
+            )
+            self.assertEqual(index.guideline_ids('.txt', timezone.now()), [self.guideline.pk])
+
+        index = ApplicabilityIndex([])
+        self.assertEqual(index.guideline_ids('.txt', timezone.now()), [])
+
+    def test_index_rebuilt_when_scope_changes(self):
+        """
+        Test case for dropping the cached index when a guideline is rescoped.
+        """
+        index = applicability_index.get()
+        self.assertEqual(index.guideline_ids('.txt', timezone.now()), [self.guideline.pk])
+
+        self.pdf_guideline.file_types = []
+        self.pdf_guideline.save()
+        self.guideline.author_groups.add(self.group)
+
+        index = applicability_index.get()
+        self.assertEqual(
+            index.guideline_ids('.txt', timezone.now()), [self.pdf_guideline.pk]
+        )
+        self.assertEqual(
+            index.guideline_ids('.txt', timezone.now(), {self.group.pk}),
+            [self.guideline.pk, self.pdf_guideline.pk],
+        )
+
+    def test_rescoped_guideline_backfilled(self):
+        """
+        Test case for back-propagating a guideline to the contents it applies
+        to once widened, and to those only.
+        """
+        other_user = User.objects.create_user(username='otheruser', password='otherpassword')
+        Content.objects.create(title='Text', file='c.txt', author=self.user)
+        Content.objects.create(title='Image', file='c.png', author=self.user)
+        Content.objects.create(title='Other', file='c.txt', author=other_user)
+        Task.objects.all().delete()
+
+        self.pdf_guideline.file_types = ['.txt']
+        self.pdf_guideline.save()
+        self.pdf_guideline.author_groups.add(self.group)
+        for queued_task in Task.objects.filter(name='core.backfill_guideline_reviews'):
+            run_task(queued_task)
+
+        self.assertEqual(
+            list(
+                ReviewItem.objects.filter(guideline=self.pdf_guideline)
+                .values_list('content__title', flat=True)
+            ),
+            ['Text'],
+        )
+        self.assertEqual(Content.objects.get(title='Text').total_reviews, 2)
+
+    def test_import_limited_to_file_types(self):
+        """
+        Test case for importing files with the review items of their file type only.
+        """
+        with tempfile.TemporaryDirectory() as source:
+            for name in ('a.txt', 'b.pdf'):
+                with open(os.path.join(source, name), 'wb') as source_file:
+                    source_file.write(b'imported')
+            call_command('import_contents', source, author='testuser', stdout=StringIO())
+
+        self.assertEqual(Content.objects.get(title='a').total_reviews, 1)
+        self.assertEqual(
+            self.reviewed_guideline_ids(Content.objects.get(title='b')),
+            {self.guideline.pk, self.pdf_guideline.pk},
+        )
+
+    def test_guideline_created_with_groups_backfilled_once(self):
+        """
+        Test case for queueing a single backfill for a guideline created with author groups.
+        """
+        Task.objects.all().delete()
+        response = self.client.post(reverse('guideline-list'), {
+            'title': 'Guideline 3', 'description': 'Text', 'author_groups': [self.group.pk],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Task.objects.filter(name='core.backfill_guideline_reviews').count(), 1)
+
+    def test_serializer_validates_scope(self):
+        """
+        Test case for normalizing file types and rejecting invalid scopes.
+        """
+        response = self.client.post(reverse('guideline-list'), {
+            'title': 'Guideline 3',
+            'description': 'Text',
+            'file_types': ['PDF', '.docx', 'pdf'],
+            'author_groups': [self.group.pk],
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['file_types'], ['.pdf', '.docx'])
+        self.assertEqual(response.data['author_groups'], [self.group.pk])
+
+        response = self.client.post(reverse('guideline-list'), {
+            'title': 'Guideline 4', 'description': 'Text', 'file_types': ['exe'],
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.patch(
+            reverse('guideline-detail', args=[self.guideline.pk]),
+            {'active_from': '2026-02-01T00:00:00Z', 'active_until': '2026-01-01T00:00:00Z'},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,39 @@
+import hashlib
+
+from django.core.files.uploadhandler import (MemoryFileUploadHandler,
+                                             TemporaryFileUploadHandler)
+
+
+class HashingUploadHandlerMixin:
+    """
+    Computes the SHA-256 digest of an uploaded file while Django streams it in,
+    exposing it as `sha256` on the resulting UploadedFile.
+    """
+    def new_file(self, *args, **kwargs):
+        # Set before delegating: MemoryFileUploadHandler.new_file() raises
+        # StopFutureHandlers once it takes over the upload.
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        if getattr(self, 'activated', True):
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded_file = super().file_complete(file_size)
+        if uploaded_file is not None:
+            uploaded_file.sha256 = self.sha256.hexdigest()
+        return uploaded_file
+
+
+class HashingMemoryFileUploadHandler(HashingUploadHandlerMixin, MemoryFileUploadHandler):
+    """
+    MemoryFileUploadHandler that also hashes the upload.
+    """
+
+
+class HashingTemporaryFileUploadHandler(HashingUploadHandlerMixin, TemporaryFileUploadHandler):
+    """
+    TemporaryFileUploadHandler that also hashes the upload.
+    """
@@ -1,9 +1,18 @@
 from django.urls import include, path
 from rest_framework import routers
 
-from core.views import (ContentDetailView, ContentListView,
-                        ContentReviewStatusView, ContentReviewUpdateView,
-                        ContentUploadView, GuidelineViewSet)
+from core.async_views import (AsyncContentDetailView, AsyncContentListView,
+                               AsyncContentReviewStatusView,
+                               AsyncContentVersionDownloadView)
+from core.metrics import metrics_view
+from core.views import (ContentDetailView, ContentExportView,
+                        ContentListView, ContentReviewStatusView,
+                        ContentReviewUpdateView, ContentUploadView,
+                        ContentVersionDownloadView, ContentVersionListView,
+                        GuidelineViewSet, ReviewItemBulkUpdateView,
+                        ReviewQueueView, ReviewStatsView, SearchView,
+                        UploadSessionCompleteView, UploadSessionCreateView,
+                        UploadSessionView)
 
 router = routers.SimpleRouter()
 router.register(r'guidelines', GuidelineViewSet)
@@ -11,8 +20,27 @@ router.register(r'guidelines', GuidelineViewSet)
 urlpatterns = [
     path('v1/', include(router.urls)),
     path('v1/contents/', ContentListView.as_view(), name='content-list'),
+    path('v1/contents/export/', ContentExportView.as_view(), name='content-export'),
     path('v1/contents/upload/', ContentUploadView.as_view(), name='content-upload'),
     path('v1/contents/<int:pk>/', ContentDetailView.as_view(), name='content-detail'),
+    path(
+        'v1/contents/<int:content_id>/versions/',
+        ContentVersionListView.as_view(),
+        name='content-version-list',
+    ),
+    path(
+        'v1/contents/<int:content_id>/versions/<int:version>/download/',
+        ContentVersionDownloadView.as_view(),
+        name='content-version-download',
+    ),
+    path('v1/search/', SearchView.as_view(), name='search'),
+    path('v1/uploads/', UploadSessionCreateView.as_view(), name='upload-create'),
+    path('v1/uploads/<uuid:upload_id>/', UploadSessionView.as_view(), name='upload-detail'),
+    path(
+        'v1/uploads/<uuid:upload_id>/complete/',
+        UploadSessionCompleteView.as_view(),
+        name='upload-complete',
+    ),
     path(
         'v1/contents/<int:content_id>/review-status/',
         ContentReviewStatusView.as_view(),
@@ -23,4 +51,34 @@ urlpatterns = [
         ContentReviewUpdateView.as_view(),
         name='content-review-update',
     ),
+    path(
+        'v1/contents/<int:content_id>/review/bulk/',
+        ReviewItemBulkUpdateView.as_view(),
+        name='content-review-bulk-update',
+    ),
+    path(
+        'v1/reviews/bulk/',
+        ReviewItemBulkUpdateView.as_view(),
+        name='review-bulk-update',
+    ),
+    path('v1/reviews/queue/', ReviewQueueView.as_view(), name='review-queue'),
+    path('v1/reviews/stats/', ReviewStatsView.as_view(), name='review-stats'),
+    path('internal/metrics/', metrics_view, name='metrics'),
+    # Native async variants of the read-heavy views, served best under ASGI.
+    path('v1/async/contents/', AsyncContentListView.as_view(), name='async-content-list'),
+    path(
+        'v1/async/contents/<int:pk>/',
+        AsyncContentDetailView.as_view(),
+        name='async-content-detail',
+    ),
+    path(
+        'v1/async/contents/<int:content_id>/review-status/',
+        AsyncContentReviewStatusView.as_view(),
+        name='async-content-review-status',
+    ),
+    path(
+        'v1/async/contents/<int:content_id>/versions/<int:version>/download/',
+        AsyncContentVersionDownloadView.as_view(),
+        name='async-content-version-download',
+    ),
 ]
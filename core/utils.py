@@ -1,6 +1,8 @@
 import os
 from uuid import uuid4
 
+from core.constants import ALLOWED_EXTENSIONS
+
 
 def unique_file_name(instance, filename):
     """
@@ -14,3 +16,27 @@ def unique_file_name(instance, filename):
     ext = filename.split('.')[-1]
     filename = f"{uuid4().hex}.{ext}"
     return os.path.join('uploads/', filename)
+
+
+def delta_file_name(instance, filename):
+    """
+    Generates a unique filename for a stored revision delta.
+    Args:
+        instance: The instance of the model.
+        filename: The original filename.
+    Returns:
+        A string representing the unique filename.
+    """
+    return os.path.join('deltas/', f"{uuid4().hex}.delta")
+
+
+def has_allowed_extension(filename):
+    """
+    Checks whether the given filename has one of the allowed extensions.
+    Args:
+        filename: The name of the uploaded file.
+    Returns:
+        True if the extension is allowed, False otherwise.
+    """
+    _, extension = os.path.splitext(filename)
+    return extension.lower() in ALLOWED_EXTENSIONS
@@ -0,0 +1,161 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+from core.cache import invalidate_content_responses
+from core.delta import apply_delta, make_delta
+from core.models import Content, ContentVersion
+from core.storage import ContentAddressedStorage, release_file, retain_file
+from core.taskqueue import enqueue
+
+# Revisions of these file types are kept as binary deltas against the next
+# revision when that is substantially smaller than the full file.
+DELTA_EXTENSIONS = ('.txt', '.docx')
+
+
+def record_version(content):
+    """
+    Records the current file of a Content as its newest ContentVersion and
+    queues the compaction of the previous revision into a delta.
+    Args:
+        content: The Content whose file was just created or replaced.
+    Returns:
+        The created ContentVersion.
+    """
+    storage = content.file.storage
+    size, digest = _measure(storage, content.file.name)
+    previous = content.versions.order_by('-version').first()
+
+    if (
+        previous is not None
+        and previous.file
+        and digest
+        and previous.digest == digest
+        and previous.file.name != content.file.name
+    ):
+        # The new upload is byte-identical to the previous revision: point the
+        # content at the stored copy instead of keeping a second one.
+        duplicate_name = content.file.name
+        Content.objects.filter(pk=content.pk).update(file=previous.file.name)
+        content.file.name = previous.file.name
+        invalidate_content_responses(content.pk)
+        retain_file(storage, previous.file.name)
+        _discard(storage, duplicate_name)
+
+    version = ContentVersion.objects.create(
+        content=content,
+        version=content.version,
+        file=content.file.name,
+        size=size,
+        digest=digest,
+    )
+    retain_file(storage, version.file.name)
+
+    if previous is not None:
+        schedule_compaction(previous, version)
+    return version
+
+
+def schedule_compaction(version, newer_version):
+    """
+    Queues the compaction of a revision against the next one. Building a
+    delta of a large file takes seconds, so it never runs in the request.
+    """
+    enqueue(
+        'core.compact_content_version',
+        version_id=version.pk,
+        newer_version_id=newer_version.pk,
+    )
+
+
+def compact_version(version, newer_version):
+    """
+    Replaces the stored file of a revision with a delta against the next
+    revision when the file type supports it and the delta is small enough.
+    """
+    if not version.file or version.file.name == newer_version.file.name:
+        return
+
+    _, extension = os.path.splitext(version.file.name)
+    if extension.lower() not in DELTA_EXTENSIONS:
+        return
+
+    sizes = (version.size, newer_version.size)
+    if None in sizes or max(sizes) > settings.VERSION_DELTA_MAX_SIZE:
+        return
+
+    # The next revision may itself have been compacted in the meantime.
+    delta = make_delta(read_version(newer_version), _read(version.file))
+    if len(delta) > version.size * settings.VERSION_DELTA_MAX_RATIO:
+        return
+
+    storage = version.file.storage
+    previous_name = version.file.name
+    version.delta.save(f'{version.pk}.delta', ContentFile(delta), save=False)
+    version.file = ''
+    version.save(update_fields=['file', 'delta'])
+    _discard(storage, previous_name)
+
+
+def read_version(version):
+    """
+    Returns the bytes of a revision, replaying deltas from the nearest newer
+    revision that is stored in full.
+    """
+    deltas = []
+    if not version.file:
+        newer_versions = version.content.versions.filter(
+            version__gt=version.version
+        ).order_by('version')
+        deltas.append(version.delta)
+        for newer_version in newer_versions:
+            if newer_version.file:
+                version = newer_version
+                break
+            deltas.append(newer_version.delta)
+
+    data = _read(version.file)
+    for delta in reversed(deltas):
+        data = apply_delta(data, _read(delta))
+    return data
+
+
+def _measure(storage, name):
+    """
+    Returns the size and SHA-256 digest of a stored file, or (None, '') when
+    the file is missing.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with storage.open(name, 'rb') as stored_file:
+            for chunk in stored_file.chunks():
+                digest.update(chunk)
+                size += len(chunk)
+    except OSError:
+        return None, ''
+    return size, digest.hexdigest()
+
+
+def _read(field_file):
+    """
+    Returns the full contents of a stored file.
+    """
+    with field_file.open('rb') as stored_file:
+        return stored_file.read()
+
+
+def _discard(storage, name):
+    """
+    Drops a stored file that a revision no longer needs. Content-addressed
+    blobs are released; plain files are deleted once nothing refers to them.
+    """
+    if isinstance(storage, ContentAddressedStorage):
+        release_file(storage, name)
+    elif not (
+        ContentVersion.objects.filter(file=name).exists()
+        or Content.objects.filter(file=name).exists()
+    ):
+        storage.delete(name)
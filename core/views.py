@@ -1,23 +1,83 @@
-from django.db import transaction
+import hashlib
+import os
+import shutil
+import uuid
+
+from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.http import parse_etags
 from rest_framework import generics, status, viewsets
 from rest_framework.parsers import FileUploadParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core.models import Content, Guideline, ReviewItem
-from core.serializers import (ContentSerializer, GuidelineSerializer,
-                              ReviewItemSerializer)
+from core.cache import (cache_response, guideline_map,
+                        invalidate_content_responses)
+from core.export import EXPORT_FORMATS, iter_export
+from core.extraction import schedule_extraction
+from core.models import (Content, ContentVersion, Guideline, ReviewItem,
+                         UploadSession)
+from core.pagination import CreatedAtCursorPagination
+from core.prescreen import schedule_prescreen
+from core.reviews import claim_review_items, release_review_items
+from core.search import (search_contents, search_guidelines,
+                         update_content_search_vectors)
+from core.serializers import (ClaimedReviewItemSerializer, ContentSerializer,
+                              ContentVersionSerializer, GuidelineSerializer,
+                              ReviewItemBulkUpdateSerializer,
+                              ReviewItemSerializer, ReviewQueueSerializer,
+                              ReviewStatsSerializer,
+                              SearchQuerySerializer, SearchResultSerializer,
+                              UploadCompleteSerializer,
+                              UploadSessionSerializer)
+from core.stats import STATS_DIMENSIONS, review_stats
+from core.storage import discard_unsaved_file, release_file
+from core.versioning import read_version, record_version
+
+DUPLICATE_TITLE_MESSAGE = (
+    'Content with the same title already exists. '
+    'Please choose a unique title or update existing content.'
+)
+CLAIMED_REVIEW_ITEM_MESSAGE = 'Review item is claimed by another reviewer.'
+PRECONDITION_FAILED_MESSAGE = (
+    'The resource was modified by another request. Fetch it again and retry.'
+)
+
+
+def _precondition_failed(request, instance):
+    """
+    Checks the If-Match header of a request against the ETag of an instance.
+    Returns:
+        True if the request carries If-Match and no entity tag matches.
+    """
+    if_match = request.headers.get('If-Match')
+    if not if_match:
+        return False
+    etags = parse_etags(if_match)
+    return '*' not in etags and instance.etag not in etags
 
 
 class GuidelineViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Guideline model. Provides basic CRUD operations via HTTP.
     """
-    queryset = Guideline.objects.all()
+    queryset = Guideline.objects.prefetch_related('author_groups')
     serializer_class = GuidelineSerializer
+    pagination_class = CreatedAtCursorPagination
     http_method_names = ('get', 'patch', 'post', 'put')
 
+    @cache_response(lambda view, *args, **kwargs: ['guidelines'])
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response(lambda view, *args, **kwargs: ['guidelines'])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
 
 class ContentListView(generics.ListAPIView):
     """
@@ -25,6 +85,31 @@ class ContentListView(generics.ListAPIView):
     """
     queryset = Content.objects.all()
     serializer_class = ContentSerializer
+    pagination_class = CreatedAtCursorPagination
+
+
+class ContentExportView(APIView):
+    """
+    API View to stream every Content with its review items as NDJSON or CSV.
+    """
+    def get(self, request):
+        """
+        Streams the export in the format given by the `output` query parameter.
+        """
+        export_format = request.query_params.get('output', 'ndjson')
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': f"Unsupported export format '{export_format}'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        response = StreamingHttpResponse(
+            iter_export(export_format), content_type=EXPORT_FORMATS[export_format]
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="contents.{export_format}"'
+        )
+        return response
 
 
 class ContentUploadView(generics.CreateAPIView):
@@ -42,21 +127,21 @@ class ContentUploadView(generics.CreateAPIView):
         user = request.user
 
         if serializer.is_valid():
-            # Check if a content with the same title already exists for the user
-            existing_content = Content.objects.filter(
-                author=user, title=request.data['title']
-            )
-            if existing_content.exists():
-                error_message = (
-                    'Content with the same title already exists. '
-                    'Please choose a unique title or update existing content.'
-                )
+            upload = serializer.validated_data.pop('file')
+            content = Content(author=user, **serializer.validated_data)
+            # The file is stored first so that it can be dropped again when the
+            # unique (author, title) constraint rejects the row.
+            content.file.save(upload.name, upload, save=False)
+            try:
+                with transaction.atomic():
+                    content.save()
+            except IntegrityError:
+                discard_unsaved_file(content.file.storage, content.file.name)
                 return Response(
-                    {'error': error_message},
+                    {'error': DUPLICATE_TITLE_MESSAGE},
                     status=status.HTTP_409_CONFLICT,
                 )
-            serializer.validated_data['author'] = user
-            self.perform_create(serializer)
+            serializer.instance = content
 
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -69,44 +154,149 @@ class ContentDetailView(generics.RetrieveUpdateAPIView):
     queryset = Content.objects.all()
     serializer_class = ContentSerializer
 
-    def patch(self, request, *args, **kwargs):
+    @cache_response(lambda view, *args, **kwargs: [f"content:{kwargs['pk']}"])
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a Content instance along with its ETag.
+        """
+        content = self.get_object()
+        serializer = self.get_serializer(content)
+        return Response(serializer.data, headers={'ETag': content.etag})
+
+    def update(self, request, *args, **kwargs):
         """
-        Update a Content instance if it belongs to the requesting user.
+        Update a Content instance if it belongs to the requesting user. The
+        changes are written with a single UPDATE which, when the request
+        carries If-Match, only applies if the content is still unchanged.
         """
+        partial = kwargs.pop('partial', False)
         content = self.get_object()
         if content.author != request.user:
             return Response(
                 {'error': 'You can only update content you own.'},
                 status=status.HTTP_403_FORBIDDEN,
             )
+        if _precondition_failed(request, content):
+            return Response(
+                {'error': PRECONDITION_FAILED_MESSAGE},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
 
-        updated_content = request.data.get('file')
-        serializer = self.get_serializer(content, data=request.data, partial=True)
+        serializer = self.get_serializer(content, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
 
+        changes = dict(serializer.validated_data)
+        previous_file = content.file.name
+        updated_content = changes.pop('file', None)
+        if updated_content is not None:
+            content.file.save(updated_content.name, updated_content, save=False)
+            changes['file'] = content.file.name
+            changes['version'] = F('version') + 1
+        changes['updated_at'] = timezone.now()
+
+        contents = Content.objects.filter(pk=content.pk)
+        if 'If-Match' in request.headers:
+            contents = contents.filter(version=content.version, updated_at=content.updated_at)
+        try:
+            with transaction.atomic():
+                updated = contents.update(**changes)
+        except IntegrityError:
+            updated = None
+        if not updated:
+            if updated_content is not None:
+                discard_unsaved_file(content.file.storage, content.file.name)
+            if updated is None:
+                return Response(
+                    {'error': DUPLICATE_TITLE_MESSAGE},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            return Response(
+                {'error': PRECONDITION_FAILED_MESSAGE},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+
+        for field, value in changes.items():
+            if field != 'version':
+                setattr(content, field, value)
+        invalidate_content_responses(content.pk)
+        if 'title' in changes:
+            update_content_search_vectors(contents)
         if updated_content is not None:
-            serializer.validated_data['version'] = content.version + 1
+            content.refresh_from_db(fields=['version'])
+            record_version(content)
+            schedule_extraction(content)
+            schedule_prescreen(content)
+            if content.file.name != previous_file:
+                release_file(content.file.storage, previous_file)
+
+        return Response(self.get_serializer(content).data, headers={'ETag': content.etag})
+
 
-        self.perform_update(serializer)
+class ContentVersionListView(generics.ListAPIView):
+    """
+    ListView for the revision history of a specific content.
+    """
+    serializer_class = ContentVersionSerializer
+
+    def get_queryset(self):
+        return ContentVersion.objects.filter(
+            content_id=self.kwargs['content_id']
+        ).order_by('-version')
+
+
+class ContentVersionDownloadView(APIView):
+    """
+    API View to download the file of a specific revision of a content.
+    """
+    def get(self, request, content_id, version):
+        """
+        Returns the file of the revision, rebuilt from deltas when needed.
+        """
+        content_version = (
+            ContentVersion.objects.select_related('content')
+            .filter(content_id=content_id, version=version)
+            .first()
+        )
+        if content_version is None:
+            return Response(
+                {'error': 'No Content version matches the given query.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-        return Response(serializer.data)
+        _, extension = os.path.splitext(content_version.content.file.name)
+        filename = f'{content_version.content.title}-v{version}{extension}'
+        response = HttpResponse(
+            read_version(content_version), content_type='application/octet-stream'
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
 
 
 class ContentReviewStatusView(APIView):
     """
     API View to check the status of review items for a specific content.
     """
+    @cache_response(
+        lambda view, content_id: [f'content:{content_id}', 'guidelines']
+    )
     def get(self, request, content_id):
         """
         Retrieves status of review items for a specific content.
         """
-        try:
-            content = Content.objects.get(pk=content_id)
-        except Content.DoesNotExist:
+        if not Content.objects.filter(pk=content_id).exists():
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        reviews = ReviewItem.objects.filter(content=content)
-        review_items = ReviewItemSerializer(reviews, many=True).data
+        reviews = (
+            ReviewItem.objects.filter(content_id=content_id)
+            .select_related('reviewer')
+            .order_by('pk')
+        )
+        review_items = ReviewItemSerializer(
+            reviews, many=True, context={'guideline_map': guideline_map.get()}
+        ).data
 
         return Response(review_items)
 
@@ -140,14 +330,475 @@ class ContentReviewUpdateView(generics.UpdateAPIView):
                 {'error': 'No Review item matches the given query.'},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        if review_item.is_claimed_by_other(request.user):
+            return Response(
+                {'error': CLAIMED_REVIEW_ITEM_MESSAGE},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if _precondition_failed(request, review_item):
+            return Response(
+                {'error': PRECONDITION_FAILED_MESSAGE},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
 
+        previous_status = review_item.status
         serializer = self.get_serializer(review_item, data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        self.perform_update(serializer)
+        now = timezone.now()
+        changes = {
+            **serializer.validated_data,
+            'reviewer': request.user,
+            'reviewed_at': now,
+            'claimed_by': None,
+            'claim_expires_at': None,
+        }
+        # The claim and, with If-Match, the revision are checked again by the
+        # UPDATE itself so that a concurrent write between read and write wins.
+        review_items = ReviewItem.objects.filter(pk=review_item.pk).filter(
+            Q(claim_expires_at__isnull=True)
+            | Q(claim_expires_at__lte=now)
+            | Q(claimed_by=request.user)
+        )
+        if 'If-Match' in request.headers:
+            review_items = review_items.filter(revision=review_item.revision)
+        if not review_items.update(**changes, revision=F('revision') + 1):
+            current = ReviewItem.objects.get(pk=review_item.pk)
+            if current.is_claimed_by_other(request.user):
+                return Response(
+                    {'error': CLAIMED_REVIEW_ITEM_MESSAGE},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            return Response(
+                {'error': PRECONDITION_FAILED_MESSAGE},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+
+        for field, value in changes.items():
+            setattr(review_item, field, value)
+        if 'If-Match' in request.headers:
+            review_item.revision += 1
+        else:
+            review_item.refresh_from_db(fields=['revision'])
+        if review_item.status != previous_status:
+            Content.objects.filter(pk=content.pk).refresh_review_counts()
+        invalidate_content_responses(content.pk)
+
+        return Response(self.get_serializer(review_item).data, headers={'ETag': review_item.etag})
+
+
+class ReviewItemBulkUpdateView(APIView):
+    """
+    API View to update the status of many ReviewItems in one request, either
+    for a specific content or across contents.
+    """
+    @transaction.atomic
+    def put(self, request, content_id=None):
+        """
+        Applies a list of `{review_item_id, status}` updates and returns the
+        result of each entry.
+        """
+        serializer = ReviewItemBulkUpdateSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        updates = {
+            entry['review_item_id']: entry['status']
+            for entry in serializer.validated_data
+        }
+        if len(updates) != len(serializer.validated_data):
+            return Response(
+                {'error': 'Each review item can only be submitted once.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(updates) > settings.BULK_REVIEW_MAX_ITEMS:
+            return Response(
+                {
+                    'error': (
+                        'A bulk review can update at most '
+                        f'{settings.BULK_REVIEW_MAX_ITEMS} review items.'
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        review_items = ReviewItem.objects.select_for_update().filter(pk__in=updates)
+        if content_id is not None:
+            if not Content.objects.filter(pk=content_id).exists():
+                return Response(
+                    {'error': 'No Content matches the given query.'},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            review_items = review_items.filter(content_id=content_id)
+
+        # Rows are locked in primary key order so concurrent bulk reviews
+        # cannot deadlock each other.
+        review_items = {
+            review_item.pk: review_item for review_item in review_items.order_by('pk')
+        }
+        claimed_ids = {
+            review_item.pk
+            for review_item in review_items.values()
+            if review_item.is_claimed_by_other(request.user)
+        }
+        for review_item_id in claimed_ids:
+            del review_items[review_item_id]
+
+        reviewed_at = timezone.now()
+        changed_content_ids = set()
+        for review_item in review_items.values():
+            new_status = updates[review_item.pk]
+            if review_item.status != new_status:
+                changed_content_ids.add(review_item.content_id)
+            review_item.status = new_status
+            review_item.reviewer = request.user
+            review_item.reviewed_at = reviewed_at
+            review_item.claimed_by = review_item.claim_expires_at = None
+            review_item.revision += 1
+
+        ReviewItem.objects.bulk_update(
+            review_items.values(),
+            ('status', 'reviewer', 'reviewed_at', 'claimed_by', 'claim_expires_at', 'revision'),
+        )
+        if changed_content_ids:
+            Content.objects.filter(pk__in=changed_content_ids).refresh_review_counts()
+        invalidate_content_responses(
+            *{review_item.content_id for review_item in review_items.values()}
+        )
+
+        results = []
+        for review_item_id, new_status in updates.items():
+            if review_item_id in review_items:
+                results.append(
+                    {'review_item_id': review_item_id, 'status': new_status, 'updated': True}
+                )
+            elif review_item_id in claimed_ids:
+                results.append(
+                    {
+                        'review_item_id': review_item_id,
+                        'updated': False,
+                        'error': CLAIMED_REVIEW_ITEM_MESSAGE,
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        'review_item_id': review_item_id,
+                        'updated': False,
+                        'error': 'No Review item matches the given query.',
+                    }
+                )
+
+        return Response(results)
+
+
+class ReviewQueueView(APIView):
+    """
+    API View to claim the next pending ReviewItems for the requesting reviewer.
+    """
+    def post(self, request):
+        """
+        Claims up to `limit` pending review items, optionally of one `guideline`,
+        for the requesting reviewer until the claim expires.
+        """
+        serializer = ReviewQueueSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        review_items = claim_review_items(
+            request.user,
+            serializer.validated_data['limit'],
+            guideline_id=serializer.validated_data.get('guideline'),
+        )
+        return Response(
+            ClaimedReviewItemSerializer(
+                review_items, many=True, context={'guideline_map': guideline_map.get()}
+            ).data
+        )
+
+    def delete(self, request):
+        """
+        Releases the review items claimed by the requesting reviewer.
+        """
+        serializer = ReviewQueueSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        released = release_review_items(
+            request.user, guideline_id=serializer.validated_data.get('guideline')
+        )
+        return Response({'released': released})
+
+
+class UploadSessionCreateView(generics.CreateAPIView):
+    """
+    API View to initiate a resumable chunked upload.
+    """
+    serializer_class = UploadSessionSerializer
+
+    def create(self, request, *args, **kwargs):
+        """
+        Create an UploadSession and its empty temporary file.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # Fail before the file is transferred; the unique (author, title)
+        # constraint has the final say when the upload completes.
+        title = serializer.validated_data['title']
+        if Content.objects.filter(author=request.user, title=title).exists():
+            return Response(
+                {'error': DUPLICATE_TITLE_MESSAGE},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        upload_session = serializer.save(user=request.user)
+        os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+        open(upload_session.temporary_path, 'wb').close()
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+def _finalizing_conflict():
+    """
+    Builds the response to a request on an upload that is being finalized.
+    """
+    return Response(
+        {'error': 'Upload is being finalized.'},
+        status=status.HTTP_409_CONFLICT,
+    )
+
+
+def _offset_mismatch(offset):
+    """
+    Builds the response to a chunk that does not continue the upload.
+    """
+    return Response(
+        {'error': 'Upload offset mismatch.', 'offset': offset},
+        status=status.HTTP_409_CONFLICT,
+    )
+
+
+class UploadSessionView(APIView):
+    """
+    API View to inspect, append chunks to, or abort a resumable upload.
+    """
+    def get(self, request, upload_id):
+        """
+        Returns the upload session, including the offset to resume from.
+        """
+        upload_session = UploadSession.objects.filter(pk=upload_id, user=request.user).first()
+        if upload_session is None:
+            return Response(
+                {'error': 'No Upload matches the given query.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(UploadSessionSerializer(upload_session).data)
+
+    def put(self, request, upload_id):
+        """
+        Appends the request body at the offset given by the `Upload-Offset`
+        header. The body is streamed to a staging file outside any transaction,
+        so a slow client holds neither a connection in a transaction nor a row
+        lock; the chunk is then appended and the new offset committed only if
+        no other request moved the offset in the meantime.
+        """
+        upload_session = UploadSession.objects.filter(pk=upload_id, user=request.user).first()
+        if upload_session is None:
+            return Response(
+                {'error': 'No Upload matches the given query.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            offset = int(request.headers['Upload-Offset'])
+        except (KeyError, ValueError):
+            return Response(
+                {'error': 'A numeric Upload-Offset header is required.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if upload_session.is_finalizing:
+            return _finalizing_conflict()
+        if offset != upload_session.offset:
+            return _offset_mismatch(upload_session.offset)
+
+        staging_path = f'{upload_session.temporary_path}.{uuid.uuid4().hex}.chunk'
+        try:
+            stream = request.stream
+            with open(staging_path, 'wb') as staging_file:
+                while stream is not None and (
+                    block := stream.read(settings.CHUNKED_UPLOAD_READ_SIZE)
+                ):
+                    staging_file.write(block)
+                new_offset = offset + staging_file.tell()
+
+            if upload_session.size is not None and new_offset > upload_session.size:
+                return Response(
+                    {'error': 'Chunk exceeds the declared upload size.', 'offset': offset},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            with transaction.atomic():
+                # The conditional UPDATE holds the session row until commit, so
+                # concurrent chunks for the same offset append one at a time
+                # and all but the first are rejected.
+                updated_at = timezone.now()
+                if not UploadSession.objects.filter(
+                    pk=upload_session.pk, offset=offset, is_finalizing=False
+                ).update(offset=new_offset, updated_at=updated_at):
+                    upload_session.refresh_from_db(fields=['offset'])
+                    return _offset_mismatch(upload_session.offset)
+                with open(upload_session.temporary_path, 'r+b') as temporary_file:
+                    temporary_file.seek(offset)
+                    temporary_file.truncate()
+                    with open(staging_path, 'rb') as staging_file:
+                        shutil.copyfileobj(
+                            staging_file, temporary_file, settings.CHUNKED_UPLOAD_READ_SIZE
+                        )
+        finally:
+            try:
+                os.remove(staging_path)
+            except FileNotFoundError:
+                pass
+
+        upload_session.offset = new_offset
+        upload_session.updated_at = updated_at
+        return Response(UploadSessionSerializer(upload_session).data)
+
+    def delete(self, request, upload_id):
+        """
+        Aborts the upload and deletes its temporary file.
+        """
+        upload_session = UploadSession.objects.filter(pk=upload_id, user=request.user).first()
+        if upload_session is None:
+            return Response(
+                {'error': 'No Upload matches the given query.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if upload_session.is_finalizing:
+            return _finalizing_conflict()
+        upload_session.discard()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadSessionCompleteView(APIView):
+    """
+    API View to finalize a resumable upload into a Content.
+    """
+    def post(self, request, upload_id):
+        """
+        Verifies the checksum of the uploaded file and creates the Content,
+        which fans out its review items. The session is marked as finalizing
+        by a conditional UPDATE, so the file is hashed and copied into storage
+        outside any transaction; only the Content insert and the removal of
+        the session run in one.
+        """
+        upload_session = UploadSession.objects.filter(pk=upload_id, user=request.user).first()
+        if upload_session is None:
+            return Response(
+                {'error': 'No Upload matches the given query.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = UploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if upload_session.size is not None and upload_session.offset != upload_session.size:
+            return Response(
+                {'error': 'Upload is incomplete.', 'offset': upload_session.offset},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not UploadSession.objects.filter(
+            pk=upload_session.pk, offset=upload_session.offset, is_finalizing=False
+        ).update(is_finalizing=True, updated_at=timezone.now()):
+            return _finalizing_conflict()
+
+        finalized = False
+        try:
+            digest = hashlib.sha256()
+            with open(upload_session.temporary_path, 'rb') as temporary_file:
+                while block := temporary_file.read(settings.CHUNKED_UPLOAD_READ_SIZE):
+                    digest.update(block)
+            if digest.hexdigest() != serializer.validated_data['sha256'].lower():
+                return Response(
+                    {'error': 'Checksum mismatch.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            content = Content(title=upload_session.title, author=request.user)
+            with open(upload_session.temporary_path, 'rb') as temporary_file:
+                upload = File(temporary_file, name=upload_session.filename)
+                upload.sha256 = digest.hexdigest()
+                content.file.save(upload_session.filename, upload, save=False)
+            try:
+                with transaction.atomic():
+                    content.save()
+                    upload_session.discard()
+            except IntegrityError:
+                discard_unsaved_file(content.file.storage, content.file.name)
+                return Response(
+                    {'error': DUPLICATE_TITLE_MESSAGE},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            finalized = True
+        finally:
+            if not finalized:
+                UploadSession.objects.filter(pk=upload_session.pk).update(is_finalizing=False)
+
+        return Response(
+            ContentSerializer(content, context={'request': request}).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class SearchView(APIView):
+    """
+    API View to search contents and guidelines by their text.
+    """
+    def get(self, request):
+        """
+        Returns the ranked contents and guidelines matching the `q` query parameter.
+        """
+        serializer = SearchQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = serializer.validated_data['q']
+        limit = serializer.validated_data['limit']
+        search_type = serializer.validated_data.get('type')
+
+        results = {}
+        if search_type in (None, 'contents'):
+            results['contents'] = search_contents(query, limit)
+        if search_type in (None, 'guidelines'):
+            results['guidelines'] = search_guidelines(query, limit)
+        return Response(
+            {
+                key: SearchResultSerializer(matches, many=True).data
+                for key, matches in results.items()
+            }
+        )
+
 
-        review_item.reviewer = request.user
-        review_item.reviewed_at = timezone.now()
-        review_item.save()
+class ReviewStatsView(APIView):
+    """
+    API View to retrieve the review counts per guideline, author and day.
+    """
+    def get(self, request):
+        """
+        Returns the pass/fail/pending counts of the dimensions listed in the
+        `group_by` query parameter, all of them by default.
+        """
+        group_by = request.query_params.get('group_by')
+        dimensions = group_by.split(',') if group_by else list(STATS_DIMENSIONS)
+        unsupported = [dimension for dimension in dimensions if dimension not in STATS_DIMENSIONS]
+        if unsupported:
+            return Response(
+                {'error': f"Unsupported group_by '{unsupported[0]}'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        return Response(serializer.data)
+        stats = review_stats(dimensions)
+        data = {
+            dimension: ReviewStatsSerializer(stats[dimension], many=True).data
+            for dimension in dimensions
+        }
+        if 'refreshed_at' in stats:
+            data['refreshed_at'] = stats['refreshed_at']
+        return Response(data)